@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compact Storage Benchmark
+=========================
+
+Compares the memory InMemoryStorage retains per playbook when it keeps
+Pydantic Playbook models (with their cached search views) against compact
+PlaybookRecords (slots, interned tags and authors, integer timestamps),
+and compact records whose content lives in a memory-mapped ContentStore.
+
+Playbooks are generated inside the measurement and the generator's list
+is dropped afterwards, so each mode is charged for exactly what the
+storage keeps alive, as when playbooks are loaded from disk.
+
+Usage:
+    python benchmarks/bench_compact_storage.py [--playbooks 100000] [--content-words 60]
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from corpus import make_corpus
+
+from chuk_mcp_playbook.search.base import IndexedSearchProvider
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+
+
+class NoIndex(IndexedSearchProvider):
+    """Index-backed provider that indexes nothing, isolating the storage's own memory."""
+
+    def add(self, playbook):
+        pass
+
+    def remove(self, title):
+        pass
+
+    def clear(self):
+        pass
+
+    def query_index(self, query, top_k=3, candidates=None):
+        return []
+
+    def score(self, playbook, query):
+        return (False, 0.0)
+
+
+async def measure(
+    args, compact: bool, search_type: SearchType | None, lazy: bool = False
+) -> tuple[float, float]:
+    """Return (retained bytes per playbook, seconds to store)."""
+    gc.collect()
+    tracemalloc.start()
+    search = SearchFactory.create(search_type) if search_type else NoIndex()
+    storage = InMemoryStorage(
+        search_provider=search, compact=compact, content_store=ContentStore() if lazy else None
+    )
+
+    playbooks = make_corpus(
+        args.playbooks, content_words=args.content_words, num_tags=args.num_tags
+    )
+    # The loader derives tags from file names: equal tags are separate strings
+    for playbook in playbooks:
+        playbook.metadata.tags = [f"{tag} ".strip() for tag in playbook.metadata.tags]
+        playbook.metadata.author = " ".join(["Chuk", "AI"])
+
+    start = time.perf_counter()
+    await storage.bulk_add(playbooks)
+    elapsed = time.perf_counter() - start
+    del playbooks
+    gc.collect()
+
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert await storage.count() == args.playbooks
+    return retained / args.playbooks, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--playbooks", type=int, default=100_000)
+    parser.add_argument("--content-words", type=int, default=60)
+    parser.add_argument("--num-tags", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Corpus: {args.playbooks} playbooks x ~{args.content_words} words, {args.num_tags} tags")
+    print(
+        f"{'':<28}{'models B/playbook':>19}{'compact B/playbook':>20}{'lazy B/playbook':>17}{'saved':>8}"
+    )
+    for label, search_type in (
+        ("storage only", None),
+        ("storage + indexed search", SearchType.INDEXED),
+    ):
+        models, _ = asyncio.run(measure(args, compact=False, search_type=search_type))
+        compact, _ = asyncio.run(measure(args, compact=True, search_type=search_type))
+        lazy, _ = asyncio.run(measure(args, compact=True, search_type=search_type, lazy=True))
+        print(
+            f"{label:<28}{models:>19,.0f}{compact:>20,.0f}{lazy:>17,.0f}{1 - lazy / models:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Hybrid Search Benchmark
+=======================
+
+Compares KeywordSearch (full scan) against the index-backed keyword,
+semantic and hybrid providers on a synthetic corpus.
+
+Each query targets one playbook: it is built from the target's title words,
+with some words inflected ("sunsets", "planning") the way users phrase
+questions. Recall@k is the fraction of queries whose target is in the top k.
+
+Usage:
+    python benchmarks/bench_hybrid.py [--playbooks 2000] [--queries 200] [--top-k 3]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+
+from corpus import make_corpus
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.base import IndexedSearchProvider, SearchProvider
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+
+SUFFIXES = ["s", "ing", "ed"]
+
+
+def make_queries(
+    playbooks: list[Playbook], count: int, inflect: float, seed: int = 7
+) -> list[tuple[str, str]]:
+    """Return (query, target title) pairs for playbooks with a unique title word set."""
+    word_sets = [frozenset(p.metadata.title.lower().split()[:3]) for p in playbooks]
+    unique = [p for p, words in zip(playbooks, word_sets) if Counter(word_sets)[words] == 1]
+
+    rng = random.Random(seed)
+    queries = []
+    for playbook in rng.sample(unique, min(count, len(unique))):
+        words = playbook.metadata.title.lower().split()[:3]
+        words = [word + rng.choice(SUFFIXES) if rng.random() < inflect else word for word in words]
+        queries.append((f"how do I {' '.join(words)}", playbook.metadata.title))
+    return queries
+
+
+def measure(
+    search: SearchProvider, playbooks: list[Playbook], queries: list[tuple[str, str]], top_k: int
+) -> tuple[float, float]:
+    """Return (p50 latency in ms, recall@k)."""
+    latencies = []
+    hits = 0
+    for query, target in queries:
+        start = time.perf_counter()
+        if isinstance(search, IndexedSearchProvider):
+            titles = [title for title, _ in search.query_index(query, top_k=top_k)]
+        else:
+            titles = [p.metadata.title for p in search.search(playbooks, query, top_k=top_k)]
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += target in titles
+    return statistics.median(latencies), hits / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--playbooks", type=int, default=2000)
+    parser.add_argument("--content-words", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument(
+        "--inflect", type=float, default=0.5, help="Probability a query word is inflected"
+    )
+    args = parser.parse_args()
+
+    playbooks = make_corpus(args.playbooks, content_words=args.content_words)
+    for playbook in playbooks:
+        playbook.build_search_view()
+    queries = make_queries(playbooks, args.queries, args.inflect)
+
+    providers = {
+        "keyword (scan)": SearchFactory.create(SearchType.KEYWORD),
+        "indexed": SearchFactory.create(SearchType.INDEXED),
+        "semantic": SearchFactory.create(SearchType.SEMANTIC),
+        "hybrid rrf": SearchFactory.create(SearchType.HYBRID),
+        "hybrid weighted": SearchFactory.create(SearchType.HYBRID, fusion="weighted"),
+    }
+
+    print(
+        f"Corpus: {args.playbooks} playbooks x ~{args.content_words} words, {len(queries)} queries"
+    )
+    print(f"{'':<18}{'index build (s)':>17}{'p50 latency (ms)':>18}{f'recall@{args.top_k}':>12}")
+    for name, search in providers.items():
+        build = 0.0
+        if isinstance(search, IndexedSearchProvider):
+            start = time.perf_counter()
+            for playbook in playbooks:
+                search.add(playbook)
+            build = time.perf_counter() - start
+        latency, recall = measure(search, playbooks, queries, args.top_k)
+        print(f"{name:<18}{build:>17.2f}{latency:>18.2f}{recall:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
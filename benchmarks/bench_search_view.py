@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Search View Benchmark
+=====================
+
+Compares keyword scoring that lowercases every field on every query (the
+behaviour before playbooks carried a precomputed search view) against
+scoring from the cached PlaybookSearchView.
+
+Reports per-query latency and the number of bytes copied into lowercased
+strings per query.
+
+Usage:
+    python benchmarks/bench_search_view.py [--playbooks 2000] [--content-words 1000]
+"""
+
+import argparse
+import statistics
+import time
+
+from corpus import make_corpus
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+
+QUERIES = [
+    "How do I get sunset times?",
+    "weather forecast for my trip",
+    "convert meeting time between timezone",
+    "marine tide report",
+]
+
+
+class LegacyKeywordSearch(KeywordSearch):
+    """KeywordSearch as it scored before search views (lowercases per query)."""
+
+    def __init__(self):
+        super().__init__()
+        self.lowercased_bytes = 0
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        keywords = self._extract_keywords(query)
+        total_score = 0.0
+        title_lower = playbook.metadata.title.lower()
+        desc_lower = playbook.metadata.description.lower()
+        content_lower = playbook.content.lower()
+        self.lowercased_bytes += len(title_lower) + len(desc_lower) + len(content_lower)
+
+        for keyword in keywords:
+            word_score = 0.0
+            if keyword in title_lower:
+                word_score += 0.5
+            for tag in playbook.metadata.tags:
+                self.lowercased_bytes += len(tag)
+                if keyword in tag.lower():
+                    word_score += 0.3
+                    break
+            if keyword in desc_lower:
+                word_score += 0.2
+            if keyword in content_lower:
+                word_score += 0.1
+            total_score += word_score
+
+        normalized_score = total_score / len(keywords)
+        return (normalized_score > 0, min(normalized_score, 1.0))
+
+
+def measure(search: KeywordSearch, playbooks: list[Playbook], queries: int) -> float:
+    """Return the median query latency in milliseconds."""
+    latencies = []
+    for i in range(queries):
+        start = time.perf_counter()
+        search.search(playbooks, QUERIES[i % len(QUERIES)], top_k=3)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--playbooks", type=int, default=2000)
+    parser.add_argument("--content-words", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    playbooks = make_corpus(args.playbooks, content_words=args.content_words)
+    for playbook in playbooks:
+        playbook.build_search_view()
+
+    legacy_search = LegacyKeywordSearch()
+    legacy_ms = measure(legacy_search, playbooks, args.queries)
+    legacy_kib = legacy_search.lowercased_bytes / args.queries / 1024
+    cached_ms = measure(KeywordSearch(), playbooks, args.queries)
+
+    print(
+        f"Corpus: {args.playbooks} playbooks x ~{args.content_words} words, {args.queries} queries"
+    )
+    print(f"{'':<20}{'p50 latency (ms)':>18}{'lowercased KiB/query':>23}")
+    print(f"{'per-query lower()':<20}{legacy_ms:>18.2f}{legacy_kib:>23.1f}")
+    print(f"{'search view':<20}{cached_ms:>18.2f}{0.0:>23.1f}")
+    print(f"Speedup: {legacy_ms / cached_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+===============
+
+Measures the search and ingestion hot paths on a synthetic corpus:
+
+- search:  index build time, SearchProvider.search() (scan over a list) and
+           InMemoryStorage.query() latency percentiles for every SearchType
+- tags:    InMemoryStorage.query() latency with any/all tag filters
+- loader:  PlaybookLoader.load_from_directory() throughput (threads, processes)
+- memory:  memory retained and peak allocation (tracemalloc) while storing
+           the corpus with each SearchType, plus the process's peak RSS
+
+Results can be written as JSON and compared against an earlier run, e.g.
+before and after a change:
+
+    python benchmarks/bench_suite.py --json before.json
+    python benchmarks/bench_suite.py --json after.json --compare before.json
+
+Usage:
+    python benchmarks/bench_suite.py [--playbooks 1000] [--queries 50]
+        [--content-words 300] [--vocabulary 2000] [--num-tags 20] [--tag-skew 1.0]
+        [--search-types keyword,indexed,...] [--sections search,tags,loader,memory]
+        [--json PATH] [--compare PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from corpus import make_corpus, write_corpus
+
+from chuk_mcp_playbook.loader import PlaybookLoader
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+
+SECTIONS = ("search", "tags", "loader", "memory")
+
+# Metrics where a higher value is better (everything else is a cost)
+HIGHER_IS_BETTER = ("per_s", "mb_s")
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (milliseconds)."""
+    cuts = (
+        statistics.quantiles(samples, n=100, method="inclusive")
+        if len(samples) > 1
+        else samples * 99
+    )
+    return {
+        "p50_ms": round(cuts[49], 4),
+        "p90_ms": round(cuts[89], 4),
+        "p99_ms": round(cuts[98], 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+    }
+
+
+def time_calls(calls: list[Callable[[], Any]]) -> list[float]:
+    """Run each call once and return their latencies in milliseconds."""
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def time_async_calls(calls: list[Callable[[], Any]]) -> list[float]:
+    """Await each call once and return their latencies in milliseconds."""
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def make_queries(playbooks: list[Playbook], count: int, seed: int = 7) -> list[str]:
+    """Natural-language questions built from the words of random playbooks."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        playbook = rng.choice(playbooks)
+        title_words = playbook.metadata.title.lower().split()[:3]
+        description_words = rng.sample(playbook.metadata.description.split(), 2)
+        words = rng.sample(title_words, 2) + description_words[: rng.randint(0, 2)]
+        queries.append(f"how do I {' '.join(words)}")
+    return queries
+
+
+async def build_storage(search_type: SearchType, playbooks: list[Playbook]) -> tuple[Any, float]:
+    """Store the playbooks with the given search type. Returns (storage, seconds)."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type)
+    )
+    start = time.perf_counter()
+    await storage.bulk_add(playbooks)
+    return storage, time.perf_counter() - start
+
+
+async def bench_search(args, playbooks: list[Playbook], queries: list[str]) -> dict[str, Any]:
+    """Index build time and scan/storage query latency for every search type."""
+    results = {}
+    scan_queries = queries[: args.scan_queries]
+    for search_type in args.search_types:
+        storage, build = await build_storage(search_type, playbooks)
+        provider = SearchFactory.create(search_type)
+
+        scan = time_calls(
+            [
+                lambda query=query: provider.search(playbooks, query, top_k=args.top_k)
+                for query in scan_queries
+            ]
+        )
+        query = await time_async_calls(
+            [lambda query=query: storage.query(query, top_k=args.top_k) for query in queries]
+        )
+        results[search_type.value] = {
+            "build_s": round(build, 4),
+            "search": percentiles(scan),
+            "query": percentiles(query),
+        }
+        print(
+            f"  {search_type.value:<10} build {build:8.3f}s"
+            f"   search p50 {results[search_type.value]['search']['p50_ms']:9.3f}ms"
+            f"   query p50 {results[search_type.value]['query']['p50_ms']:9.3f}"
+            f" p99 {results[search_type.value]['query']['p99_ms']:9.3f}ms"
+        )
+    return results
+
+
+async def bench_tags(args, playbooks: list[Playbook], queries: list[str]) -> dict[str, Any]:
+    """InMemoryStorage.query() latency with tag filters."""
+    counts: dict[str, int] = {}
+    for playbook in playbooks:
+        for tag in playbook.metadata.tags:
+            counts[tag] = counts.get(tag, 0) + 1
+    by_frequency = sorted(counts, key=lambda tag: (-counts[tag], tag))
+    common, second, rare = by_frequency[0], by_frequency[1], by_frequency[-1]
+
+    filters = {
+        "none": (None, False),
+        "common": ([common], False),
+        "rare": ([rare], False),
+        "any_of_2": ([common, rare], False),
+        "all_of_2": ([common, second], True),
+    }
+
+    results = {}
+    for search_type in args.tag_search_types:
+        storage, _ = await build_storage(search_type, playbooks)
+        results[search_type.value] = {}
+        for name, (tags, match_all) in filters.items():
+            latencies = await time_async_calls(
+                [
+                    lambda query=query: storage.query(
+                        query, top_k=args.top_k, tags=tags, match_all_tags=match_all
+                    )
+                    for query in queries
+                ]
+            )
+            results[search_type.value][name] = percentiles(latencies)
+        row = "  ".join(
+            f"{name} {stats['p50_ms']:.3f}" for name, stats in results[search_type.value].items()
+        )
+        print(f"  {search_type.value:<10} p50 ms: {row}")
+    return results
+
+
+async def bench_loader(args, playbooks: list[Playbook]) -> dict[str, Any]:
+    """load_from_directory() throughput from markdown files on disk."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="playbook-bench-") as tmp:
+        paths = write_corpus(playbooks, Path(tmp))
+        total_mb = sum(path.stat().st_size for path in paths) / 1024 / 1024
+
+        for mode, use_processes in (("threads", False), ("processes", True)):
+            service = PlaybookService(StorageFactory.create(StorageType.MEMORY))
+            loader = PlaybookLoader(service)
+            start = time.perf_counter()
+            loaded = await loader.load_from_directory(
+                Path(tmp), workers=args.workers, use_processes=use_processes
+            )
+            elapsed = time.perf_counter() - start
+            results[mode] = {
+                "seconds": round(elapsed, 4),
+                "playbooks": loaded,
+                "playbooks_per_s": round(loaded / elapsed, 1),
+                "mb_s": round(total_mb / elapsed, 2),
+            }
+            print(
+                f"  {mode:<10} {loaded} files ({total_mb:.1f} MB) in {elapsed:.3f}s"
+                f" = {loaded / elapsed:,.0f} playbooks/s"
+            )
+    return results
+
+
+async def bench_memory(args) -> dict[str, Any]:
+    """Memory retained by storing a fresh copy of the corpus with each search type."""
+    results = {}
+    for search_type in args.search_types:
+        # A fresh corpus so that cached search views are built (and counted) again
+        playbooks = corpus(args)
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        storage, _ = await build_storage(search_type, playbooks)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        retained = (current - baseline) / 1024 / 1024
+        results[search_type.value] = {
+            "retained_mb": round(retained, 2),
+            "peak_mb": round((peak - baseline) / 1024 / 1024, 2),
+            "bytes_per_playbook": round((current - baseline) / len(playbooks)),
+        }
+        print(
+            f"  {search_type.value:<10} retained {retained:8.1f} MB"
+            f"   peak {results[search_type.value]['peak_mb']:8.1f} MB"
+            f"   {results[search_type.value]['bytes_per_playbook']:>9,} B/playbook"
+        )
+        del storage
+    return results
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+
+
+def corpus(args) -> list[Playbook]:
+    """Generate the configured corpus."""
+    return make_corpus(
+        args.playbooks,
+        content_words=args.content_words,
+        vocabulary_size=args.vocabulary,
+        num_tags=args.num_tags,
+        tag_skew=args.tag_skew,
+    )
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Flatten nested results into {"section.name.metric": value}."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict[str, Any], baseline_path: Path, threshold: float) -> None:
+    """Print metrics that changed by more than threshold relative to a baseline run."""
+    baseline = json.loads(baseline_path.read_text())
+    before = flatten(baseline["results"])
+    after = flatten(current["results"])
+
+    corpus_keys = ("playbooks", "content_words", "vocabulary", "num_tags", "tag_skew", "queries")
+    differing = [
+        key
+        for key in corpus_keys
+        if baseline["meta"]["config"].get(key) != current["meta"]["config"].get(key)
+    ]
+    if differing:
+        print(f"\nWarning: corpus settings differ from the baseline ({', '.join(differing)})")
+
+    print(
+        f"\nChanges vs {baseline_path} (version {baseline['meta'].get('version')}), over {threshold:.0%}:"
+    )
+    changed = 0
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        if not old or name.endswith(".playbooks"):
+            continue
+        ratio = new / old
+        if abs(ratio - 1) < threshold:
+            continue
+        better = ratio > 1 if name.endswith(HIGHER_IS_BETTER) else ratio < 1
+        print(f"  {'+' if better else '-'} {name:<45} {old:>12g} -> {new:>12g}  ({ratio:.2f}x)")
+        changed += 1
+    if not changed:
+        print("  (none)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--playbooks", type=int, default=1000)
+    parser.add_argument("--content-words", type=int, default=300)
+    parser.add_argument("--vocabulary", type=int, default=2000, help="Distinct words in the corpus")
+    parser.add_argument("--num-tags", type=int, default=20, help="Distinct tags in the corpus")
+    parser.add_argument(
+        "--tag-skew", type=float, default=1.0, help="Zipf exponent of tag frequencies"
+    )
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument(
+        "--scan-queries", type=int, default=10, help="Queries timed for SearchProvider.search()"
+    )
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=8, help="Loader workers")
+    parser.add_argument(
+        "--search-types",
+        default=",".join(t.value for t in SearchType),
+        help="Comma-separated SearchType values",
+    )
+    parser.add_argument(
+        "--tag-search-types", default="keyword,indexed,bm25", help="SearchTypes for tag queries"
+    )
+    parser.add_argument(
+        "--sections", default=",".join(SECTIONS), help="Comma-separated sections to run"
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Relative change reported by --compare"
+    )
+    args = parser.parse_args()
+
+    args.search_types = [SearchType(value) for value in args.search_types.split(",") if value]
+    args.tag_search_types = [
+        SearchType(value) for value in args.tag_search_types.split(",") if value
+    ]
+    args.sections = [section for section in args.sections.split(",") if section]
+    unknown = set(args.sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f"unknown sections: {', '.join(sorted(unknown))}")
+    return args
+
+
+async def run(args) -> dict[str, Any]:
+    playbooks = corpus(args)
+    queries = make_queries(playbooks, args.queries)
+    print(
+        f"Corpus: {args.playbooks} playbooks x ~{args.content_words} words, vocabulary {args.vocabulary}, "
+        f"{args.num_tags} tags (skew {args.tag_skew}), {len(queries)} queries"
+    )
+
+    results: dict[str, Any] = {}
+    if "search" in args.sections:
+        print("\nSearch (build, SearchProvider.search scan, InMemoryStorage.query):")
+        results["search"] = await bench_search(args, playbooks, queries)
+    if "tags" in args.sections:
+        print("\nTag-filtered InMemoryStorage.query:")
+        results["tags"] = await bench_tags(args, playbooks, queries)
+    if "loader" in args.sections:
+        print("\nPlaybookLoader.load_from_directory:")
+        results["loader"] = await bench_loader(args, playbooks)
+    if "memory" in args.sections:
+        print("\nMemory (tracemalloc while storing the corpus):")
+        results["memory"] = await bench_memory(args)
+    results["peak_rss_mb"] = peak_rss_mb()
+    print(f"\nPeak RSS: {results['peak_rss_mb']} MB")
+    return results
+
+
+def main():
+    args = parse_args()
+    results = asyncio.run(run(args))
+
+    try:
+        version = metadata.version("chuk-mcp-playbook")
+    except metadata.PackageNotFoundError:
+        version = None
+
+    report = {
+        "meta": {
+            "version": version,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {
+                key: [t.value for t in value]
+                if key.endswith("search_types")
+                else str(value)
+                if isinstance(value, Path)
+                else value
+                for key, value in vars(args).items()
+            },
+        },
+        "results": results,
+    }
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.json}")
+    if args.compare:
+        compare(report, args.compare, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
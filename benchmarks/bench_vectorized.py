@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Vectorized Keyword Search Benchmark
+===================================
+
+Compares KeywordSearch (a Python scan scoring one playbook at a time)
+against VectorizedKeywordSearch (NumPy over per-field term-by-document
+matrices) and ShardedKeywordSearch (the same matrices split across worker
+processes through shared memory), and checks that all return identical
+results.
+
+Usage:
+    python benchmarks/bench_vectorized.py [--playbooks 100000] [--queries 50] [--top-k 3] [--workers 4]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from corpus import make_corpus
+
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--playbooks", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--content-words", type=int, default=60)
+    parser.add_argument("--vocabulary", type=int, default=2000)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Sharded worker processes (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    playbooks = make_corpus(
+        args.playbooks, content_words=args.content_words, vocabulary_size=args.vocabulary
+    )
+    rng = random.Random(7)
+    queries = [
+        f"how do I {' '.join(rng.choice(playbooks).metadata.title.lower().split()[:2])}"
+        for _ in range(args.queries)
+    ]
+    print(
+        f"Corpus: {args.playbooks} playbooks x ~{args.content_words} words, {args.queries} queries"
+    )
+
+    keyword = SearchFactory.create(SearchType.KEYWORD)
+    for playbook in playbooks:
+        playbook.search_view  # noqa: B018 - built at storage time in the server
+
+    providers = {
+        "vectorized": SearchFactory.create(SearchType.VECTORIZED),
+        "sharded": SearchFactory.create(SearchType.SHARDED, workers=args.workers),
+    }
+    for name, provider in providers.items():
+        start = time.perf_counter()
+        provider.add_many(playbooks)
+        provider.query_index("warm up")
+        print(f"{name} build: {time.perf_counter() - start:.2f}s")
+
+    timings: dict[str, list[float]] = {"keyword scan": [], **{name: [] for name in providers}}
+    for query in queries:
+        start = time.perf_counter()
+        expected = [
+            (p.metadata.title, s)
+            for p, s in keyword.search_with_scores(playbooks, query, top_k=args.top_k)
+        ]
+        timings["keyword scan"].append((time.perf_counter() - start) * 1000)
+
+        for name, provider in providers.items():
+            start = time.perf_counter()
+            results = provider.query_index(query, top_k=args.top_k)
+            timings[name].append((time.perf_counter() - start) * 1000)
+            assert results == expected, (name, query, results, expected)
+
+    print(f"{'provider':<16}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, samples in timings.items():
+        samples.sort()
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        print(f"{name:<16}{statistics.median(samples):>10.2f}{p99:>10.2f}")
+    print("Results identical for every query")
+    providers["sharded"].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Synthetic playbook corpus for benchmarks."""
+
+import random
+import string
+from pathlib import Path
+from typing import Optional
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+
+VOCABULARY = [
+    "weather",
+    "forecast",
+    "sunset",
+    "sunrise",
+    "time",
+    "timezone",
+    "convert",
+    "location",
+    "geocode",
+    "temperature",
+    "rain",
+    "wind",
+    "humidity",
+    "alert",
+    "schedule",
+    "meeting",
+    "calendar",
+    "diagram",
+    "flowchart",
+    "sequence",
+    "profile",
+    "network",
+    "post",
+    "comment",
+    "search",
+    "report",
+    "history",
+    "compare",
+    "trip",
+    "plan",
+    "marine",
+    "tide",
+    "air",
+    "quality",
+    "pollen",
+    "server",
+    "tool",
+    "request",
+    "response",
+    "error",
+    "retry",
+    "step",
+]
+
+TAGS = ["weather", "time", "mermaid", "linkedin", "travel", "marine", "planning", "alerts"]
+
+
+def make_vocabulary(size: int, seed: int = 0) -> list[str]:
+    """
+    Return VOCABULARY padded with deterministic pseudo-words up to size words.
+
+    Pseudo-words are 4-10 lowercase letters, so every word survives keyword
+    extraction (stop-word and length filters).
+    """
+    if size <= len(VOCABULARY):
+        return VOCABULARY[:size]
+
+    rng = random.Random(seed)
+    words = list(VOCABULARY)
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def make_tags(count: int) -> list[str]:
+    """Return TAGS padded with numbered tags up to count tags."""
+    return (
+        TAGS[:count] if count <= len(TAGS) else TAGS + [f"tag{i}" for i in range(len(TAGS), count)]
+    )
+
+
+def make_corpus(
+    count: int,
+    content_words: int = 400,
+    seed: int = 42,
+    vocabulary_size: Optional[int] = None,
+    num_tags: Optional[int] = None,
+    tags_per_playbook: int = 2,
+    tag_skew: float = 0.0,
+) -> list[Playbook]:
+    """
+    Generate a deterministic corpus of playbooks.
+
+    Args:
+        count: Number of playbooks to generate
+        content_words: Approximate number of words in each playbook body
+        seed: Random seed for reproducible corpora
+        vocabulary_size: Distinct words to draw from (default: VOCABULARY)
+        num_tags: Distinct tags to draw from (default: TAGS)
+        tags_per_playbook: Tags assigned to each playbook
+        tag_skew: Zipf exponent of the tag distribution; 0 picks tags
+            uniformly, larger values make the first tags more common
+    """
+    rng = random.Random(seed)
+    vocabulary = VOCABULARY if vocabulary_size is None else make_vocabulary(vocabulary_size, seed)
+    tag_pool = TAGS if num_tags is None else make_tags(num_tags)
+    tag_weights = [1 / (rank**tag_skew) for rank in range(1, len(tag_pool) + 1)]
+    tags_per_playbook = min(tags_per_playbook, len(tag_pool))
+
+    playbooks = []
+    for i in range(count):
+        title_words = rng.sample(vocabulary, 3)
+        title = f"{' '.join(word.capitalize() for word in title_words)} {i}"
+        description = " ".join(rng.choices(vocabulary, k=12))
+        if tag_skew:
+            tags: list[str] = []
+            while len(tags) < tags_per_playbook:
+                tag = rng.choices(tag_pool, weights=tag_weights)[0]
+                if tag not in tags:
+                    tags.append(tag)
+        else:
+            tags = rng.sample(tag_pool, tags_per_playbook)
+        body = " ".join(rng.choices(vocabulary, k=content_words))
+        content = f"# Playbook: {title}\n\n## Description\n{description}\n\n## Steps\n{body}\n"
+
+        metadata = PlaybookMetadata(title=title, description=description, tags=tags)
+        playbooks.append(Playbook(metadata=metadata, content=content))
+
+    return playbooks
+
+
+def write_corpus(
+    playbooks: list[Playbook], directory: Path, per_directory: int = 500
+) -> list[Path]:
+    """
+    Write playbooks as markdown files the loader can read back.
+
+    Files are spread over subdirectories of at most per_directory files.
+
+    Returns:
+        Paths of the written files
+    """
+    paths = []
+    for i, playbook in enumerate(playbooks):
+        folder = directory / f"part_{i // per_directory:04d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"playbook_{i:06d}.md"
+        path.write_text(playbook.content, encoding="utf-8")
+        paths.append(path)
+    return paths
@@ -14,10 +14,10 @@ import asyncio
 from pathlib import Path
 from typing import Optional
 
+from chuk_mcp_playbook.loader import load_default_playbooks
 from chuk_mcp_playbook.models.playbook import Playbook
 from chuk_mcp_playbook.services.playbook_service import PlaybookService
 from chuk_mcp_playbook.storage.base import PlaybookStorage
-from chuk_mcp_playbook.loader import load_default_playbooks
 
 
 class LoggingStorage(PlaybookStorage):
@@ -55,11 +55,15 @@ class LoggingStorage(PlaybookStorage):
         return result
 
     async def query(
-        self, question: str, top_k: int = 3, tags: Optional[list[str]] = None
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
     ) -> list[Playbook]:
         """Query playbooks with logging."""
         self._log("QUERY", f"'{question}' (top_k={top_k})")
-        results = await self.storage.query(question, top_k, tags)
+        results = await self.storage.query(question, top_k, tags, match_all_tags)
         self._log("QUERY_RESULT", f"Found {len(results)} playbooks")
         return results
 
@@ -126,10 +130,14 @@ class CachedStorage(PlaybookStorage):
         return result
 
     async def query(
-        self, question: str, top_k: int = 3, tags: Optional[list[str]] = None
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
     ) -> list[Playbook]:
         """Query (no caching for queries)."""
-        return await self.storage.query(question, top_k, tags)
+        return await self.storage.query(question, top_k, tags, match_all_tags)
 
     async def list_all(self) -> list[str]:
         """List all."""
@@ -176,7 +184,7 @@ async def main():
     await service.query_playbooks("sunset", top_k=1)
     await service.get_playbook("Get Sunset and Sunrise Times")
     await service.list_playbooks()
-    stats = await service.get_stats()
+    await service.get_stats()
     print()
     print(f"Total operations logged: {logging_storage.operation_count}")
     print()
@@ -204,10 +212,12 @@ async def main():
     await service2.get_playbook("Get Sunset and Sunrise Times")
     print()
 
-    print(f"Cache Statistics:")
+    print("Cache Statistics:")
     print(f"  Hits: {cached_storage.cache_hits}")
     print(f"  Misses: {cached_storage.cache_misses}")
-    print(f"  Hit Rate: {cached_storage.cache_hits / (cached_storage.cache_hits + cached_storage.cache_misses) * 100:.1f}%")
+    print(
+        f"  Hit Rate: {cached_storage.cache_hits / (cached_storage.cache_hits + cached_storage.cache_misses) * 100:.1f}%"
+    )
     print()
 
     # Example 3: Combining both!
@@ -1,22 +1,61 @@
 """Utility to load playbooks from markdown files."""
 
 import asyncio
+import hashlib
+import io
 import re
 import sys
+import tarfile
+import zipfile
+from collections import ChainMap
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from chuk_mcp_playbook.models.playbook import PlaybookMetadata
+from pydantic import BaseModel, Field
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
 from chuk_mcp_playbook.services.playbook_service import PlaybookService
 
+# Default number of files read and parsed concurrently
+DEFAULT_WORKERS = 8
+
+# Upper bound on the uncompressed markdown read from one archive
+MAX_ARCHIVE_BYTES = 64 * 1024 * 1024
+
+
+class ManifestEntry(BaseModel):
+    """Fingerprint of an ingested playbook file."""
+
+    mtime_ns: int = Field(..., description="File modification time in nanoseconds")
+    size: int = Field(..., description="File size in bytes")
+    sha256: str = Field(..., description="SHA-256 of the file contents")
+    title: str = Field(..., description="Title of the playbook parsed from the file")
+
+
+class SyncResult(BaseModel):
+    """Outcome of an incremental directory sync."""
+
+    added: list[str] = Field(default_factory=list, description="Titles of new playbooks")
+    updated: list[str] = Field(default_factory=list, description="Titles of changed playbooks")
+    removed: list[str] = Field(default_factory=list, description="Titles of deleted playbooks")
+    unchanged: int = Field(default=0, description="Number of files that did not change")
+    errors: list[str] = Field(
+        default_factory=list, description="Paths of files that failed to load"
+    )
+
 
 class PlaybookLoader:
     """Loads playbooks from markdown files into storage."""
 
     def __init__(self, service: PlaybookService):
         self.service = service
+        # File path -> fingerprint of every file loaded by this loader
+        self.manifest: dict[str, ManifestEntry] = {}
 
-    def _extract_metadata_from_markdown(self, content: str, filename: str) -> tuple[str, str, list[str]]:
+    @staticmethod
+    def _extract_metadata_from_markdown(content: str, filename: str) -> tuple[str, str, list[str]]:
         """
         Extract title, description, and tags from markdown content.
 
@@ -72,8 +111,9 @@ class PlaybookLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Playbook file not found: {file_path}")
 
-        content = file_path.read_text(encoding="utf-8")
-        title, description, tags = self._extract_metadata_from_markdown(content, file_path.name)
+        (content, title, description, tags), _ = await asyncio.to_thread(
+            read_playbook_file, file_path
+        )
 
         await self.service.create_playbook(
             title=title,
@@ -83,14 +123,63 @@ class PlaybookLoader:
             author=author,
         )
 
-    async def load_from_directory(self, directory: Path, author: Optional[str] = None, recursive: bool = True) -> int:
+    async def _parse_files(
+        self,
+        files: list[Path],
+        workers: int,
+        use_processes: bool,
+        reader: Optional[Callable[[Path], Any]] = None,
+    ) -> list[Any]:
+        """
+        Read and parse files in a worker pool.
+
+        At most 2 * workers files are in flight at once. Results keep the
+        order of files; a file that fails yields its exception instead.
+
+        Args:
+            reader: Picklable per-file function (defaults to read_playbook_file)
+        """
+        reader = reader or read_playbook_file
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(max(1, workers) * 2)
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if use_processes
+            else ThreadPoolExecutor(max_workers=workers, thread_name_prefix="playbook-loader")
+        )
+
+        async def parse(file_path: Path) -> Any:
+            async with in_flight:
+                try:
+                    return await loop.run_in_executor(executor, reader, file_path)
+                except Exception as e:
+                    return e
+
+        try:
+            return await asyncio.gather(*(parse(file_path) for file_path in files))
+        finally:
+            executor.shutdown(wait=False)
+
+    async def load_from_directory(
+        self,
+        directory: Path,
+        author: Optional[str] = None,
+        recursive: bool = True,
+        workers: int = DEFAULT_WORKERS,
+        use_processes: bool = False,
+    ) -> int:
         """
         Load all markdown playbooks from a directory.
 
+        Files are read and parsed concurrently in a thread pool (or a process
+        pool for parsing-heavy corpora), then added to storage in one batch.
+
         Args:
             directory: Directory path to load playbooks from
             author: Optional author name for the playbooks
             recursive: If True, scan subdirectories recursively (default: True)
+            workers: Number of files read and parsed concurrently
+            use_processes: Parse in a process pool instead of a thread pool
 
         Returns:
             Number of playbooks loaded
@@ -101,17 +190,230 @@ class PlaybookLoader:
         # Use recursive glob to find all .md files in subdirectories
         pattern = "**/*.md" if recursive else "*.md"
         markdown_files = list(directory.glob(pattern))
-        count = 0
 
-        for file_path in markdown_files:
+        parsed = await self._parse_files(markdown_files, workers, use_processes)
+
+        playbooks = []
+        entries = {}
+        for file_path, result in zip(markdown_files, parsed):
+            if isinstance(result, Exception):
+                print(f"Error loading {file_path.name}: {result}", file=sys.stderr)
+                continue
+
+            (content, title, description, tags), entry = result
             try:
-                await self.load_from_file(file_path, author=author)
-                count += 1
+                metadata = PlaybookMetadata(
+                    title=title, description=description, tags=tags, author=author
+                )
+                playbooks.append(Playbook(metadata=metadata, content=content))
             except Exception as e:
                 print(f"Error loading {file_path.name}: {e}", file=sys.stderr)
+                continue
+            entries[str(file_path)] = entry
 
+        count = await self.service.add_playbooks(playbooks)
+        self.manifest.update(entries)
         return count
 
+    async def _remove_title(
+        self, title: str, result: SyncResult, tracked: Mapping[str, ManifestEntry]
+    ) -> None:
+        """Delete a playbook unless another tracked file still provides it."""
+        if any(entry.title == title for entry in tracked.values()):
+            return
+        if await self.service.delete_playbook(title):
+            result.removed.append(title)
+
+    async def sync_directory(
+        self,
+        directory: Path,
+        author: Optional[str] = None,
+        recursive: bool = True,
+        workers: int = DEFAULT_WORKERS,
+    ) -> SyncResult:
+        """
+        Incrementally bring storage in line with a directory.
+
+        Files whose mtime and size match the manifest are skipped without
+        being read. Other files are read and hashed; only files whose content
+        changed are re-parsed into storage. Playbooks whose files disappeared
+        are deleted. Storage keeps any search index up to date as usual.
+
+        Changed files enter the manifest only once storage accepted them,
+        so a failed write is retried by the next sync.
+
+        Args:
+            directory: Directory path to sync
+            author: Optional author name for new or changed playbooks
+            recursive: If True, scan subdirectories recursively (default: True)
+            workers: Number of files read and parsed concurrently
+
+        Returns:
+            SyncResult describing what changed
+        """
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+
+        pattern = "**/*.md" if recursive else "*.md"
+        current = {str(file_path): file_path for file_path in directory.glob(pattern)}
+        result = SyncResult()
+
+        # Cheap stat check first: only files that look different are read
+        candidates = []
+        for key, file_path in current.items():
+            entry = self.manifest.get(key)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                result.unchanged += 1
+            else:
+                candidates.append(file_path)
+
+        parsed = await self._parse_files(candidates, workers, use_processes=False)
+
+        playbooks = []
+        # Manifest entries of changed files, recorded after the storage write
+        written: dict[str, ManifestEntry] = {}
+        tracked = ChainMap(written, self.manifest)
+        for file_path, loaded in zip(candidates, parsed):
+            if isinstance(loaded, Exception):
+                print(f"Error loading {file_path.name}: {loaded}", file=sys.stderr)
+                result.errors.append(str(file_path))
+                continue
+
+            (content, title, description, tags), entry = loaded
+            key = str(file_path)
+            previous = self.manifest.get(key)
+
+            if previous is not None and previous.sha256 == entry.sha256:
+                # Touched but not modified
+                self.manifest[key] = entry
+                result.unchanged += 1
+                continue
+
+            if previous is None:
+                # Not tracked yet (e.g. storage restored from a snapshot):
+                # skip the write if storage already holds the same playbook
+                existing = await self.service.get_playbook(title)
+                if existing is not None and existing.content == content:
+                    self.manifest[key] = entry
+                    result.unchanged += 1
+                    continue
+
+            written[key] = entry
+            if previous is not None and previous.title != title:
+                await self._remove_title(previous.title, result, tracked)
+
+            metadata = PlaybookMetadata(
+                title=title, description=description, tags=tags, author=author
+            )
+            playbooks.append(Playbook(metadata=metadata, content=content))
+            (result.updated if previous is not None else result.added).append(title)
+
+        # Files that disappeared from the directory
+        for key in list(self.manifest):
+            if key in current:
+                continue
+            path = Path(key)
+            in_scope = path.is_relative_to(directory) if recursive else path.parent == directory
+            if in_scope:
+                entry = self.manifest.pop(key)
+                try:
+                    await self._remove_title(entry.title, result, tracked)
+                except BaseException:
+                    self.manifest[key] = entry
+                    raise
+
+        await self.service.add_playbooks(playbooks)
+        self.manifest.update(written)
+        return result
+
+
+def read_playbook_file(file_path: Path) -> tuple[tuple[str, str, str, list[str]], ManifestEntry]:
+    """
+    Read, fingerprint and parse a markdown playbook.
+
+    The single reader of playbook files: loads, syncs and the watcher all
+    parse through it. A module-level function so that it can run in thread
+    and process pools.
+
+    Returns:
+        Tuple of ((content, title, description, tags), manifest entry)
+    """
+    stat = file_path.stat()
+    data = file_path.read_bytes()
+    content = data.decode("utf-8")
+    title, description, tags = PlaybookLoader._extract_metadata_from_markdown(
+        content, file_path.name
+    )
+    entry = ManifestEntry(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        sha256=hashlib.sha256(data).hexdigest(),
+        title=title,
+    )
+    return (content, title, description, tags), entry
+
+
+def parse_playbook_archive(data: bytes) -> list[dict[str, Any]]:
+    """
+    Parse every markdown file in a zip or tar (optionally compressed) archive.
+
+    Members are read in memory and never extracted to disk.
+
+    Returns:
+        List of dicts with title, description, tags and content, in archive order
+
+    Raises:
+        ValueError: If data is not a supported archive or expands beyond
+            MAX_ARCHIVE_BYTES
+    """
+    members: list[tuple[str, bytes]] = []
+    total = 0
+
+    def take(name: str, size: int, read: Callable[[], bytes]) -> None:
+        nonlocal total
+        if not name.endswith(".md") or Path(name).name.startswith("."):
+            return
+        total += size
+        if total > MAX_ARCHIVE_BYTES:
+            raise ValueError(f"Archive expands beyond {MAX_ARCHIVE_BYTES} bytes of markdown")
+        members.append((name, read()))
+
+    buffer = io.BytesIO(data)
+    if zipfile.is_zipfile(buffer):
+        with zipfile.ZipFile(buffer) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    take(info.filename, info.file_size, lambda info=info: archive.read(info))
+    else:
+        buffer.seek(0)
+        try:
+            archive = tarfile.open(fileobj=buffer, mode="r:*")
+        except tarfile.TarError as e:
+            raise ValueError("Expected a zip or tar archive of markdown files") from e
+        with archive:
+            for member in archive.getmembers():
+                if member.isfile():
+                    take(
+                        member.name,
+                        member.size,
+                        lambda member=member: archive.extractfile(member).read(),
+                    )
+
+    entries = []
+    for name, raw in members:
+        content = raw.decode("utf-8")
+        title, description, tags = PlaybookLoader._extract_metadata_from_markdown(
+            content, Path(name).name
+        )
+        entries.append(
+            {"title": title, "description": description, "tags": tags, "content": content}
+        )
+    return entries
+
 
 def parse_index_file(index_path: Path) -> list[str]:
     """
@@ -161,7 +463,63 @@ def parse_index_file(index_path: Path) -> list[str]:
     return locations
 
 
-async def load_default_playbooks(service: PlaybookService, playbooks_dir: Optional[Path] = None) -> int:
+def playbook_locations(playbooks_dir: Optional[Path] = None) -> list[Path]:
+    """
+    Resolve the filesystem locations that load_default_playbooks() reads.
+
+    Args:
+        playbooks_dir: Optional custom playbooks directory path (overrides index.md)
+
+    Returns:
+        Files and directories named by index.md's file:// entries, or the
+        playbooks directory when there is no index.md
+    """
+    if playbooks_dir is not None:
+        return [playbooks_dir]
+
+    project_root = Path(__file__).parent.parent.parent
+    index_path = project_root / "index.md"
+    if not index_path.exists():
+        return [project_root / "playbooks"]
+
+    return [
+        Path(location[7:])
+        for location in parse_index_file(index_path)
+        if location.startswith("file://")
+    ]
+
+
+def playbook_source_files(playbooks_dir: Optional[Path] = None) -> list[Path]:
+    """
+    List the files that load_default_playbooks() reads for the same arguments.
+
+    When index.md drives ingestion it is included too, so edits to the list
+    of locations are detected. Used to validate startup snapshots.
+
+    Args:
+        playbooks_dir: Optional custom playbooks directory path (overrides index.md)
+
+    Returns:
+        Sorted list of source file paths
+    """
+    files: list[Path] = []
+
+    index_path = Path(__file__).parent.parent.parent / "index.md"
+    if playbooks_dir is None and index_path.exists():
+        files.append(index_path)
+
+    for location in playbook_locations(playbooks_dir):
+        if location.is_file() and location.name != "index.md":
+            files.append(location)
+        elif location.is_dir():
+            files.extend(location.glob("**/*.md"))
+
+    return sorted(files)
+
+
+async def load_default_playbooks(
+    service: PlaybookService, playbooks_dir: Optional[Path] = None
+) -> int:
     """
     Load default playbooks from locations specified in index.md.
 
@@ -192,7 +550,10 @@ async def load_default_playbooks(service: PlaybookService, playbooks_dir: Option
             print(f"Playbooks directory not found: {playbooks_dir}", file=sys.stderr)
             return 0
         count = await loader.load_from_directory(playbooks_dir, author="Chuk AI", recursive=True)
-        print(f"Loaded {count} playbooks from {playbooks_dir} (including subdirectories)", file=sys.stderr)
+        print(
+            f"Loaded {count} playbooks from {playbooks_dir} (including subdirectories)",
+            file=sys.stderr,
+        )
         return count
 
     # Look for index.md in project root
@@ -221,7 +582,9 @@ async def load_default_playbooks(service: PlaybookService, playbooks_dir: Option
                         await loader.load_from_file(location_path, author="Chuk AI")
                         total_count += 1
                     elif location_path.is_dir():
-                        count = await loader.load_from_directory(location_path, author="Chuk AI", recursive=True)
+                        count = await loader.load_from_directory(
+                            location_path, author="Chuk AI", recursive=True
+                        )
                         total_count += count
                         print(f"Loaded {count} playbooks from {location_path}", file=sys.stderr)
 
@@ -249,5 +612,8 @@ async def load_default_playbooks(service: PlaybookService, playbooks_dir: Option
             return 0
 
         count = await loader.load_from_directory(playbooks_dir, author="Chuk AI", recursive=True)
-        print(f"Loaded {count} playbooks from {playbooks_dir} (including subdirectories)", file=sys.stderr)
+        print(
+            f"Loaded {count} playbooks from {playbooks_dir} (including subdirectories)",
+            file=sys.stderr,
+        )
         return count
@@ -0,0 +1,194 @@
+"""Lightweight per-stage latency metrics."""
+
+import bisect
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import Any
+
+# Histogram bucket upper bounds in seconds: 1us doubling up to ~17s
+BUCKETS: tuple[float, ...] = tuple(1e-6 * 2**i for i in range(25))
+
+# Shared no-op context returned by timer() while metrics are disabled
+_DISABLED = nullcontext()
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram (Prometheus-style cumulative export).
+
+    Percentiles are estimated by linear interpolation inside the bucket
+    that holds the requested rank, so they are accurate to within a
+    factor of two of the true value.
+    """
+
+    __slots__ = ("counts", "count", "total", "_lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one measurement."""
+        index = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100) in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = BUCKETS[index - 1] if index else 0.0
+                upper = BUCKETS[index] if index < len(BUCKETS) else BUCKETS[-1] * 2
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return BUCKETS[-1]
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean and percentile estimates (milliseconds)."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 4),
+            "p90_ms": round(self.percentile(90) * 1000, 4),
+            "p99_ms": round(self.percentile(99) * 1000, 4),
+        }
+
+
+class Metrics:
+    """
+    Registry of stage latency histograms, counters and gauges.
+
+    Instrumented code calls timer(stage), increment(name) and
+    set_gauge(name, value) on the shared METRICS instance. While disabled,
+    timer() returns a shared no-op context and the other calls return
+    immediately, so instrumentation costs one attribute check per call.
+
+    Stage names are dotted by layer, e.g. "service.query",
+    "storage.tag_filter", "search.keywords", "search.score", "search.sort"
+    and "server.serialize".
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: dict[str, Histogram] = {}
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage: str) -> Histogram:
+        """Return (creating if needed) the histogram for a stage."""
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, Histogram())
+        return histogram
+
+    def timer(self, stage: str):
+        """Context manager timing a block into the stage's histogram."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(stage)
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(stage).observe(time.perf_counter() - start)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record a duration measured by the caller."""
+        if self.enabled:
+            self.histogram(stage).observe(seconds)
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Add to a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def counter(self, name: str) -> float:
+        """Current value of a counter (0 if never incremented)."""
+        return self._counters.get(name, 0)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a level (queue depth, in-flight work)."""
+        if self.enabled:
+            self._gauges[name] = value
+
+    def gauge(self, name: str) -> float:
+        """Last value of a gauge (0 if never set)."""
+        return self._gauges.get(name, 0)
+
+    def reset(self) -> None:
+        """Drop every recorded measurement."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-stage latency summaries, counters and gauges."""
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        return {
+            "enabled": self.enabled,
+            "stages": {stage: histograms[stage].summary() for stage in sorted(histograms)},
+            "counters": {name: counters[name] for name in sorted(counters)},
+            "gauges": {name: gauges[name] for name in sorted(gauges)},
+        }
+
+    def to_prometheus(self, prefix: str = "chuk_playbook") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        lines = []
+        if histograms:
+            name = f"{prefix}_stage_seconds"
+            lines.append(f"# HELP {name} Latency of each processing stage")
+            lines.append(f"# TYPE {name} histogram")
+            for stage in sorted(histograms):
+                histogram = histograms[stage]
+                label = f'stage="{stage}"'
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKETS, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label},le="{bound:.6g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{label}}} {histogram.total:.9g}")
+                lines.append(f"{name}_count{{{label}}} {histogram.count}")
+
+        for counter in sorted(counters):
+            name = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', counter)}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {counters[counter]:g}")
+
+        for gauge in sorted(gauges):
+            name = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', gauge)}"
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {gauges[gauge]:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide metrics registry (disabled until the server enables it)
+METRICS = Metrics()
@@ -1,5 +1,19 @@
 """Domain models for playbook system."""
 
-from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata, PlaybookQuery
+from chuk_mcp_playbook.models.playbook import (
+    Playbook,
+    PlaybookMetadata,
+    PlaybookQuery,
+    PlaybookSearchView,
+    PlaybookSection,
+    PlaybookSectionMatch,
+)
 
-__all__ = ["Playbook", "PlaybookMetadata", "PlaybookQuery"]
+__all__ = [
+    "Playbook",
+    "PlaybookMetadata",
+    "PlaybookQuery",
+    "PlaybookSearchView",
+    "PlaybookSection",
+    "PlaybookSectionMatch",
+]
@@ -1,9 +1,12 @@
 """Playbook domain models using Pydantic."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from chuk_mcp_playbook.text import tokenize
 
 
 class PlaybookMetadata(BaseModel):
@@ -14,7 +17,75 @@ class PlaybookMetadata(BaseModel):
     tags: list[str] = Field(default_factory=list, description="Tags for categorization")
     author: Optional[str] = Field(None, description="Author of the playbook")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, description="Last update timestamp"
+    )
+
+
+class PlaybookSearchView(BaseModel):
+    """
+    Immutable, pre-normalized view of a playbook used by search providers.
+
+    Built once when a playbook is stored so that scoring never has to
+    lowercase the playbook again. Word tokens are only needed by index
+    providers (at add time), so they are computed on first use.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    title: str = Field(..., description="Lowercased title")
+    description: str = Field(..., description="Lowercased description")
+    content: str = Field(..., description="Lowercased markdown content")
+    tags: tuple[str, ...] = Field(default=(), description="Lowercased tags in original order")
+
+    @cached_property
+    def title_tokens(self) -> frozenset[str]:
+        """Word tokens in the title."""
+        return frozenset(tokenize(self.title))
+
+    @cached_property
+    def tag_tokens(self) -> frozenset[str]:
+        """Word tokens across all tags."""
+        return frozenset(token for tag in self.tags for token in tokenize(tag))
+
+    @cached_property
+    def description_tokens(self) -> frozenset[str]:
+        """Word tokens in the description."""
+        return frozenset(tokenize(self.description))
+
+    @cached_property
+    def content_tokens(self) -> frozenset[str]:
+        """Word tokens in the content."""
+        return frozenset(tokenize(self.content))
+
+    @classmethod
+    def from_playbook(cls, playbook: "Playbook") -> "PlaybookSearchView":
+        """Normalize a playbook's searchable fields."""
+        title = playbook.metadata.title.lower()
+        description = playbook.metadata.description.lower()
+        content = playbook.content.lower()
+        tags = tuple(tag.lower() for tag in playbook.metadata.tags)
+        return cls.model_construct(title=title, description=description, content=content, tags=tags)
+
+
+class PlaybookSection(BaseModel):
+    """A `##` section of a playbook's markdown content."""
+
+    heading: str = Field(..., description="Section heading without the leading ##")
+    content: str = Field(..., description="Markdown body of the section")
+    position: int = Field(..., description="Index of the section within the playbook")
+
+
+class PlaybookSectionMatch(BaseModel):
+    """A section returned by a section-level query, with its parent title."""
+
+    title: str = Field(..., description="Title of the playbook containing the section")
+    section: PlaybookSection = Field(..., description="The matching section")
+    score: float = Field(..., description="Relevance score (0.0 to 1.0)")
+
+    def to_markdown(self) -> str:
+        """Render the section under its playbook title."""
+        return f"# {self.title}\n\n## {self.section.heading}\n{self.section.content}"
 
 
 class Playbook(BaseModel):
@@ -23,6 +94,70 @@ class Playbook(BaseModel):
     metadata: PlaybookMetadata = Field(..., description="Playbook metadata")
     content: str = Field(..., description="Markdown content of the playbook")
 
+    _search_view: Optional[PlaybookSearchView] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        # The cached search view is derived data and must not affect equality
+        if not isinstance(other, Playbook):
+            return NotImplemented
+        return self.metadata == other.metadata and self.content == other.content
+
+    @property
+    def search_view(self) -> PlaybookSearchView:
+        """Normalized fields for searching (built on first use, then cached)."""
+        # Read the private slot directly: BaseModel.__getattr__ lookups of
+        # private attributes are slow enough to dominate per-document scoring.
+        view = self.__pydantic_private__["_search_view"]
+        if view is None:
+            view = self.build_search_view()
+        return view
+
+    def build_search_view(self) -> PlaybookSearchView:
+        """
+        Rebuild and cache the search view.
+
+        Storage providers call this at ingest time. Call it again after
+        mutating a playbook in place.
+        """
+        self._search_view = PlaybookSearchView.from_playbook(self)
+        return self._search_view
+
+    def sections(self) -> list[PlaybookSection]:
+        """
+        Split the content at `##` headings.
+
+        Deeper headings stay inside their section and headings inside fenced
+        code blocks are ignored. Text before the first `##` heading (other
+        than the `#` title line) becomes an "Overview" section.
+        """
+        sections: list[PlaybookSection] = []
+        heading = "Overview"
+        lines: list[str] = []
+        in_fence = False
+
+        def flush() -> None:
+            body = "\n".join(lines).strip()
+            if body or heading != "Overview":
+                sections.append(
+                    PlaybookSection(heading=heading, content=body, position=len(sections))
+                )
+
+        for line in self.content.split("\n"):
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith("## "):
+                flush()
+                heading = line[3:].strip()
+                lines = []
+                continue
+            elif not in_fence and not sections and heading == "Overview" and line.startswith("# "):
+                # The title line duplicates metadata.title
+                continue
+            lines.append(line)
+        flush()
+
+        return sections
+
     def matches_query(self, query: str) -> tuple[bool, float]:
         """
         Check if this playbook matches the query.
@@ -31,6 +166,7 @@ class Playbook(BaseModel):
         Uses word-based matching for better results with natural language queries.
         """
         query_lower = query.lower()
+        view = self.search_view
 
         # Extract meaningful words from query (skip common words)
         stop_words = {'how', 'do', 'i', 'get', 'the', 'a', 'an', 'is', 'are', 'what', 'show', 'me', 'about'}
@@ -41,30 +177,27 @@ class Playbook(BaseModel):
             query_words = query_lower.split()
 
         score = 0.0
-        title_lower = self.metadata.title.lower()
-        desc_lower = self.metadata.description.lower()
-        content_lower = self.content.lower()
 
         # Check each query word
         for word in query_words:
             word_score = 0.0
 
             # Title match (highest weight)
-            if word in title_lower:
+            if word in view.title:
                 word_score += 0.5
 
             # Tag matches
-            for tag in self.metadata.tags:
-                if word in tag.lower():
+            for tag in view.tags:
+                if word in tag:
                     word_score += 0.3
                     break
 
             # Description match
-            if word in desc_lower:
+            if word in view.description:
                 word_score += 0.2
 
             # Content match (lowest weight)
-            if word in content_lower:
+            if word in view.content:
                 word_score += 0.1
 
             score += word_score
@@ -1,6 +1,6 @@
 """Search layer for playbook querying."""
 
-from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.search.base import IndexedSearchProvider, SearchProvider
 from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
 
-__all__ = ["SearchProvider", "SearchFactory", "SearchType"]
+__all__ = ["IndexedSearchProvider", "SearchProvider", "SearchFactory", "SearchType"]
@@ -1,7 +1,12 @@
 """Abstract base class for search providers."""
 
+import heapq
+import pickle
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterable
+from typing import Optional
 
+from chuk_mcp_playbook.metrics import METRICS
 from chuk_mcp_playbook.models.playbook import Playbook
 
 
@@ -24,27 +29,171 @@ class SearchProvider(ABC):
         """
         pass
 
-    def search(self, playbooks: list[Playbook], query: str, top_k: int = 3) -> list[Playbook]:
+    def max_score(self, playbook: Playbook, query: str) -> float:
+        """
+        Upper bound on the score a playbook can reach for a query.
+
+        search() skips scoring playbooks whose bound cannot beat the current
+        top_k results. The default bound (1.0) only ends the search once
+        top_k perfect scores are found; providers can override this with a
+        cheaper-than-score() estimate.
+        The bound must never be lower than the value score() would return.
+        """
+        return 1.0
+
+    def search_with_scores(
+        self, playbooks: Iterable[Playbook], query: str, top_k: int = 3
+    ) -> list[tuple[Playbook, float]]:
+        """
+        Search through playbooks and return top matches with their scores.
+
+        Keeps a bounded min-heap of the best top_k matches instead of sorting
+        every match, and stops early once the heap holds top_k perfect scores.
+
+        Args:
+            playbooks: Playbooks to search
+            query: Search query
+            top_k: Maximum number of results to return
+
+        Returns:
+            List of (playbook, score) tuples sorted by relevance. Ties keep
+            the input order.
+        """
+        if top_k <= 0:
+            return []
+
+        # Entries are (score, -position, playbook): the heap root is the
+        # weakest result, and earlier playbooks win ties
+        heap: list[tuple[float, int, Playbook]] = []
+
+        with METRICS.timer("search.score"):
+            for position, playbook in enumerate(playbooks):
+                if len(heap) == top_k:
+                    threshold = heap[0][0]
+                    if threshold >= 1.0:
+                        break
+                    if self.max_score(playbook, query) <= threshold:
+                        continue
+
+                matches, score = self.score(playbook, query)
+                if not matches:
+                    continue
+
+                entry = (score, -position, playbook)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        with METRICS.timer("search.sort"):
+            heap.sort(reverse=True)
+        return [(playbook, score) for score, _, playbook in heap]
+
+    def search(self, playbooks: Iterable[Playbook], query: str, top_k: int = 3) -> list[Playbook]:
         """
         Search through playbooks and return top matches.
 
         Args:
-            playbooks: List of playbooks to search
+            playbooks: Playbooks to search
             query: Search query
             top_k: Maximum number of results to return
 
         Returns:
             List of matching playbooks sorted by relevance
         """
-        results = []
+        return [playbook for playbook, _ in self.search_with_scores(playbooks, query, top_k=top_k)]
+
+
+class IndexedSearchProvider(SearchProvider):
+    """
+    Base class for search providers that maintain their own index.
+
+    Storage providers keep the index in sync by calling add()/remove()/clear()
+    whenever playbooks change, and answer queries through query_index() so
+    that only the relevant part of the index is touched instead of scoring
+    every stored playbook.
+
+    An indexed provider instance should be owned by a single storage.
+    Queries must not modify the index: versioned storage runs them
+    concurrently without a lock, so deferred work belongs in the writes.
+    """
+
+    @abstractmethod
+    def add(self, playbook: Playbook) -> None:
+        """Index a playbook, replacing any previous version with the same title."""
+        pass
+
+    def add_many(self, playbooks: list[Playbook]) -> None:
+        """
+        Index many playbooks.
 
+        The default adds them one at a time; providers override it to
+        update derived structures (vocabularies, matrices) once per batch.
+        """
         for playbook in playbooks:
-            matches, score = self.score(playbook, query)
-            if matches:
-                results.append((playbook, score))
+            self.add(playbook)
 
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
+    @abstractmethod
+    def remove(self, title: str) -> None:
+        """Remove a playbook from the index by title."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all playbooks from the index."""
+        pass
+
+    def export_index(self) -> bytes:
+        """
+        Serialize the index for snapshotting.
 
-        # Return top_k playbooks
-        return [playbook for playbook, _ in results[:top_k]]
+        The default pickles the provider's state; providers holding
+        process-local resources override it (or __getstate__).
+        """
+        return pickle.dumps(self.__getstate__(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_index(self, data: bytes) -> None:
+        """
+        Replace the index with one from export_index().
+
+        Only valid for data exported by a provider with the same type and
+        settings; each call decodes a private copy.
+        """
+        self.__dict__.update(pickle.loads(data))
+
+    @abstractmethod
+    def query_index(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Query the index.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of results to return
+            candidates: Optional set of titles to restrict results to
+
+        Returns:
+            List of (title, score) tuples sorted by relevance
+        """
+        pass
+
+    def query_index_batch(
+        self,
+        queries: list[str],
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Query the index with several questions at once.
+
+        The default runs query_index() per question; providers override it
+        to share work (keyword lookups, matrix products) across the batch.
+
+        Returns:
+            One list of (title, score) tuples per query
+        """
+        return [self.query_index(query, top_k=top_k, candidates=candidates) for query in queries]
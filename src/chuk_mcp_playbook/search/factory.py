@@ -3,8 +3,15 @@
 from enum import Enum
 
 from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.search.providers.bm25 import BM25Search
+from chuk_mcp_playbook.search.providers.fuzzy import FuzzySearch
+from chuk_mcp_playbook.search.providers.hybrid import HybridSearch
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
 from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.search.providers.semantic import SemanticSearch
+from chuk_mcp_playbook.search.providers.sharded import ShardedKeywordSearch
 from chuk_mcp_playbook.search.providers.simple import SimpleSearch
+from chuk_mcp_playbook.search.providers.vectorized import VectorizedKeywordSearch
 
 
 class SearchType(str, Enum):
@@ -12,10 +19,13 @@ class SearchType(str, Enum):
 
     KEYWORD = "keyword"  # Keyword-based with stop word filtering (default, best for NL queries)
     SIMPLE = "simple"    # Simple substring matching (fast, exact)
-    # Future providers:
-    # FUZZY = "fuzzy"      # Fuzzy string matching
-    # SEMANTIC = "semantic"  # Vector/embedding-based search
-    # HYBRID = "hybrid"    # Combination of multiple strategies
+    INDEXED = "indexed"  # Inverted-index keyword search (no full-corpus scan per query)
+    BM25 = "bm25"  # BM25F ranking over the inverted index (length-aware relevance)
+    SEMANTIC = "semantic"  # Offline vector search (hashed n-grams, optional SVD; needs numpy)
+    HYBRID = "hybrid"  # Rank fusion of keyword and vector search
+    FUZZY = "fuzzy"  # Typo-tolerant keyword search (trigram index + edit distance)
+    VECTORIZED = "vectorized"  # Keyword search scored over columnar matrices (same results; needs numpy)
+    SHARDED = "sharded"  # Vectorized keyword search split across worker processes (shared memory)
 
 
 class SearchFactory:
@@ -43,6 +53,27 @@ class SearchFactory:
             >>> # Simple substring search
             >>> search = SearchFactory.create(SearchType.SIMPLE)
             >>>
+            >>> # Inverted-index search for large corpora
+            >>> search = SearchFactory.create(SearchType.INDEXED)
+            >>>
+            >>> # BM25F ranking with custom saturation
+            >>> search = SearchFactory.create(SearchType.BM25, k1=1.5)
+            >>>
+            >>> # Vector search with a 128-dimensional latent projection
+            >>> search = SearchFactory.create(SearchType.SEMANTIC, dimensions=128)
+            >>>
+            >>> # Keyword + vector search fused with weighted scores
+            >>> search = SearchFactory.create(SearchType.HYBRID, fusion="weighted")
+            >>>
+            >>> # Typo-tolerant search allowing up to 2 edits per keyword
+            >>> search = SearchFactory.create(SearchType.FUZZY, max_distance=2)
+            >>>
+            >>> # Keyword search results computed with NumPy for large corpora
+            >>> search = SearchFactory.create(SearchType.VECTORIZED)
+            >>>
+            >>> # Same results scored by 4 worker processes
+            >>> search = SearchFactory.create(SearchType.SHARDED, workers=4)
+            >>>
             >>> # Keyword search with custom stop words
             >>> custom_stops = {'the', 'a', 'an'}
             >>> search = SearchFactory.create(SearchType.KEYWORD, stop_words=custom_stops)
@@ -51,10 +82,19 @@ class SearchFactory:
             return KeywordSearch(**kwargs)
         elif search_type == SearchType.SIMPLE:
             return SimpleSearch(**kwargs)
-        # Future providers:
-        # elif search_type == SearchType.FUZZY:
-        #     return FuzzySearch(**kwargs)
-        # elif search_type == SearchType.SEMANTIC:
-        #     return SemanticSearch(**kwargs)
+        elif search_type == SearchType.INDEXED:
+            return IndexedSearch(**kwargs)
+        elif search_type == SearchType.BM25:
+            return BM25Search(**kwargs)
+        elif search_type == SearchType.SEMANTIC:
+            return SemanticSearch(**kwargs)
+        elif search_type == SearchType.HYBRID:
+            return HybridSearch(**kwargs)
+        elif search_type == SearchType.FUZZY:
+            return FuzzySearch(**kwargs)
+        elif search_type == SearchType.VECTORIZED:
+            return VectorizedKeywordSearch(**kwargs)
+        elif search_type == SearchType.SHARDED:
+            return ShardedKeywordSearch(**kwargs)
         else:
             raise ValueError(f"Unsupported search type: {search_type}")
@@ -0,0 +1,155 @@
+"""Inverted index shared by index-backed search providers."""
+
+from collections import Counter
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.text import tokenize
+
+# Indexed fields and their relevance weights (title > tags > description > content).
+# These mirror the weights used by KeywordSearch and SimpleSearch.
+FIELD_WEIGHTS: dict[str, float] = {
+    "title": 0.5,
+    "tags": 0.3,
+    "description": 0.2,
+    "content": 0.1,
+}
+
+FIELDS: tuple[str, ...] = tuple(FIELD_WEIGHTS)
+
+
+def analyze_playbook(playbook: Playbook) -> dict[str, list[str]]:
+    """Tokenize each searchable field of a playbook."""
+    tag_tokens: list[str] = []
+    for tag in playbook.metadata.tags:
+        tag_tokens.extend(tokenize(tag))
+
+    return {
+        "title": tokenize(playbook.metadata.title),
+        "tags": tag_tokens,
+        "description": tokenize(playbook.metadata.description),
+        "content": tokenize(playbook.content),
+    }
+
+
+class InvertedIndex:
+    """
+    Per-field token -> posting-list index keyed by playbook title.
+
+    Each posting maps a document key to the term frequency of the token in
+    that field. The index also remembers which terms each document
+    contributed so that removal only touches that document's postings.
+
+    Corpus statistics (document frequencies, per-field lengths and their
+    totals) are maintained incrementally so ranking functions such as BM25
+    never have to re-tokenize the corpus.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, dict[str, int]]] = {field: {} for field in FIELDS}
+        self._doc_terms: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._doc_freq: dict[str, int] = {}
+        self._field_lengths: dict[str, dict[str, int]] = {field: {} for field in FIELDS}
+        self._total_lengths: dict[str, int] = {field: 0 for field in FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc_terms
+
+    def keys(self) -> list[str]:
+        """Return the keys of all indexed documents."""
+        return list(self._doc_terms)
+
+    def add(self, key: str, fields: dict[str, list[str]]) -> None:
+        """Index a document, replacing any previous version with the same key."""
+        if key in self._doc_terms:
+            self.remove(key)
+
+        doc_terms: dict[str, tuple[str, ...]] = {}
+        unique_terms: set[str] = set()
+        for field in FIELDS:
+            tokens = fields.get(field, ())
+            counts = Counter(tokens)
+            field_postings = self._postings[field]
+            for term, tf in counts.items():
+                posting = field_postings.get(term)
+                if posting is None:
+                    posting = field_postings[term] = {}
+                posting[key] = tf
+            doc_terms[field] = tuple(counts)
+            unique_terms.update(counts)
+
+            self._field_lengths[field][key] = len(tokens)
+            self._total_lengths[field] += len(tokens)
+
+        for term in unique_terms:
+            self._doc_freq[term] = self._doc_freq.get(term, 0) + 1
+
+        self._doc_terms[key] = doc_terms
+
+    def remove(self, key: str) -> bool:
+        """Remove a document from the index. Returns True if it was indexed."""
+        doc_terms = self._doc_terms.pop(key, None)
+        if doc_terms is None:
+            return False
+
+        unique_terms: set[str] = set()
+        for field, terms in doc_terms.items():
+            field_postings = self._postings[field]
+            for term in terms:
+                posting = field_postings.get(term)
+                if posting is None:
+                    continue
+                posting.pop(key, None)
+                if not posting:
+                    del field_postings[term]
+            unique_terms.update(terms)
+
+            self._total_lengths[field] -= self._field_lengths[field].pop(key, 0)
+
+        for term in unique_terms:
+            remaining = self._doc_freq.get(term, 0) - 1
+            if remaining > 0:
+                self._doc_freq[term] = remaining
+            else:
+                self._doc_freq.pop(term, None)
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents from the index."""
+        for field in FIELDS:
+            self._postings[field].clear()
+            self._field_lengths[field].clear()
+            self._total_lengths[field] = 0
+        self._doc_terms.clear()
+        self._doc_freq.clear()
+
+    def postings(self, field: str, term: str) -> dict[str, int]:
+        """Return the {key: term_frequency} posting list for a term in a field."""
+        return self._postings[field].get(term, {})
+
+    def terms(self, key: str) -> set[str]:
+        """Return the distinct terms a document contributed (any field)."""
+        doc_terms = self._doc_terms.get(key)
+        if doc_terms is None:
+            return set()
+        return set().union(*doc_terms.values())
+
+    def document_frequency(self, term: str) -> int:
+        """Return the number of documents containing the term in any field."""
+        return self._doc_freq.get(term, 0)
+
+    def field_length(self, field: str, key: str) -> int:
+        """Return the number of tokens in a document's field."""
+        return self._field_lengths[field].get(key, 0)
+
+    def field_lengths(self, field: str) -> dict[str, int]:
+        """Return the {key: token_count} mapping for a field."""
+        return self._field_lengths[field]
+
+    def average_length(self, field: str) -> float:
+        """Return the average token count of a field across the corpus."""
+        if not self._doc_terms:
+            return 0.0
+        return self._total_lengths[field] / len(self._doc_terms)
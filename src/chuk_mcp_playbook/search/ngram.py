@@ -0,0 +1,151 @@
+"""Character trigram index for approximate term lookup."""
+
+from collections import Counter
+from typing import Optional
+
+# Padding so that word boundaries (and short words) produce trigrams
+_PAD = "##"
+
+# An edit (insert, delete, substitute or adjacent transposition) changes
+# at most this many of a word's padded trigrams
+_GRAMS_PER_EDIT = 4
+
+
+def trigrams(term: str) -> set[str]:
+    """Return the distinct padded character trigrams of a term."""
+    padded = f"{_PAD}{term}{_PAD}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Optimal string alignment distance between a and b, if within max_distance.
+
+    Counts insertions, deletions, substitutions and adjacent transpositions
+    ("sunest" -> "sunset" is one edit). Gives up as soon as every alignment
+    exceeds max_distance.
+
+    Returns:
+        The distance, or None if it is greater than max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+
+    # Cells further than max_distance from the diagonal can never be within
+    # the bound, so only a band of width 2 * max_distance + 1 is computed
+    too_far = max_distance + 1
+    previous2: list[int] = []
+    previous = [j if j <= max_distance else too_far for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = previous[j - 1] if a[i - 1] == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+                and previous2[j - 2] + 1 < value
+            ):
+                value = previous2[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous2, previous = previous, current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+class TrigramIndex:
+    """
+    Maps (trigram, term length) to the vocabulary terms containing it.
+
+    similar() finds terms within an edit distance without comparing against
+    the whole vocabulary:
+    - Only terms whose length is within max_distance are considered
+    - A term within distance d shares at least len(grams) - 4d of the query's
+      trigrams, so terms sharing fewer are discarded without comparing them
+    - The surviving candidates are verified with a bounded edit distance
+    """
+
+    def __init__(self):
+        self._postings: dict[tuple[str, int], set[str]] = {}
+        self._terms: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms
+
+    def add(self, term: str) -> None:
+        """Add a vocabulary term."""
+        if term in self._terms:
+            return
+        self._terms.add(term)
+        length = len(term)
+        for gram in trigrams(term):
+            self._postings.setdefault((gram, length), set()).add(term)
+
+    def remove(self, term: str) -> None:
+        """Remove a vocabulary term (no-op if absent)."""
+        if term not in self._terms:
+            return
+        self._terms.discard(term)
+        length = len(term)
+        for gram in trigrams(term):
+            postings = self._postings.get((gram, length))
+            if postings is not None:
+                postings.discard(term)
+                if not postings:
+                    del self._postings[(gram, length)]
+
+    def clear(self) -> None:
+        """Remove every term."""
+        self._postings.clear()
+        self._terms.clear()
+
+    def similar(self, term: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Find vocabulary terms within max_distance edits of term.
+
+        Returns:
+            List of (term, distance) tuples, closest first
+        """
+        if max_distance <= 0:
+            return [(term, 0)] if term in self._terms else []
+
+        lengths = range(max(1, len(term) - max_distance), len(term) + max_distance + 1)
+        grams = trigrams(term)
+
+        # Count shared trigrams per candidate (Counter.update runs in C);
+        # very short terms give no useful bound, so require one shared trigram
+        threshold = max(1, len(grams) - _GRAMS_PER_EDIT * max_distance)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            for length in lengths:
+                posting = self._postings.get((gram, length))
+                if posting:
+                    shared.update(posting)
+        candidates = [candidate for candidate, count in shared.items() if count >= threshold]
+
+        matches = []
+        for candidate in candidates:
+            distance = bounded_edit_distance(term, candidate, max_distance)
+            if distance is not None:
+                matches.append((candidate, distance))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
@@ -1,6 +1,24 @@
 """Search provider implementations."""
 
+from chuk_mcp_playbook.search.providers.bm25 import BM25Search
+from chuk_mcp_playbook.search.providers.fuzzy import FuzzySearch
+from chuk_mcp_playbook.search.providers.hybrid import FusionMethod, HybridSearch
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
 from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.search.providers.semantic import SemanticSearch
+from chuk_mcp_playbook.search.providers.sharded import ShardedKeywordSearch
 from chuk_mcp_playbook.search.providers.simple import SimpleSearch
+from chuk_mcp_playbook.search.providers.vectorized import VectorizedKeywordSearch
 
-__all__ = ["KeywordSearch", "SimpleSearch"]
+__all__ = [
+    "BM25Search",
+    "FusionMethod",
+    "FuzzySearch",
+    "HybridSearch",
+    "IndexedSearch",
+    "KeywordSearch",
+    "SemanticSearch",
+    "ShardedKeywordSearch",
+    "SimpleSearch",
+    "VectorizedKeywordSearch",
+]
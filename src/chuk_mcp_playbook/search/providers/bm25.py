@@ -0,0 +1,115 @@
+"""BM25F ranking over the inverted index."""
+
+import math
+from collections import Counter, defaultdict
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS, FIELDS, analyze_playbook
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+
+
+class BM25Search(IndexedSearch):
+    """
+    BM25F search provider.
+
+    Features:
+    - Term frequency saturation (k1) and per-field length normalization (b)
+    - Field boosts derived from the keyword weights (title > tags > description > content)
+    - Document frequencies and field lengths maintained incrementally by the index
+    - Query cost proportional to the keywords' posting lists
+
+    Raw BM25 scores are unbounded; they are mapped to 0.0-1.0 with
+    score / (score + 1), which preserves the ranking.
+    """
+
+    def __init__(
+        self,
+        stop_words: set[str] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_boosts: dict[str, float] | None = None,
+    ):
+        """
+        Initialize BM25F search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            k1: Term frequency saturation parameter
+            b: Length normalization strength (0 = none, 1 = full)
+            field_boosts: Optional per-field boosts. Defaults to the keyword
+                weights scaled so that content has a boost of 1.0.
+        """
+        super().__init__(stop_words=stop_words)
+        self.k1 = k1
+        self.b = b
+        self.field_boosts = field_boosts or {
+            field: weight / FIELD_WEIGHTS["content"] for field, weight in FIELD_WEIGHTS.items()
+        }
+
+    def _idf(self, term: str) -> float:
+        """Inverse document frequency (BM25 variant, always positive)."""
+        num_docs = len(self._index)
+        df = self._index.document_frequency(term)
+        return math.log(1.0 + (num_docs - df + 0.5) / (df + 0.5))
+
+    def _length_norm(self, field: str, length: int) -> float:
+        """Field length normalization factor."""
+        average = self._index.average_length(field)
+        if average <= 0:
+            return 1.0
+        return 1.0 - self.b + self.b * length / average
+
+    def _saturate(self, term: str, weighted_tf: float) -> float:
+        """Combine the field-weighted term frequency into a BM25 term score."""
+        return self._idf(term) * weighted_tf / (self.k1 + weighted_tf)
+
+    def _keywords(self, query: str) -> list[str]:
+        """Deduplicated query keywords."""
+        return list(dict.fromkeys(self._extract_keywords(query)))
+
+    def _keyword_scores(self, keyword: str) -> dict[str, float]:
+        """BM25F contribution of one keyword to every document containing it."""
+        weighted_tf: dict[str, float] = defaultdict(float)
+        for field in FIELDS:
+            boost = self.field_boosts.get(field, 0.0)
+            if not boost:
+                continue
+            lengths = self._index.field_lengths(field)
+            average = self._index.average_length(field)
+            for key, tf in self._index.postings(field, keyword).items():
+                norm = 1.0 - self.b + self.b * lengths[key] / average if average > 0 else 1.0
+                weighted_tf[key] += boost * tf / norm
+
+        return {key: self._saturate(keyword, value) for key, value in weighted_tf.items()}
+
+    def _normalize(self, total: float, num_keywords: int) -> float:
+        """Map an unbounded BM25 score to 0.0-1.0 (order preserving)."""
+        return total / (total + 1.0)
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """
+        Score a single playbook against the indexed corpus statistics.
+
+        Returns:
+            Tuple of (matches, score) where score is 0.0-1.0
+        """
+        keywords = self._keywords(query)
+
+        if not keywords:
+            return (False, 0.0)
+
+        fields = analyze_playbook(playbook)
+        counts = {field: Counter(tokens) for field, tokens in fields.items()}
+
+        total = 0.0
+        for keyword in keywords:
+            weighted_tf = 0.0
+            for field in FIELDS:
+                tf = counts[field].get(keyword, 0)
+                if tf:
+                    norm = self._length_norm(field, len(fields[field]))
+                    weighted_tf += self.field_boosts.get(field, 0.0) * tf / norm
+            if weighted_tf:
+                total += self._saturate(keyword, weighted_tf)
+
+        return (total > 0, total / (total + 1.0))
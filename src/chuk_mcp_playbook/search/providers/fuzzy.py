@@ -0,0 +1,164 @@
+"""Typo-tolerant keyword search over the inverted index."""
+
+from typing import Optional
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS, analyze_playbook
+from chuk_mcp_playbook.search.ngram import TrigramIndex, bounded_edit_distance
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+
+
+class FuzzySearch(IndexedSearch):
+    """
+    Keyword search that tolerates typos in the query.
+
+    Features:
+    - Same weighting as IndexedSearch (title > tags > description > content)
+    - Keywords missing from the vocabulary are expanded to similar terms found
+      through a trigram index, then verified with a bounded edit distance
+    - Adjacent transpositions count as one edit ("sunest" -> "sunset")
+    - Fuzzy matches score less than exact matches
+    - Vocabulary trigrams maintained incrementally as playbooks are added/removed
+    """
+
+    def __init__(
+        self,
+        stop_words: set[str] | None = None,
+        max_distance: Optional[int] = None,
+        min_length: int = 4,
+        max_expansions: int = 10,
+    ):
+        """
+        Initialize fuzzy search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            max_distance: Maximum edits per keyword. Defaults to 1 for keywords
+                shorter than 8 characters and 2 otherwise.
+            min_length: Keywords shorter than this must match exactly
+            max_expansions: Maximum similar terms tried per keyword
+        """
+        super().__init__(stop_words=stop_words)
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.max_expansions = max_expansions
+        self._vocabulary = TrigramIndex()
+
+    def _distance_limit(self, keyword: str) -> int:
+        """Maximum edit distance allowed for a keyword."""
+        if len(keyword) < self.min_length:
+            return 0
+        if self.max_distance is not None:
+            return self.max_distance
+        return 1 if len(keyword) < 8 else 2
+
+    def _similarity(self, keyword: str, distance: int) -> float:
+        """Score multiplier for a match at the given edit distance."""
+        return 1.0 - distance / (len(keyword) + 1)
+
+    def _expand(self, keyword: str) -> list[tuple[str, float]]:
+        """Return (term, multiplier) pairs to look up for a keyword."""
+        if keyword in self._vocabulary:
+            return [(keyword, 1.0)]
+
+        matches = self._vocabulary.similar(keyword, self._distance_limit(keyword))
+        # Prefer the closest, then the most common terms
+        matches.sort(
+            key=lambda match: (match[1], -self._index.document_frequency(match[0]), match[0])
+        )
+        return [
+            (term, self._similarity(keyword, distance))
+            for term, distance in matches[: self.max_expansions]
+        ]
+
+    def _sync_vocabulary(self, terms: set[str]) -> None:
+        """Add or drop terms so the vocabulary mirrors the index."""
+        for term in terms:
+            if self._index.document_frequency(term) > 0:
+                self._vocabulary.add(term)
+            else:
+                self._vocabulary.remove(term)
+
+    def add(self, playbook: Playbook) -> None:
+        """Index a playbook and its vocabulary."""
+        title = playbook.metadata.title
+        previous = self._index.terms(title)
+        self._index.add(title, analyze_playbook(playbook))
+        self._sync_vocabulary(previous | self._index.terms(title))
+
+    def add_many(self, playbooks: list[Playbook]) -> None:
+        """Index many playbooks, syncing the vocabulary once for the batch."""
+        touched: set[str] = set()
+        for playbook in playbooks:
+            title = playbook.metadata.title
+            touched |= self._index.terms(title)
+            self._index.add(title, analyze_playbook(playbook))
+            touched |= self._index.terms(title)
+        self._sync_vocabulary(touched)
+
+    def remove(self, title: str) -> None:
+        """Remove a playbook and any terms only it used."""
+        previous = self._index.terms(title)
+        self._index.remove(title)
+        self._sync_vocabulary(previous)
+
+    def clear(self) -> None:
+        """Clear the index and vocabulary."""
+        self._index.clear()
+        self._vocabulary.clear()
+
+    def _keyword_scores(self, keyword: str) -> dict[str, float]:
+        """Credit each document once per keyword, via its best-scoring variant."""
+        best: dict[str, float] = {}
+        for term, multiplier in self._expand(keyword):
+            for key, value in super()._keyword_scores(term).items():
+                value *= multiplier
+                if value > best.get(key, 0.0):
+                    best[key] = value
+        return best
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """
+        Score a single playbook, comparing keywords against its own words.
+
+        Returns:
+            Tuple of (matches, score) where score is 0.0-1.0
+        """
+        keywords = self._extract_keywords(query)
+
+        if not keywords:
+            return (False, 0.0)
+
+        view = playbook.search_view
+        fields = {
+            "title": view.title_tokens,
+            "tags": view.tag_tokens,
+            "description": view.description_tokens,
+            "content": view.content_tokens,
+        }
+
+        total_score = 0.0
+        for keyword in keywords:
+            # Same rules as the index: a known keyword only matches exactly,
+            # otherwise the best close variant in the playbook counts
+            if keyword in self._vocabulary or not self._distance_limit(keyword):
+                variants = {keyword: 1.0}
+            else:
+                limit = self._distance_limit(keyword)
+                variants = {}
+                for token in set().union(*fields.values()):
+                    distance = bounded_edit_distance(keyword, token, limit)
+                    if distance is not None:
+                        variants[token] = self._similarity(keyword, distance)
+
+            best = 0.0
+            for term, multiplier in variants.items():
+                term_score = sum(
+                    weight for field, weight in FIELD_WEIGHTS.items() if term in fields[field]
+                )
+                best = max(best, multiplier * term_score)
+            total_score += best
+
+        normalized_score = total_score / len(keywords)
+
+        return (normalized_score > 0, min(normalized_score, 1.0))
@@ -0,0 +1,271 @@
+"""Hybrid search fusing the rankings of several indexed providers."""
+
+import heapq
+import pickle
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Optional, TypeVar
+
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.base import IndexedSearchProvider
+from chuk_mcp_playbook.search.providers.bm25 import BM25Search
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+from chuk_mcp_playbook.search.providers.semantic import SemanticSearch
+
+T = TypeVar("T")
+
+
+class FusionMethod(str, Enum):
+    """How HybridSearch combines the sub-provider rankings."""
+
+    RRF = "rrf"  # Reciprocal-rank fusion (scale-free, robust default)
+    WEIGHTED = "weighted"  # Weighted average of the sub-provider scores
+
+
+def _default_providers() -> list[IndexedSearchProvider]:
+    """Keyword index plus a vector index (BM25 when numpy is unavailable)."""
+    try:
+        return [IndexedSearch(), SemanticSearch()]
+    except ImportError:
+        return [IndexedSearch(), BM25Search()]
+
+
+class HybridSearch(IndexedSearchProvider):
+    """
+    Runs several indexed providers concurrently and fuses their rankings.
+
+    Features:
+    - Defaults to keyword (IndexedSearch) + vector (SemanticSearch) retrieval
+    - Each sub-provider only returns a bounded candidate list (candidate_limit)
+    - Reciprocal-rank fusion or weighted score blending
+    - Sub-queries run in parallel threads (the vector path releases the GIL)
+    - Writes are forwarded to every sub-provider's index
+    - close() stops the worker threads and closes sub-providers
+
+    Fused scores are normalized to 0.0-1.0: a playbook ranked first by every
+    provider (RRF) or scoring 1.0 everywhere (weighted) scores 1.0.
+    """
+
+    def __init__(
+        self,
+        providers: Optional[list[IndexedSearchProvider]] = None,
+        weights: Optional[list[float]] = None,
+        fusion: FusionMethod | str = FusionMethod.RRF,
+        rrf_k: int = 60,
+        candidate_limit: int = 50,
+        parallel: bool = True,
+    ):
+        """
+        Initialize hybrid search.
+
+        Args:
+            providers: Indexed providers to fuse. Defaults to IndexedSearch
+                plus SemanticSearch (BM25Search if numpy is missing).
+            weights: Optional per-provider weights (default: equal)
+            fusion: Fusion method ("rrf" or "weighted")
+            rrf_k: Rank offset for reciprocal-rank fusion
+            candidate_limit: Results requested from each provider per query
+            parallel: Query providers concurrently in worker threads
+
+        Raises:
+            ValueError: If a provider is not index-backed, or weights and
+                providers differ in length
+        """
+        self.providers = providers if providers is not None else _default_providers()
+        for provider in self.providers:
+            if not isinstance(provider, IndexedSearchProvider):
+                raise ValueError(
+                    f"HybridSearch needs indexed providers, got {type(provider).__name__}"
+                )
+
+        self.weights = weights or [1.0] * len(self.providers)
+        if len(self.weights) != len(self.providers):
+            raise ValueError("weights must have one entry per provider")
+
+        self.fusion = FusionMethod(fusion)
+        self.rrf_k = rrf_k
+        self.candidate_limit = candidate_limit
+        self.parallel = parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker threads are recreated on demand (e.g. after a snapshot restore)
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        del state["_executor_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Stop the worker threads and close sub-providers that hold resources."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for provider in self.providers:
+            close = getattr(provider, "close", None)
+            if close is not None:
+                close()
+
+    def _run_all(self, calls: list[Callable[[], T]]) -> list[T]:
+        """Run one call per provider, concurrently when enabled."""
+        if not self.parallel or len(calls) < 2:
+            return [call() for call in calls]
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(calls) - 1, thread_name_prefix="hybrid-search"
+                )
+            executor = self._executor
+        futures = [executor.submit(call) for call in calls[1:]]
+        # The calling thread takes the first provider instead of waiting idle
+        first = calls[0]()
+        return [first, *(future.result() for future in futures)]
+
+    def _fuse(self, rankings: list[list[tuple[str, float]]]) -> dict[str, float]:
+        """Combine per-provider rankings into normalized fused scores."""
+        fused: dict[str, float] = defaultdict(float)
+
+        if self.fusion == FusionMethod.RRF:
+            for weight, ranking in zip(self.weights, rankings):
+                for rank, (key, _) in enumerate(ranking, start=1):
+                    fused[key] += weight / (self.rrf_k + rank)
+            best = sum(self.weights) / (self.rrf_k + 1)
+        else:
+            for weight, ranking in zip(self.weights, rankings):
+                for key, score in ranking:
+                    fused[key] += weight * score
+            best = sum(self.weights)
+
+        return {key: min(score / best, 1.0) for key, score in fused.items()}
+
+    def add(self, playbook: Playbook) -> None:
+        """Index a playbook in every provider."""
+        for provider in self.providers:
+            provider.add(playbook)
+
+    def add_many(self, playbooks: list[Playbook]) -> None:
+        """Index many playbooks in every provider."""
+        for provider in self.providers:
+            provider.add_many(playbooks)
+
+    def remove(self, title: str) -> None:
+        """Remove a playbook from every provider."""
+        for provider in self.providers:
+            provider.remove(title)
+
+    def clear(self) -> None:
+        """Clear every provider's index."""
+        for provider in self.providers:
+            provider.clear()
+
+    def export_index(self) -> bytes:
+        """Serialize every provider's index."""
+        indexes = [provider.export_index() for provider in self.providers]
+        return pickle.dumps(indexes, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_index(self, data: bytes) -> None:
+        """Restore every provider's index from export_index()."""
+        for provider, index in zip(self.providers, pickle.loads(data), strict=True):
+            provider.restore_index(index)
+
+    def query_index(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Fuse the bounded rankings of every provider.
+
+        Returns:
+            List of (title, score) tuples, score is 0.0-1.0
+        """
+        return self.query_index_batch([query], top_k=top_k, candidates=candidates)[0]
+
+    def query_index_batch(
+        self,
+        queries: list[str],
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Run each provider's batch query concurrently, then fuse per query.
+
+        Returns:
+            One list of (title, score) tuples per query
+        """
+        if top_k <= 0:
+            return [[] for _ in queries]
+
+        limit = max(top_k, self.candidate_limit)
+        batches = self._run_all(
+            [
+                lambda provider=provider: provider.query_index_batch(
+                    queries, top_k=limit, candidates=candidates
+                )
+                for provider in self.providers
+            ]
+        )
+
+        results = []
+        for rankings in zip(*batches):
+            fused = self._fuse(list(rankings))
+            # Highest score first, ties broken alphabetically for stable results
+            results.append(
+                heapq.nsmallest(top_k, fused.items(), key=lambda item: (-item[1], item[0]))
+            )
+        return results
+
+    def search_with_scores(
+        self, playbooks: Iterable[Playbook], query: str, top_k: int = 3
+    ) -> list[tuple[Playbook, float]]:
+        """
+        Fuse each provider's scan of the given playbooks (no shared index needed).
+
+        Returns:
+            List of (playbook, score) tuples sorted by relevance. Ties keep
+            the input order.
+        """
+        if top_k <= 0:
+            return []
+
+        playbooks = list(playbooks)
+        limit = max(top_k, self.candidate_limit)
+        results = self._run_all(
+            [
+                lambda provider=provider: provider.search_with_scores(playbooks, query, top_k=limit)
+                for provider in self.providers
+            ]
+        )
+
+        by_title = {}
+        rankings = []
+        for ranking in results:
+            rankings.append([(p.metadata.title, score) for p, score in ranking])
+            by_title.update((p.metadata.title, p) for p, _ in ranking)
+
+        fused = self._fuse(rankings)
+        positions = {p.metadata.title: position for position, p in enumerate(playbooks)}
+        top = heapq.nsmallest(top_k, fused.items(), key=lambda item: (-item[1], positions[item[0]]))
+        return [(by_title[title], score) for title, score in top]
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """
+        Weighted average of the providers' scores for a single playbook.
+
+        Returns:
+            Tuple of (matches, score) where score is 0.0-1.0
+        """
+        results = [provider.score(playbook, query) for provider in self.providers]
+        total = sum(weight * score for weight, (_, score) in zip(self.weights, results))
+        matches = any(match for match, _ in results)
+        return (matches, min(total / sum(self.weights), 1.0) if matches else 0.0)
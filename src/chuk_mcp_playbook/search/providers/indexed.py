@@ -0,0 +1,175 @@
+"""Inverted-index keyword search."""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Collection
+from typing import Optional
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.base import IndexedSearchProvider
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS, InvertedIndex, analyze_playbook
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.text import tokenize
+
+
+class IndexedSearch(IndexedSearchProvider):
+    """
+    Keyword search backed by a per-field inverted index.
+
+    Features:
+    - Index maintained incrementally as playbooks are added/removed
+    - Queries only touch the posting lists of the query keywords
+    - Same weighting as KeywordSearch (title > tags > description > content)
+    - Whole-word matching (KeywordSearch matches substrings)
+    """
+
+    def __init__(self, stop_words: set[str] | None = None):
+        """
+        Initialize indexed search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+        """
+        self.stop_words = stop_words or KeywordSearch.STOP_WORDS
+        self._index = InvertedIndex()
+
+    def _extract_keywords(self, query: str) -> list[str]:
+        """Extract meaningful keyword tokens from query."""
+        tokens = tokenize(query)
+
+        keywords = [token for token in tokens if token not in self.stop_words and len(token) > 2]
+
+        # Fallback to all tokens if everything was filtered
+        return keywords or tokens
+
+    def add(self, playbook: Playbook) -> None:
+        """Index a playbook."""
+        self._index.add(playbook.metadata.title, analyze_playbook(playbook))
+
+    def remove(self, title: str) -> None:
+        """Remove a playbook from the index."""
+        self._index.remove(title)
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._index.clear()
+
+    def _keywords(self, query: str) -> list[str]:
+        """Keywords used to query the index."""
+        return self._extract_keywords(query)
+
+    def _keyword_scores(self, keyword: str) -> dict[str, float]:
+        """Score contribution of one keyword to every document containing it."""
+        scores: dict[str, float] = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            for key in self._index.postings(field, keyword):
+                scores[key] += weight
+        return scores
+
+    def _normalize(self, total: float, num_keywords: int) -> float:
+        """Map a document's summed keyword scores to 0.0-1.0."""
+        return min(total / num_keywords, 1.0)
+
+    def _rank(
+        self,
+        keywords: list[str],
+        top_k: int,
+        candidates: Optional[Collection[str]],
+        shared: Optional[dict[str, dict[str, float]]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Sum per-keyword contributions and return the top_k documents.
+
+        Args:
+            shared: Optional cache of _keyword_scores() results, reused across
+                the queries of a batch
+        """
+        if not keywords:
+            return []
+
+        scores: dict[str, float] = defaultdict(float)
+        with METRICS.timer("search.score"):
+            for keyword in keywords:
+                contributions = shared.get(keyword) if shared is not None else None
+                if contributions is None:
+                    contributions = self._keyword_scores(keyword)
+                    if shared is not None:
+                        shared[keyword] = contributions
+                for key, value in contributions.items():
+                    scores[key] += value
+
+            if candidates is not None:
+                scores = {key: value for key, value in scores.items() if key in candidates}
+
+        with METRICS.timer("search.sort"):
+            # Highest score first, ties broken alphabetically for stable results
+            top = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+        num_keywords = len(keywords)
+        return [(key, self._normalize(value, num_keywords)) for key, value in top]
+
+    def query_index(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Score only the documents that appear in the keywords' posting lists.
+
+        Returns:
+            List of (title, score) tuples, score is 0.0-1.0
+        """
+        with METRICS.timer("search.keywords"):
+            keywords = self._keywords(query)
+        return self._rank(keywords, top_k, candidates)
+
+    def query_index_batch(
+        self,
+        queries: list[str],
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Query several questions, looking up each distinct keyword only once.
+
+        Returns:
+            One list of (title, score) tuples per query
+        """
+        with METRICS.timer("search.keywords"):
+            keywords = [self._keywords(query) for query in queries]
+        shared: dict[str, dict[str, float]] = {}
+        return [
+            self._rank(query_keywords, top_k, candidates, shared) for query_keywords in keywords
+        ]
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """
+        Score a single playbook with the same whole-word rules as the index.
+
+        Returns:
+            Tuple of (matches, score) where score is 0.0-1.0
+        """
+        keywords = self._extract_keywords(query)
+
+        if not keywords:
+            return (False, 0.0)
+
+        view = playbook.search_view
+        fields = {
+            "title": view.title_tokens,
+            "tags": view.tag_tokens,
+            "description": view.description_tokens,
+            "content": view.content_tokens,
+        }
+
+        total_score = 0.0
+        for keyword in keywords:
+            for field, weight in FIELD_WEIGHTS.items():
+                if keyword in fields[field]:
+                    total_score += weight
+
+        normalized_score = total_score / len(keywords)
+
+        return (normalized_score > 0, min(normalized_score, 1.0))
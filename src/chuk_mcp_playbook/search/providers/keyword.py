@@ -13,6 +13,7 @@ class KeywordSearch(SearchProvider):
     - Word-based matching
     - Weighted scoring (title > tags > description > content)
     - Normalized scores
+    - Cheap upper bound (skips the content scan for playbooks that cannot rank)
     """
 
     # Common words to filter out from queries
@@ -29,9 +30,15 @@ class KeywordSearch(SearchProvider):
             stop_words: Optional custom set of stop words to filter
         """
         self.stop_words = stop_words or self.STOP_WORDS
+        # Last (query, keywords) pair: search() scores many playbooks per query
+        self._last_keywords: tuple[str, list[str]] = ("", [])
 
     def _extract_keywords(self, query: str) -> list[str]:
         """Extract meaningful keywords from query."""
+        last_query, last_keywords = self._last_keywords
+        if query == last_query and last_keywords:
+            return last_keywords
+
         query_lower = query.lower()
 
         # Extract words, filtering stop words and short words
@@ -44,8 +51,37 @@ class KeywordSearch(SearchProvider):
         if not keywords:
             keywords = query_lower.split()
 
+        self._last_keywords = (query, keywords)
         return keywords
 
+    def max_score(self, playbook: Playbook, query: str) -> float:
+        """
+        Upper bound from the short fields only.
+
+        Title, tags and description are matched exactly; the content scan,
+        the expensive part of score(), is assumed to match every keyword.
+        """
+        keywords = self._extract_keywords(query)
+
+        if not keywords:
+            return 0.0
+
+        view = playbook.search_view
+        total_score = 0.0
+        for keyword in keywords:
+            word_score = 0.1  # Content match assumed
+            if keyword in view.title:
+                word_score += 0.5
+            for tag in view.tags:
+                if keyword in tag:
+                    word_score += 0.3
+                    break
+            if keyword in view.description:
+                word_score += 0.2
+            total_score += word_score
+
+        return min(total_score / len(keywords), 1.0)
+
     def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
         """
         Score playbook using keyword matching.
@@ -59,30 +95,28 @@ class KeywordSearch(SearchProvider):
             return (False, 0.0)
 
         total_score = 0.0
-        title_lower = playbook.metadata.title.lower()
-        desc_lower = playbook.metadata.description.lower()
-        content_lower = playbook.content.lower()
+        view = playbook.search_view
 
         # Check each keyword
         for keyword in keywords:
             word_score = 0.0
 
             # Title match (highest weight - 0.5)
-            if keyword in title_lower:
+            if keyword in view.title:
                 word_score += 0.5
 
             # Tag matches (0.3)
-            for tag in playbook.metadata.tags:
-                if keyword in tag.lower():
+            for tag in view.tags:
+                if keyword in tag:
                     word_score += 0.3
                     break
 
             # Description match (0.2)
-            if keyword in desc_lower:
+            if keyword in view.description:
                 word_score += 0.2
 
             # Content match (lowest weight - 0.1)
-            if keyword in content_lower:
+            if keyword in view.content:
                 word_score += 0.1
 
             total_score += word_score
@@ -0,0 +1,519 @@
+"""Offline vector search over hashed word and character n-gram features."""
+
+import functools
+import math
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Collection
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.base import IndexedSearchProvider
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS, analyze_playbook
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.text import tokenize
+
+# Floats per dense block of the document matrix while fitting (bounds memory)
+_BLOCK_FLOATS = 1 << 22
+
+# Unsorted hashed-space entries tolerated before the postings are rebuilt
+_MIN_TAIL_ENTRIES = 1 << 16
+
+
+@functools.lru_cache(maxsize=65536)
+def _token_features(token: str, n_features: int) -> tuple[tuple[int, float], ...]:
+    """
+    Hash a token and its character trigrams into feature buckets.
+
+    The whole word and its trigrams carry equal vector norm, so inflected or
+    compound forms ("sunsets", "timezones") still overlap with the stem.
+    crc32 is used instead of hash() so buckets are stable across processes.
+    """
+    padded = f"#{token}#"
+    grams = [padded[i : i + 3] for i in range(len(padded) - 2)]
+    gram_weight = 1.0 / math.sqrt(len(grams))
+
+    features = [(zlib.crc32(token.encode()) % n_features, 1.0)]
+    for gram in grams:
+        features.append((zlib.crc32(b"3:" + gram.encode()) % n_features, gram_weight))
+    return tuple(features)
+
+
+class SemanticSearch(IndexedSearchProvider):
+    """
+    CPU-only vector search that needs no model downloads.
+
+    Features:
+    - Hashed word + character trigram features (fixed width, no vocabulary)
+    - Field boosts derived from the keyword weights (title > tags > description > content)
+    - Document vectors computed once at add time. In the hashed space they
+      are stored sparse, as per-bucket postings, so a query only reads the
+      entries of its own buckets; in the latent space they form one
+      contiguous float32 matrix and a query is a matrix-vector product.
+      argpartition selects the top-k.
+    - IDF weighting from document frequencies maintained incrementally
+    - Optional latent semantic projection (randomized truncated SVD) that
+      relates words which co-occur in the corpus, fitted when playbooks are
+      written (and refitted as the corpus grows), never on a query
+
+    Matches partial and inflected words that share no literal keyword with
+    the query. Scores are cosine similarities clipped to 0.0-1.0.
+
+    Requires numpy (pip install 'chuk-mcp-playbook[semantic]').
+    """
+
+    def __init__(
+        self,
+        stop_words: set[str] | None = None,
+        n_features: int = 4096,
+        dimensions: Optional[int] = None,
+        min_score: float = 0.1,
+        field_boosts: dict[str, float] | None = None,
+        refit_growth: float = 2.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize semantic search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            n_features: Number of hashed feature buckets
+            dimensions: Project vectors onto this many latent dimensions
+                (None keeps the hashed feature space)
+            min_score: Minimum similarity for a playbook to match
+            field_boosts: Optional per-field boosts. Defaults to the keyword
+                weights scaled so that content has a boost of 1.0.
+            refit_growth: Refit the projection once the corpus has grown by
+                this factor since the last fit
+            seed: Random seed for the projection
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "SemanticSearch requires numpy: pip install 'chuk-mcp-playbook[semantic]'"
+            )
+
+        self.stop_words = stop_words or KeywordSearch.STOP_WORDS
+        self.n_features = n_features
+        self.dimensions = dimensions
+        self.min_score = min_score
+        self.field_boosts = field_boosts or {
+            field: weight / FIELD_WEIGHTS["content"] for field, weight in FIELD_WEIGHTS.items()
+        }
+        self.refit_growth = refit_growth
+        self.seed = seed
+
+        self._vectors: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._doc_freq = np.zeros(n_features, dtype=np.int32)
+        self._rows: dict[str, int] = {}
+        self._titles: list[str] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._projection: Optional[np.ndarray] = None
+        self._fitted_count = 0
+        self._clear_postings()
+
+    def _clear_postings(self) -> None:
+        """Reset the hashed-space postings."""
+        # Each stored document version gets a slot; rows map to their current slot
+        self._row_slots = np.zeros(16, dtype=np.int32)
+        self._num_slots = 0
+        # Entries sorted by bucket (CSC), plus a tail of recent unsorted entries
+        self._indptr = np.zeros(self.n_features + 1, dtype=np.int64)
+        self._posting_slots = np.zeros(0, dtype=np.int32)
+        self._posting_values = np.zeros(0, dtype=np.float32)
+        self._clear_tail()
+
+    def _clear_tail(self) -> None:
+        """Empty the unsorted tail, releasing its buffers."""
+        self._tail_buckets = np.zeros(0, dtype=np.int32)
+        self._tail_slots = np.zeros(0, dtype=np.int32)
+        self._tail_values = np.zeros(0, dtype=np.float32)
+        self._tail_size = 0
+        # Entries of replaced or removed documents, dropped by the next rebuild
+        self._stale_entries = 0
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _extract_keywords(self, query: str) -> list[str]:
+        """Extract meaningful keyword tokens from query."""
+        tokens = tokenize(query)
+
+        keywords = [token for token in tokens if token not in self.stop_words and len(token) > 2]
+
+        # Fallback to all tokens if everything was filtered
+        return keywords or tokens
+
+    def _hash(self, weights: dict[str, float]) -> tuple[np.ndarray, np.ndarray]:
+        """Accumulate token weights into sparse (buckets, values) arrays."""
+        buckets: dict[int, float] = defaultdict(float)
+        for token, weight in weights.items():
+            for bucket, feature_weight in _token_features(token, self.n_features):
+                buckets[bucket] += weight * feature_weight
+
+        indices = np.fromiter(buckets.keys(), dtype=np.int32, count=len(buckets))
+        values = np.fromiter(buckets.values(), dtype=np.float32, count=len(buckets))
+        return indices, values
+
+    def _document_vector(self, playbook: Playbook) -> tuple[np.ndarray, np.ndarray]:
+        """Sparse, L2-normalized sum of field-boosted log term frequencies."""
+        weights: dict[str, float] = defaultdict(float)
+        for field, tokens in analyze_playbook(playbook).items():
+            boost = self.field_boosts[field]
+            # Saturate per field so long bodies cannot drown out the title
+            for token, tf in Counter(tokens).items():
+                if token not in self.stop_words:
+                    weights[token] += boost * math.log1p(tf)
+
+        indices, values = self._hash(weights)
+        norm = np.linalg.norm(values)
+        if norm > 0:
+            values /= norm
+        return indices, values
+
+    def _idf(self, indices: np.ndarray) -> np.ndarray:
+        """Smoothed inverse document frequency of feature buckets."""
+        num_docs = len(self._titles)
+        return (np.log((1.0 + num_docs) / (1.0 + self._doc_freq[indices])) + 1.0).astype(np.float32)
+
+    def _dense(self, indices: np.ndarray, values: np.ndarray, idf: bool) -> np.ndarray:
+        """Map a sparse vector into the current search space (unit length)."""
+        if idf:
+            values = values * self._idf(indices)
+
+        if self._projection is None:
+            vector = np.zeros(self.n_features, dtype=np.float32)
+            vector[indices] = values
+        else:
+            vector = values @ self._projection[indices]
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def _document_dense(self, indices: np.ndarray, values: np.ndarray) -> np.ndarray:
+        # Documents are IDF-weighted only in the latent space; in the hashed
+        # space the query's IDF weights alone rank shared features
+        return self._dense(indices, values, idf=self._projection is not None)
+
+    def _query_vector(self, query: str) -> Optional[np.ndarray]:
+        """Dense unit query vector, or None if the query has no features."""
+        keywords = self._extract_keywords(query)
+        if not keywords:
+            return None
+        indices, values = self._hash(
+            {token: math.log1p(count) for token, count in Counter(keywords).items()}
+        )
+        return self._dense(indices, values, idf=True)
+
+    def _ensure_capacity(self, num_rows: int, width: int) -> None:
+        """Grow the matrix geometrically so appends are amortized O(1)."""
+        if self._matrix is not None and self._matrix.shape[0] >= num_rows:
+            return
+        capacity = max(num_rows, 16, 2 * (0 if self._matrix is None else self._matrix.shape[0]))
+        matrix = np.zeros((capacity, width), dtype=np.float32)
+        if self._matrix is not None:
+            matrix[: self._matrix.shape[0]] = self._matrix
+        self._matrix = matrix
+
+    def _write_row(self, row: int, title: str) -> None:
+        """Store a document's vector in the current search space."""
+        if self.dimensions is None:
+            self._append_postings(row, *self._vectors[title])
+        elif self._projection is not None:
+            vector = self._document_dense(*self._vectors[title])
+            self._ensure_capacity(row + 1, vector.shape[0])
+            self._matrix[row] = vector
+
+    def _append_postings(self, row: int, indices: np.ndarray, values: np.ndarray) -> None:
+        """Give a row a new slot and append its entries to the unsorted tail."""
+        slot = self._num_slots
+        self._num_slots += 1
+        if row >= len(self._row_slots):
+            self._row_slots = np.concatenate([self._row_slots, np.zeros_like(self._row_slots)])
+        self._row_slots[row] = slot
+
+        start, end = self._tail_size, self._tail_size + len(indices)
+        if end > len(self._tail_values):
+            # Grow geometrically so appends are amortized O(1)
+            capacity = max(end, 1024, 2 * len(self._tail_values))
+            for name in ("_tail_buckets", "_tail_slots", "_tail_values"):
+                grown = np.zeros(capacity, dtype=getattr(self, name).dtype)
+                grown[:start] = getattr(self, name)[:start]
+                setattr(self, name, grown)
+        self._tail_buckets[start:end] = indices
+        self._tail_slots[start:end] = slot
+        self._tail_values[start:end] = values
+        self._tail_size = end
+
+    def _refresh_postings(self) -> None:
+        """Rebuild the sorted postings once the tail or stale entries have grown."""
+        if self.dimensions is not None:
+            return
+        live = len(self._posting_values) - self._stale_entries
+        if self._tail_size + self._stale_entries <= max(_MIN_TAIL_ENTRIES, live // 4):
+            return
+
+        # Rebuilt from the stored vectors: slot i is row i again
+        vectors = [self._vectors[title] for title in self._titles]
+        lengths = np.fromiter((len(indices) for indices, _ in vectors), dtype=np.int64)
+        num_docs = len(vectors)
+        buckets = np.concatenate([np.zeros(0, dtype=np.int32), *(i for i, _ in vectors)])
+        values = np.concatenate([np.zeros(0, dtype=np.float32), *(v for _, v in vectors)])
+        slots = np.repeat(np.arange(num_docs, dtype=np.int32), lengths)
+        order = np.argsort(buckets, kind="stable")
+
+        self._indptr = np.zeros(self.n_features + 1, dtype=np.int64)
+        np.cumsum(np.bincount(buckets, minlength=self.n_features), out=self._indptr[1:])
+        self._posting_slots = slots[order]
+        self._posting_values = values[order]
+        self._row_slots = np.arange(max(16, num_docs), dtype=np.int32)
+        self._num_slots = num_docs
+        self._clear_tail()
+
+    def _sparse_scores(self, query_vector: np.ndarray) -> np.ndarray:
+        """Dot products of every row's hashed-space vector with a dense query vector."""
+        buckets = np.flatnonzero(query_vector)
+        starts = self._indptr[buckets]
+        lengths = self._indptr[buckets + 1] - starts
+        # Positions of all postings of the query's buckets
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(len(offsets))
+        slot_scores = np.zeros(self._num_slots)
+        slot_scores += np.bincount(
+            self._posting_slots[positions],
+            weights=self._posting_values[positions] * np.repeat(query_vector[buckets], lengths),
+            minlength=self._num_slots,
+        )
+
+        if self._tail_size:
+            weights = query_vector[self._tail_buckets[: self._tail_size]]
+            hits = np.flatnonzero(weights)
+            slot_scores += np.bincount(
+                self._tail_slots[hits],
+                weights=self._tail_values[hits] * weights[hits],
+                minlength=self._num_slots,
+            )
+        return slot_scores[self._row_slots[: len(self._titles)]]
+
+    def _document_blocks(self):
+        """Yield (first_row, block) dense row blocks of the IDF-weighted document matrix."""
+        block_rows = max(1, _BLOCK_FLOATS // self.n_features)
+        for start in range(0, len(self._titles), block_rows):
+            titles = self._titles[start : start + block_rows]
+            block = np.zeros((len(titles), self.n_features), dtype=np.float32)
+            for offset, title in enumerate(titles):
+                indices, values = self._vectors[title]
+                block[offset, indices] = values * self._idf(indices)
+            yield start, block
+
+    def _fit_projection(self) -> None:
+        """Fit a truncated SVD of the IDF-weighted document matrix and reproject."""
+        num_docs = len(self._titles)
+
+        def matmul(dense):
+            out = np.empty((num_docs, dense.shape[1]), dtype=np.float32)
+            for start, block in self._document_blocks():
+                out[start : start + len(block)] = block @ dense
+            return out
+
+        def rmatmul(dense):
+            out = np.zeros((self.n_features, dense.shape[1]), dtype=np.float32)
+            for start, block in self._document_blocks():
+                out += block.T @ dense[start : start + len(block)]
+            return out
+
+        # Randomized range finder with power iterations (Halko et al.)
+        rank = min(self.dimensions, num_docs, self.n_features)
+        width = min(rank + 10, num_docs, self.n_features)
+        rng = np.random.default_rng(self.seed)
+        sample = matmul(rng.standard_normal((self.n_features, width)).astype(np.float32))
+        for _ in range(2):
+            basis, _ = np.linalg.qr(sample)
+            basis, _ = np.linalg.qr(rmatmul(basis))
+            sample = matmul(basis)
+        basis, _ = np.linalg.qr(sample)
+        _, _, vt = np.linalg.svd(rmatmul(basis).T, full_matrices=False)
+
+        self._projection = np.ascontiguousarray(vt[:rank].T, dtype=np.float32)
+        self._fitted_count = num_docs
+
+        projected = matmul(self._projection)
+        norms = np.linalg.norm(projected, axis=1, keepdims=True)
+        projected /= np.where(norms > 0, norms, 1.0)
+        self._matrix = None
+        self._ensure_capacity(num_docs, rank)
+        self._matrix[:num_docs] = projected
+
+    def _refresh_projection(self) -> None:
+        """Fit the projection on the first write and again as the corpus grows."""
+        if self.dimensions is None or not self._titles:
+            return
+        if self._projection is None or len(self._titles) >= self._fitted_count * self.refit_growth:
+            self._fit_projection()
+
+    def _add(self, playbook: Playbook) -> None:
+        title = playbook.metadata.title
+        indices, values = self._document_vector(playbook)
+
+        previous = self._vectors.get(title)
+        if previous is not None:
+            self._doc_freq[previous[0]] -= 1
+            self._stale_entries += len(previous[0])
+        self._vectors[title] = (indices, values)
+        self._doc_freq[indices] += 1
+
+        row = self._rows.get(title)
+        if row is None:
+            row = len(self._titles)
+            self._rows[title] = row
+            self._titles.append(title)
+        self._write_row(row, title)
+
+    def add(self, playbook: Playbook) -> None:
+        """Vectorize and index a playbook (fitting the projection when due)."""
+        self._add(playbook)
+        self._refresh_postings()
+        self._refresh_projection()
+
+    def add_many(self, playbooks: list[Playbook]) -> None:
+        """Vectorize and index many playbooks, growing the matrix and fitting once."""
+        new_titles = {p.metadata.title for p in playbooks if p.metadata.title not in self._rows}
+        if self._matrix is not None and new_titles:
+            self._ensure_capacity(len(self._titles) + len(new_titles), self._matrix.shape[1])
+        for playbook in playbooks:
+            self._add(playbook)
+        self._refresh_postings()
+        self._refresh_projection()
+
+    def remove(self, title: str) -> None:
+        """Remove a playbook, moving the last row into its slot."""
+        row = self._rows.pop(title, None)
+        if row is None:
+            return
+        indices, _ = self._vectors.pop(title)
+        self._doc_freq[indices] -= 1
+        self._stale_entries += len(indices)
+
+        last = len(self._titles) - 1
+        if row != last:
+            moved = self._titles[last]
+            self._titles[row] = moved
+            self._rows[moved] = row
+            self._row_slots[row] = self._row_slots[last]
+            if self._matrix is not None:
+                self._matrix[row] = self._matrix[last]
+        self._titles.pop()
+        self._refresh_postings()
+
+    def clear(self) -> None:
+        """Clear all vectors and the projection."""
+        self._vectors.clear()
+        self._doc_freq[:] = 0
+        self._rows.clear()
+        self._titles.clear()
+        self._matrix = None
+        self._projection = None
+        self._fitted_count = 0
+        self._clear_postings()
+
+    def query_index(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank documents by cosine similarity to the query vector.
+
+        Returns:
+            List of (title, score) tuples, score is 0.0-1.0
+        """
+        return self.query_index_batch([query], top_k=top_k, candidates=candidates)[0]
+
+    def query_index_batch(
+        self,
+        queries: list[str],
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Rank documents for several queries with one matrix-matrix product.
+
+        Returns:
+            One list of (title, score) tuples per query
+        """
+        if not self._titles or top_k <= 0:
+            return [[] for _ in queries]
+
+        with METRICS.timer("search.keywords"):
+            vectors = [self._query_vector(query) for query in queries]
+        present = [vector for vector in vectors if vector is not None]
+        if not present:
+            return [[] for _ in queries]
+
+        rows = None
+        if candidates is not None:
+            rows = np.fromiter(
+                (self._rows[title] for title in candidates if title in self._rows), dtype=np.intp
+            )
+            if not len(rows):
+                return [[] for _ in queries]
+
+        with METRICS.timer("search.score"):
+            if self.dimensions is None:
+                scores = (self._sparse_scores(vector) for vector in present)
+                all_scores = iter([found if rows is None else found[rows] for found in scores])
+            else:
+                matrix = self._matrix[: len(self._titles)] if rows is None else self._matrix[rows]
+                # (documents x dims) @ (dims x queries): one pass over the matrix for the batch
+                all_scores = iter((matrix @ np.stack(present, axis=1)).T)
+        with METRICS.timer("search.sort"):
+            return [
+                self._top(next(all_scores), rows, top_k) if vector is not None else []
+                for vector in vectors
+            ]
+
+    def _top(
+        self, scores: np.ndarray, rows: Optional[np.ndarray], top_k: int
+    ) -> list[tuple[str, float]]:
+        """Select the top_k scores above min_score as (title, score) tuples."""
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+
+        results = []
+        for position in top:
+            score = float(scores[position])
+            if score >= self.min_score:
+                row = int(rows[position]) if rows is not None else int(position)
+                results.append((self._titles[row], min(score, 1.0)))
+
+        # Highest score first, ties broken alphabetically for stable results
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """
+        Score a single playbook against the query in the current vector space.
+
+        Returns:
+            Tuple of (matches, score) where score is 0.0-1.0
+        """
+        query_vector = self._query_vector(query)
+        if query_vector is None:
+            return (False, 0.0)
+
+        similarity = float(self._document_dense(*self._document_vector(playbook)) @ query_vector)
+        similarity = min(max(similarity, 0.0), 1.0)
+        return (similarity >= self.min_score, similarity)
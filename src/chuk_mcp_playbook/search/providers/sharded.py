@@ -0,0 +1,276 @@
+"""Vectorized keyword search partitioned across worker processes."""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from chuk_mcp_playbook.search.providers.vectorized import VectorizedKeywordSearch, _Shard
+
+# Array layout of a shard segment: (name, dtype, offset, length)
+Layout = list[tuple[str, str, int, int]]
+
+# Shards attached by this worker process: shard index -> (segment name, segment, shard)
+_ATTACHED: dict[int, tuple[str, SharedMemory, _Shard]] = {}
+
+# Providers not yet closed in this process
+_OPEN: "weakref.WeakSet[ShardedKeywordSearch]" = weakref.WeakSet()
+
+
+def _views(buffer, layout: Layout) -> dict[str, "np.ndarray"]:
+    return {
+        name: np.frombuffer(buffer, dtype=dtype, count=length, offset=offset)
+        for name, dtype, offset, length in layout
+    }
+
+
+def _detach(index: int) -> None:
+    """Unmap a shard from this worker (its views must be dropped first)."""
+    segment = _ATTACHED.pop(index)[1]
+    segment.close()
+
+
+def _detach_all() -> None:
+    for index in list(_ATTACHED):
+        _detach(index)
+
+
+def _init_worker() -> None:
+    # Unmap before interpreter teardown, while shard views can still be dropped
+    atexit.register(_detach_all)
+
+
+def _attach(index: int, name: str, layout: Layout) -> _Shard:
+    """Map a shard segment into this worker, dropping the previous version."""
+    attached = _ATTACHED.get(index)
+    if attached is not None and attached[0] == name:
+        return attached[2]
+
+    if attached is not None:
+        del attached
+        _detach(index)
+
+    segment = SharedMemory(name=name)
+    shard = _Shard.from_arrays(_views(segment.buf, layout))
+    _ATTACHED[index] = (name, segment, shard)
+    return shard
+
+
+def _score_shard(
+    index: int,
+    name: str,
+    layout: Layout,
+    keyword_lists: list[list[str]],
+    top_k: int,
+    allowed: Optional["np.ndarray"],
+) -> list[tuple["np.ndarray", "np.ndarray"]]:
+    """Worker entry point: local top_k of one shard for each query."""
+    return _attach(index, name, layout).top(keyword_lists, top_k, allowed)
+
+
+class _Resources:
+    """Worker pool and shared memory segments, released when the provider is collected."""
+
+    def __init__(self, num_shards: int):
+        self.pool: Optional[ProcessPoolExecutor] = None
+        # Concurrent first queries must not each start a pool
+        self.pool_lock = threading.Lock()
+        self.segments: list[Optional[SharedMemory]] = [None] * num_shards
+        # Unlinked segments whose views may still be referenced
+        self.retired: list[SharedMemory] = []
+
+    def replace(self, index: int, segment: Optional[SharedMemory]) -> None:
+        """Install a shard's new segment and retire the previous one."""
+        old = self.segments[index]
+        self.segments[index] = segment
+        if old is not None:
+            old.unlink()
+            self.retired.append(old)
+        self.release_retired()
+
+    def release_retired(self) -> None:
+        """Unmap retired segments that no shard views any more."""
+        still_viewed = []
+        for segment in self.retired:
+            try:
+                segment.close()
+            except BufferError:
+                still_viewed.append(segment)
+        self.retired = still_viewed
+
+    def close(self) -> None:
+        with self.pool_lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        for index in range(len(self.segments)):
+            self.replace(index, None)
+
+
+def _close_open() -> None:
+    # Shard views must be dropped before their segments can be unmapped
+    for provider in list(_OPEN):
+        provider.close()
+
+
+atexit.register(_close_open)
+
+
+class ShardedKeywordSearch(VectorizedKeywordSearch):
+    """
+    Vectorized keyword search with the corpus split across processes.
+
+    Features:
+    - Same results as KeywordSearch and VectorizedKeywordSearch
+    - Every merge publishes the rebuilt shards to shared memory; worker
+      processes map them read-only instead of receiving copies
+    - Each worker scores one shard and returns its local top_k; the main
+      process merges them, so scoring uses one core per shard
+    - Removals flip a liveness flag in shared memory (no republish)
+    - Picklable: a copy publishes its own segments and starts its own pool
+    - Providers still open at interpreter exit are closed
+
+    The calling thread waits while the workers score, so callers on an
+    event loop should run queries in a thread.
+
+    Requires numpy (pip install 'chuk-mcp-playbook[semantic]').
+    """
+
+    def __init__(
+        self,
+        stop_words: set[str] | None = None,
+        workers: Optional[int] = None,
+        merge_threshold: int = 1024,
+        merge_ratio: float = 0.05,
+    ):
+        """
+        Initialize sharded keyword search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            workers: Worker processes and shards (default: CPU count)
+            merge_threshold: Buffered writes always tolerated before a merge
+            merge_ratio: Also tolerate buffered writes up to this fraction of
+                the indexed documents before merging
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        self.num_shards = workers or os.cpu_count() or 1
+        self._open_resources()
+        super().__init__(
+            stop_words=stop_words, merge_threshold=merge_threshold, merge_ratio=merge_ratio
+        )
+
+    def __getstate__(self) -> dict:
+        # The pool, segments and finalizer belong to this process; shards pickle as arrays
+        state = self.__dict__.copy()
+        for name in ("_resources", "_layouts", "_finalizer"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._open_resources()
+        self._republish()
+
+    def restore_index(self, data: bytes) -> None:
+        """Replace the index with one from export_index(), keeping this provider's pool."""
+        super().restore_index(data)
+        self._republish()
+
+    def _republish(self) -> None:
+        """Publish every shard to this process's shared memory."""
+        self._shards = [self._publish(index, shard) for index, shard in enumerate(self._shards)]
+
+    def _open_resources(self) -> None:
+        """Set up the (lazily started) pool and segment bookkeeping."""
+        self._resources = _Resources(self.num_shards)
+        self._layouts: list[Layout] = [[] for _ in range(self.num_shards)]
+        self._finalizer = weakref.finalize(self, self._resources.close)
+        # Closed by _close_open instead, while the shard views can still be dropped
+        self._finalizer.atexit = False
+        _OPEN.add(self)
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory (empties the index)."""
+        _OPEN.discard(self)
+        self.clear()
+        self._finalizer()
+
+    def _publish(self, index: int, shard: _Shard) -> _Shard:
+        """Copy a rebuilt shard into a new shared memory segment."""
+        if not len(shard):
+            self._resources.replace(index, None)
+            self._layouts[index] = []
+            return shard
+
+        arrays = shard.arrays()
+        layout: Layout = []
+        offset = 0
+        for name, array in arrays.items():
+            layout.append((name, array.dtype.str, offset, len(array)))
+            # Keep every array 8-byte aligned
+            offset += -(-array.nbytes // 8) * 8
+
+        segment = SharedMemory(create=True, size=max(offset, 1))
+        views = _views(segment.buf, layout)
+        for name, array in arrays.items():
+            target = views[name]
+            target.flags.writeable = True
+            target[:] = array
+        # Only the liveness flags change after publishing (on removal)
+        for name, view in views.items():
+            view.flags.writeable = name == "alive"
+
+        self._resources.replace(index, segment)
+        self._layouts[index] = layout
+        return _Shard.from_arrays(views)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        resources = self._resources
+        with resources.pool_lock:
+            if resources.pool is None:
+                resources.pool = ProcessPoolExecutor(
+                    max_workers=self.num_shards,
+                    # Forking a process that runs event loop threads is unsafe
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return resources.pool
+
+    def _score_shards(
+        self,
+        keyword_lists: list[list[str]],
+        top_k: int,
+        allowed: list[Optional["np.ndarray"]],
+    ) -> list[list[tuple["np.ndarray", "np.ndarray"]]]:
+        """Score every non-empty shard in a worker process."""
+        futures = {}
+        for index, shard in enumerate(self._shards):
+            if len(shard):
+                segment = self._resources.segments[index]
+                futures[index] = self._pool().submit(
+                    _score_shard,
+                    index,
+                    segment.name,
+                    self._layouts[index],
+                    keyword_lists,
+                    top_k,
+                    allowed[index],
+                )
+
+        empty = [(np.zeros(0, dtype=np.int64), np.zeros(0)) for _ in keyword_lists]
+        return [
+            futures[index].result() if index in futures else empty
+            for index in range(len(self._shards))
+        ]
@@ -23,24 +23,25 @@ class SimpleSearch(SearchProvider):
             Tuple of (matches, score) where score is 0.0-1.0
         """
         query_lower = query.lower()
+        view = playbook.search_view
         score = 0.0
 
         # Title match (highest weight)
-        if query_lower in playbook.metadata.title.lower():
+        if query_lower in view.title:
             score += 0.5
 
         # Tag matches
-        for tag in playbook.metadata.tags:
-            if query_lower in tag.lower():
+        for tag in view.tags:
+            if query_lower in tag:
                 score += 0.3
                 break
 
         # Description match
-        if query_lower in playbook.metadata.description.lower():
+        if query_lower in view.description:
             score += 0.2
 
         # Content match (lowest weight)
-        if query_lower in playbook.content.lower():
+        if query_lower in view.content:
             score += 0.1
 
         return (score > 0, min(score, 1.0))
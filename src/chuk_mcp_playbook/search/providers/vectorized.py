@@ -0,0 +1,498 @@
+"""Keyword search scored with NumPy over per-field term-by-document matrices."""
+
+import heapq
+import itertools
+import re
+from collections.abc import Collection
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.search.base import IndexedSearchProvider
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+
+# Fields in the order KeywordSearch.score() adds their weights
+_FIELDS = ("title", "tags", "description", "content")
+_WEIGHTS = tuple(FIELD_WEIGHTS[field] for field in _FIELDS)
+
+
+def _field_texts(playbook: Playbook) -> tuple[str, str, str, str]:
+    """
+    Lowercased title, tags, description and content.
+
+    Tags are joined with newlines: keywords never contain whitespace, so a
+    keyword occurs in the joined string exactly when it occurs in some tag.
+    """
+    metadata = playbook.metadata
+    return (
+        metadata.title.lower(),
+        "\n".join(tag.lower() for tag in metadata.tags),
+        metadata.description.lower(),
+        playbook.content.lower(),
+    )
+
+
+def _score_texts(keywords: list[str], texts: tuple[str, str, str, str]) -> float:
+    """KeywordSearch.score() over pre-lowercased field texts."""
+    total_score = 0.0
+    for keyword in keywords:
+        word_score = 0.0
+        for text, weight in zip(texts, _WEIGHTS):
+            if keyword in text:
+                word_score += weight
+        total_score += word_score
+    return min(total_score / len(keywords), 1.0)
+
+
+def _top_k(scores: "np.ndarray", positions: "np.ndarray", top_k: int) -> "np.ndarray":
+    """Indices of the top_k scores, highest first and ties by lowest position."""
+    selected = np.arange(len(scores))
+    if len(scores) > top_k:
+        # k-th best score; ties at the cut keep the earliest positions
+        cutoff = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)
+        tied = tied[np.argsort(positions[tied], kind="stable")[: top_k - len(above)]]
+        selected = np.concatenate([above, tied])
+    return selected[np.lexsort((positions[selected], -scores[selected]))]
+
+
+class _FieldMatrix:
+    """
+    CSR term-by-document matrix of one field.
+
+    Terms are the distinct whitespace-delimited chunks of the field, stored
+    as newline-joined UTF-8. A keyword (which never contains whitespace) is
+    a substring of the field exactly when it is a substring of one of its
+    chunks, so substring matching reduces to finding the matching chunks in
+    the vocabulary and gathering their rows.
+    """
+
+    __slots__ = ("vocabulary", "starts", "indptr", "indices")
+
+    ARRAYS = (
+        ("vocabulary", "uint8"),
+        ("starts", "int64"),
+        ("indptr", "int64"),
+        ("indices", "int32"),
+    )
+
+    def __init__(self):
+        self.vocabulary = np.zeros(0, dtype=np.uint8)
+        self.starts = np.zeros(0, dtype=np.int64)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+
+    def documents(self, keyword: str) -> "np.ndarray":
+        """Columns of the documents whose field contains keyword (may repeat)."""
+        pattern = re.escape(keyword.encode("utf-8"))
+        positions = [match.start() for match in re.finditer(pattern, self.vocabulary)]
+        if not positions:
+            return self.indices[:0]
+
+        rows = np.unique(np.searchsorted(self.starts, positions, side="right") - 1)
+        lower = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - lower
+        # Gather the rows' slices of indices without a Python loop
+        ends = np.cumsum(lengths)
+        offsets = np.repeat(lower - (ends - lengths), lengths) + np.arange(ends[-1])
+        return self.indices[offsets]
+
+    def merged(self, remap: "np.ndarray", texts: list[str], first_column: int) -> "_FieldMatrix":
+        """
+        Build a new matrix from the live columns and appended documents.
+
+        Args:
+            remap: New column of every current column (-1 drops the column)
+            texts: Field texts of the appended documents
+            first_column: Column of the first appended document
+        """
+        vocabulary = bytes(self.vocabulary)
+        terms = vocabulary.split(b"\n") if vocabulary else []
+        term_ids = {term: row for row, term in enumerate(terms)}
+
+        rows = np.repeat(np.arange(len(terms), dtype=np.int64), np.diff(self.indptr))
+        columns = remap[self.indices]
+        live = columns >= 0
+        rows, columns = rows[live], columns[live]
+
+        new_rows: list[int] = []
+        new_columns: list[int] = []
+        for column, text in enumerate(texts, start=first_column):
+            for term in set(text.encode("utf-8").split()):
+                row = term_ids.get(term)
+                if row is None:
+                    row = term_ids[term] = len(terms)
+                    terms.append(term)
+                new_rows.append(row)
+                new_columns.append(column)
+
+        rows = np.concatenate([rows, np.array(new_rows, dtype=np.int64)])
+        columns = np.concatenate([columns, np.array(new_columns, dtype=np.int64)])
+
+        # Drop terms no live document uses any more
+        counts = np.bincount(rows, minlength=len(terms))
+        used = counts > 0
+        order = np.argsort(rows, kind="stable")
+
+        matrix = _FieldMatrix()
+        kept = list(itertools.compress(terms, used.tolist()))
+        matrix.vocabulary = np.frombuffer(b"\n".join(kept), dtype=np.uint8)
+        lengths = np.fromiter(map(len, kept), dtype=np.int64, count=len(kept))
+        matrix.starts = np.concatenate([[0], np.cumsum(lengths + 1)[:-1]]).astype(np.int64)
+        matrix.indptr = np.concatenate([[0], np.cumsum(counts[used])]).astype(np.int64)
+        matrix.indices = columns[order].astype(np.int32)
+        return matrix
+
+
+class _Shard:
+    """
+    A slice of the corpus: one matrix per field plus the rank position and
+    liveness flag of every column.
+
+    All state is held in NumPy arrays, so a shard can be placed in shared
+    memory and scored by another process (see ShardedKeywordSearch).
+    """
+
+    __slots__ = ("matrices", "positions", "alive")
+
+    def __init__(self):
+        self.matrices = {field: _FieldMatrix() for field in _FIELDS}
+        self.positions = np.zeros(0, dtype=np.int64)
+        self.alive = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def arrays(self) -> dict[str, "np.ndarray"]:
+        """Every array of the shard by a flat name."""
+        arrays = {"positions": self.positions, "alive": self.alive}
+        for field, matrix in self.matrices.items():
+            for name, _ in _FieldMatrix.ARRAYS:
+                arrays[f"{field}.{name}"] = getattr(matrix, name)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, "np.ndarray"]) -> "_Shard":
+        """Rebuild a shard from arrays() output (e.g. views into shared memory)."""
+        shard = cls()
+        shard.positions = arrays["positions"]
+        shard.alive = arrays["alive"]
+        for field, matrix in shard.matrices.items():
+            for name, _ in _FieldMatrix.ARRAYS:
+                setattr(matrix, name, arrays[f"{field}.{name}"])
+        return shard
+
+    def merged(self, texts: list[tuple[str, str, str, str]], positions: list[int]) -> "_Shard":
+        """New shard without the removed columns and with documents appended."""
+        keep = np.flatnonzero(self.alive)
+        remap = np.full(len(self), -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+
+        shard = _Shard()
+        for index, field in enumerate(_FIELDS):
+            field_texts = [document[index] for document in texts]
+            shard.matrices[field] = self.matrices[field].merged(remap, field_texts, len(keep))
+        shard.positions = np.concatenate(
+            [self.positions[keep], np.array(positions, dtype=np.int64)]
+        )
+        shard.alive = np.ones(len(shard.positions), dtype=bool)
+        return shard
+
+    def keyword_scores(self, keyword: str) -> "np.ndarray":
+        """Un-normalized score of one keyword for every column."""
+        word_scores = np.zeros(len(self))
+        hits = np.zeros(len(self), dtype=bool)
+        for field, weight in zip(_FIELDS, _WEIGHTS):
+            hits[:] = False
+            hits[self.matrices[field].documents(keyword)] = True
+            # Same additions in the same order as KeywordSearch.score()
+            np.add(word_scores, weight, out=word_scores, where=hits)
+        return word_scores
+
+    def top(
+        self,
+        keyword_lists: list[list[str]],
+        top_k: int,
+        allowed: Optional["np.ndarray"] = None,
+    ) -> list[tuple["np.ndarray", "np.ndarray"]]:
+        """
+        Local top_k of each query, sharing keyword vectors across the batch.
+
+        Args:
+            keyword_lists: Extracted keywords of each query
+            top_k: Maximum number of results per query
+            allowed: Optional columns to restrict results to
+
+        Returns:
+            One (columns, scores) pair per query, best first
+        """
+        mask = self.alive
+        if allowed is not None:
+            mask = np.zeros(len(self), dtype=bool)
+            mask[allowed] = True
+            mask &= self.alive
+
+        shared: dict[str, np.ndarray] = {}
+        results = []
+        for keywords in keyword_lists:
+            if not keywords or top_k <= 0 or not len(self):
+                results.append((np.zeros(0, dtype=np.int64), np.zeros(0)))
+                continue
+
+            total_scores = np.zeros(len(self))
+            for keyword in keywords:
+                word_scores = shared.get(keyword)
+                if word_scores is None:
+                    word_scores = shared[keyword] = self.keyword_scores(keyword)
+                total_scores += word_scores
+            scores = np.minimum(total_scores / len(keywords), 1.0)
+
+            columns = np.flatnonzero(mask & (scores > 0))
+            order = _top_k(scores[columns], self.positions[columns], top_k)
+            results.append((columns[order], scores[columns[order]]))
+        return results
+
+
+class VectorizedKeywordSearch(IndexedSearchProvider):
+    """
+    Keyword search evaluated over the whole corpus with NumPy.
+
+    Features:
+    - Same keywords, substring matching, field weights, keyword-count
+      normalization and tie order as KeywordSearch (identical results)
+    - Per-field CSR term-by-document matrices: a keyword becomes a few
+      row gathers and a weighted sum over a score vector
+    - Per-keyword score vectors shared across the queries of a batch
+    - Writes are buffered and scored in Python until enough accumulate,
+      then merged into the matrices in one pass (at write time, so queries
+      never modify the index and may run concurrently)
+
+    Requires numpy (pip install 'chuk-mcp-playbook[semantic]').
+    """
+
+    # Number of corpus shards (subclasses score shards in parallel)
+    num_shards = 1
+
+    def __init__(
+        self,
+        stop_words: set[str] | None = None,
+        merge_threshold: int = 1024,
+        merge_ratio: float = 0.05,
+    ):
+        """
+        Initialize vectorized keyword search.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            merge_threshold: Buffered writes always tolerated before a merge
+            merge_ratio: Also tolerate buffered writes up to this fraction of
+                the indexed documents before merging
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                f"{type(self).__name__} requires numpy: pip install 'chuk-mcp-playbook[semantic]'"
+            )
+
+        self._keyword = KeywordSearch(stop_words)
+        self.stop_words = self._keyword.stop_words
+        self.merge_threshold = merge_threshold
+        self.merge_ratio = merge_ratio
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._locations) + len(self._pending)
+
+    def score(self, playbook: Playbook, query: str) -> tuple[bool, float]:
+        """Score a single playbook (delegates to KeywordSearch)."""
+        return self._keyword.score(playbook, query)
+
+    def max_score(self, playbook: Playbook, query: str) -> float:
+        """Upper bound for a single playbook (delegates to KeywordSearch)."""
+        return self._keyword.max_score(playbook, query)
+
+    def add(self, playbook: Playbook) -> None:
+        """Buffer a playbook, keeping the rank position of a replaced version."""
+        self._buffer(playbook)
+        self._refresh()
+
+    def add_many(self, playbooks: list[Playbook]) -> None:
+        """Buffer many playbooks, merging at most once for the batch."""
+        for playbook in playbooks:
+            self._buffer(playbook)
+        self._refresh()
+
+    def remove(self, title: str) -> None:
+        """Remove a playbook from the index by title."""
+        self._release(title)
+        self._refresh()
+
+    def clear(self) -> None:
+        """Remove all playbooks from the index."""
+        self._shards = [self._publish(index, _Shard()) for index in range(self.num_shards)]
+        self._titles: list[list[str]] = [[] for _ in range(self.num_shards)]
+        self._locations: dict[str, tuple[int, int]] = {}
+        self._pending: dict[str, tuple[int, tuple[str, str, str, str]]] = {}
+        self._next_position = 0
+
+    def _publish(self, index: int, shard: _Shard) -> _Shard:
+        """Hook called with every rebuilt shard; returns the shard to keep."""
+        return shard
+
+    def _buffer(self, playbook: Playbook) -> None:
+        """Add a playbook to the write buffer."""
+        title = playbook.metadata.title
+        position = self._release(title)
+        if position is None:
+            position = self._next_position
+            self._next_position += 1
+        self._pending[title] = (position, _field_texts(playbook))
+
+    def _release(self, title: str) -> Optional[int]:
+        """Drop a playbook's buffered entry or matrix column; return its position."""
+        pending = self._pending.pop(title, None)
+        if pending is not None:
+            return pending[0]
+        location = self._locations.pop(title, None)
+        if location is None:
+            return None
+        shard = self._shards[location[0]]
+        shard.alive[location[1]] = False
+        return int(shard.positions[location[1]])
+
+    def _refresh(self) -> None:
+        """Merge buffered writes (and drop removed columns) once they add up."""
+        live = len(self._locations)
+        dead = sum(len(shard) for shard in self._shards) - live
+        if len(self._pending) > max(self.merge_threshold, self.merge_ratio * live) or dead > max(
+            self.merge_threshold, live
+        ):
+            self._merge()
+
+    def _merge(self) -> None:
+        # Buffered playbooks go to the shards with the fewest live columns
+        sizes = [(int(shard.alive.sum()), index) for index, shard in enumerate(self._shards)]
+        heapq.heapify(sizes)
+        assigned: list[list[tuple[str, tuple[int, tuple[str, str, str, str]]]]] = [
+            [] for _ in self._shards
+        ]
+        for item in self._pending.items():
+            size, index = heapq.heappop(sizes)
+            assigned[index].append(item)
+            heapq.heappush(sizes, (size + 1, index))
+
+        for index, shard in enumerate(self._shards):
+            items = assigned[index]
+            if not items and shard.alive.all():
+                continue
+            titles = self._titles[index]
+            self._titles[index] = [
+                titles[column] for column in np.flatnonzero(shard.alive).tolist()
+            ]
+            self._titles[index].extend(title for title, _ in items)
+            merged = shard.merged(
+                [texts for _, (_, texts) in items], [position for _, (position, _) in items]
+            )
+            self._shards[index] = self._publish(index, merged)
+
+        self._locations = {
+            title: (index, column)
+            for index, titles in enumerate(self._titles)
+            for column, title in enumerate(titles)
+        }
+        self._pending = {}
+
+    def _score_shards(
+        self,
+        keyword_lists: list[list[str]],
+        top_k: int,
+        allowed: list[Optional["np.ndarray"]],
+    ) -> list[list[tuple["np.ndarray", "np.ndarray"]]]:
+        """Local top_k of every shard (per shard, one result per query)."""
+        return [
+            shard.top(keyword_lists, top_k, allowed[index])
+            for index, shard in enumerate(self._shards)
+        ]
+
+    def query_index(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Score every indexed playbook with vectorized keyword matching.
+
+        Returns:
+            List of (title, score) tuples, score is 0.0-1.0
+        """
+        return self.query_index_batch([query], top_k=top_k, candidates=candidates)[0]
+
+    def query_index_batch(
+        self,
+        queries: list[str],
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Score several queries, computing each distinct keyword's vector once.
+
+        Returns:
+            One list of (title, score) tuples per query
+        """
+        with METRICS.timer("search.keywords"):
+            keyword_lists = [list(self._keyword._extract_keywords(query)) for query in queries]
+
+        allowed: list[Optional[np.ndarray]] = [None] * len(self._shards)
+        if candidates is not None:
+            columns: list[list[int]] = [[] for _ in self._shards]
+            for title in candidates:
+                location = self._locations.get(title)
+                if location is not None:
+                    columns[location[0]].append(location[1])
+            allowed = [np.array(shard_columns, dtype=np.int64) for shard_columns in columns]
+
+        with METRICS.timer("search.score"):
+            shard_results = self._score_shards(keyword_lists, top_k, allowed)
+
+        results = []
+        for query_index, keywords in enumerate(keyword_lists):
+            if not keywords or top_k <= 0:
+                results.append([])
+                continue
+
+            with METRICS.timer("search.score"):
+                titles: list[str] = []
+                scores: list[float] = []
+                positions: list[int] = []
+                for index, per_query in enumerate(shard_results):
+                    shard_columns, shard_scores = per_query[query_index]
+                    shard_titles = self._titles[index]
+                    titles.extend(shard_titles[column] for column in shard_columns.tolist())
+                    scores.extend(shard_scores.tolist())
+                    positions.extend(self._shards[index].positions[shard_columns].tolist())
+
+                # Buffered playbooks are scored one at a time
+                for title, (position, texts) in self._pending.items():
+                    if candidates is not None and title not in candidates:
+                        continue
+                    score = _score_texts(keywords, texts)
+                    if score > 0:
+                        titles.append(title)
+                        scores.append(score)
+                        positions.append(position)
+
+            with METRICS.timer("search.sort"):
+                # Highest score first, ties in insertion order like a storage scan
+                order = _top_k(np.array(scores), np.array(positions, dtype=np.int64), top_k)
+                results.append([(titles[i], scores[i]) for i in order.tolist()])
+        return results
@@ -0,0 +1,144 @@
+"""Section-level keyword index."""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Callable, Collection
+from typing import Optional
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookSection, PlaybookSectionMatch
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS, InvertedIndex
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.text import tokenize
+
+# A section's key in the inverted index
+SectionKey = tuple[str, int]
+
+
+class SectionIndex:
+    """
+    Inverted index over the `##` sections of each playbook.
+
+    Each section is indexed as its own document with the same field weights
+    as IndexedSearch: the parent title and tags in the title/tags fields,
+    the section heading as the description and the section body as the
+    content. Queries therefore pick the right playbook through its title
+    and the right section through its heading and body.
+
+    With keep_content disabled only the number of sections per playbook is
+    kept; matching sections are re-read from their playbook at query time.
+    """
+
+    def __init__(self, stop_words: set[str] | None = None, keep_content: bool = True):
+        """
+        Initialize the section index.
+
+        Args:
+            stop_words: Optional custom set of stop words to filter
+            keep_content: Keep section bodies in memory (otherwise query()
+                needs a load callable)
+        """
+        self.stop_words = stop_words or KeywordSearch.STOP_WORDS
+        self.keep_content = keep_content
+        self._index = InvertedIndex()
+        self._sections: dict[str, list[PlaybookSection] | int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _extract_keywords(self, query: str) -> list[str]:
+        """Extract meaningful keyword tokens from query."""
+        tokens = tokenize(query)
+
+        keywords = [token for token in tokens if token not in self.stop_words and len(token) > 2]
+
+        # Fallback to all tokens if everything was filtered
+        return keywords or tokens
+
+    def add(self, playbook: Playbook) -> None:
+        """Split a playbook into sections and index each one."""
+        title = playbook.metadata.title
+        self.remove(title)
+
+        sections = playbook.sections()
+        title_tokens = tokenize(title)
+        tag_tokens = [token for tag in playbook.metadata.tags for token in tokenize(tag)]
+        for section in sections:
+            self._index.add(
+                (title, section.position),
+                {
+                    "title": title_tokens,
+                    "tags": tag_tokens,
+                    "description": tokenize(section.heading),
+                    "content": tokenize(section.content),
+                },
+            )
+        self._sections[title] = sections if self.keep_content else len(sections)
+
+    def remove(self, title: str) -> None:
+        """Remove every section of a playbook."""
+        sections = self._sections.pop(title, 0)
+        for position in range(sections if isinstance(sections, int) else len(sections)):
+            self._index.remove((title, position))
+
+    def clear(self) -> None:
+        """Remove all sections."""
+        self._index.clear()
+        self._sections.clear()
+
+    def query(
+        self,
+        query: str,
+        top_k: int = 3,
+        candidates: Optional[Collection[str]] = None,
+        load: Optional[Callable[[str], Playbook]] = None,
+    ) -> list[PlaybookSectionMatch]:
+        """
+        Return the best-matching sections.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of sections to return
+            candidates: Optional set of playbook titles to restrict results to
+            load: Returns the playbook with a given title (needed when
+                section content is not kept)
+
+        Returns:
+            Section matches sorted by relevance (score 0.0-1.0)
+
+        Raises:
+            ValueError: If section content is not kept and load is missing
+        """
+        keywords = self._extract_keywords(query)
+
+        if not keywords:
+            return []
+
+        scores: dict[SectionKey, float] = defaultdict(float)
+        for keyword in keywords:
+            for field, weight in FIELD_WEIGHTS.items():
+                for key in self._index.postings(field, keyword):
+                    scores[key] += weight
+
+        if candidates is not None:
+            scores = {key: value for key, value in scores.items() if key[0] in candidates}
+
+        # Highest score first, then by title and document order
+        top = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+        num_keywords = len(keywords)
+        loaded: dict[str, list[PlaybookSection]] = {}
+        matches = []
+        for (title, position), value in top:
+            sections = self._sections[title]
+            if isinstance(sections, int):
+                if load is None:
+                    raise ValueError("section content is not kept; query() needs a load callable")
+                if title not in loaded:
+                    loaded[title] = load(title).sections()
+                sections = loaded[title]
+            matches.append(
+                PlaybookSectionMatch(
+                    title=title, section=sections[position], score=min(value / num_keywords, 1.0)
+                )
+            )
+        return matches
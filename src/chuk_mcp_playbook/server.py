@@ -1,14 +1,25 @@
 """Main MCP server implementation."""
 
+import atexit
+import base64
+import binascii
 import logging
+import os
 import sys
 from typing import Any
 
-from chuk_mcp_server import run, tool
+from chuk_mcp_server import get_mcp_server, run, tool
 
-from chuk_mcp_playbook.loader import load_default_playbooks
+from chuk_mcp_playbook.loader import PlaybookLoader, parse_playbook_archive, playbook_locations
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.search.base import IndexedSearchProvider, SearchProvider
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
 from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.snapshot import default_snapshot_path, load_playbooks_with_snapshot
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.executor import QueryExecutor
 from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.watcher import PlaybookWatcher
 
 # Configure logging
 # In STDIO mode, we need to be quiet to avoid polluting the JSON-RPC stream
@@ -22,7 +33,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Initialize storage and service (global for all tools)
-storage = StorageFactory.create(StorageType.MEMORY)
+# Keyword search (substring matching) is the default. CHUK_PLAYBOOK_SEARCH=indexed
+# matches whole words through an inverted index, keeping query latency
+# independent of corpus size (=sharded scores on every core instead);
+# the section index serves section-only queries. Queries on large corpora
+# run in a bounded thread pool (CHUK_PLAYBOOK_EXECUTOR=auto|inline|thread,
+# CHUK_PLAYBOOK_MAX_CONCURRENT_QUERIES) so the event loop stays responsive.
+# CHUK_PLAYBOOK_COPY_ON_WRITE=1 serves reads from published versions so
+# ingestion never blocks concurrent queries. CHUK_PLAYBOOK_LAZY_CONTENT=1
+# keeps markdown bodies in a memory-mapped file instead of in memory
+# (index-backed search only).
+search_type = SearchType(os.environ.get("CHUK_PLAYBOOK_SEARCH", "keyword"))
+search_providers: list[SearchProvider] = []
+
+
+def create_search_provider() -> SearchProvider:
+    """Create a search provider, tracked so it can be closed at shutdown."""
+    provider = SearchFactory.create(search_type)
+    search_providers.append(provider)
+    return provider
+
+
+executor = QueryExecutor(
+    mode=os.environ.get("CHUK_PLAYBOOK_EXECUTOR", "auto"),
+    max_concurrent=int(os.environ.get("CHUK_PLAYBOOK_MAX_CONCURRENT_QUERIES", "0")) or None,
+)
+search_provider = create_search_provider()
+lazy_content = os.environ.get("CHUK_PLAYBOOK_LAZY_CONTENT", "").lower() in ("1", "true", "yes")
+if lazy_content and not isinstance(search_provider, IndexedSearchProvider):
+    # Scan providers score the stored Playbook models, so content stays resident
+    logger.warning(
+        "CHUK_PLAYBOOK_LAZY_CONTENT needs an index-backed search (e.g. "
+        "CHUK_PLAYBOOK_SEARCH=indexed); keeping content in memory"
+    )
+    lazy_content = False
+content_store = ContentStore() if lazy_content else None
+if os.environ.get("CHUK_PLAYBOOK_COPY_ON_WRITE", "").lower() in ("1", "true", "yes"):
+    storage = StorageFactory.create(
+        StorageType.VERSIONED,
+        search_provider=search_provider,
+        index_sections=True,
+        executor=executor,
+        content_store=content_store,
+        search_factory=create_search_provider,
+    )
+else:
+    storage = StorageFactory.create(
+        StorageType.MEMORY,
+        search_provider=search_provider,
+        index_sections=True,
+        executor=executor,
+        content_store=content_store,
+    )
 playbook_service = PlaybookService(storage)
 
 
@@ -32,20 +94,47 @@ playbook_service = PlaybookService(storage)
 
 
 @tool
-async def query_playbook(question: str, top_k: int = 3) -> str:
+async def query_playbook(
+    question: str,
+    top_k: int = 3,
+    tags: list[str] | None = None,
+    match_all_tags: bool = False,
+    sections_only: bool = False,
+) -> str:
     """
     Query the playbook repository with a natural language question.
 
     Args:
         question: Natural language question (e.g., "How do I get sunset times?")
-        top_k: Maximum number of playbooks to return (default: 3)
+        top_k: Maximum number of playbooks (or sections) to return (default: 3)
+        tags: Optional tags to restrict the search to
+        match_all_tags: Require all tags instead of any tag (default: False)
+        sections_only: Return only the best-matching sections, each under
+            its playbook title, instead of a whole playbook (default: False)
 
     Returns:
         Markdown-formatted playbook(s) that answer the question
     """
     logger.info(f"Querying playbooks: {question}")
 
-    playbooks = await playbook_service.query_playbooks(question=question, top_k=top_k)
+    if sections_only:
+        matches = await playbook_service.query_sections(
+            question=question,
+            top_k=top_k,
+            tags=tags,
+            match_all_tags=match_all_tags,
+        )
+        if not matches:
+            return f"No playbooks found matching: {question}"
+        with METRICS.timer("server.serialize"):
+            return "\n\n".join(match.to_markdown() for match in matches)
+
+    playbooks = await playbook_service.query_playbooks(
+        question=question,
+        top_k=top_k,
+        tags=tags,
+        match_all_tags=match_all_tags,
+    )
 
     if not playbooks:
         return f"No playbooks found matching: {question}"
@@ -55,6 +144,48 @@ async def query_playbook(question: str, top_k: int = 3) -> str:
     return top_playbook.content
 
 
+@tool
+async def query_playbooks_batch(
+    questions: list[str],
+    top_k: int = 3,
+    tags: list[str] | None = None,
+    match_all_tags: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Answer several questions in one call.
+
+    Args:
+        questions: Natural language questions
+        top_k: Maximum number of playbooks considered per question (default: 3)
+        tags: Optional tags to restrict every search to
+        match_all_tags: Require all tags instead of any tag (default: False)
+
+    Returns:
+        One entry per question with the matching titles and the top
+        playbook's content (or a not-found message)
+    """
+    logger.info(f"Querying playbooks in batch: {len(questions)} questions")
+
+    batch = await playbook_service.query_playbooks_batch(
+        questions=questions,
+        top_k=top_k,
+        tags=tags,
+        match_all_tags=match_all_tags,
+    )
+
+    with METRICS.timer("server.serialize"):
+        return [
+            {
+                "question": question,
+                "titles": [playbook.metadata.title for playbook in playbooks],
+                "content": playbooks[0].content
+                if playbooks
+                else f"No playbooks found matching: {question}",
+            }
+            for question, playbooks in zip(questions, batch)
+        ]
+
+
 @tool
 async def ingest_playbook(
     title: str,
@@ -89,6 +220,48 @@ async def ingest_playbook(
     return f"Successfully ingested playbook: {playbook.metadata.title}"
 
 
+@tool
+async def ingest_playbooks_bulk(
+    playbooks: list[dict[str, Any]] | None = None,
+    archive: str | None = None,
+    author: str | None = None,
+) -> str:
+    """
+    Ingest many playbooks at once, all or nothing.
+
+    Every playbook is validated before any is stored, and the whole batch
+    is committed with a single index update.
+
+    Args:
+        playbooks: Playbooks as objects with title, content, description and
+            optional tags/author
+        archive: Base64-encoded zip or tar(.gz) archive of markdown files,
+            parsed like playbooks loaded from a directory
+        author: Default author for playbooks that do not name one
+
+    Returns:
+        Summary of the ingested playbooks, or the validation errors
+    """
+    entries = list(playbooks or [])
+    if archive:
+        try:
+            entries.extend(parse_playbook_archive(base64.b64decode(archive, validate=True)))
+        except (binascii.Error, ValueError, UnicodeDecodeError) as e:
+            return f"Invalid archive: {e}"
+
+    if not entries:
+        return "No playbooks to ingest"
+
+    logger.info(f"Ingesting {len(entries)} playbooks in bulk")
+
+    try:
+        ingested = await playbook_service.ingest_playbooks(entries, author=author)
+    except ValueError as e:
+        return str(e)
+
+    return f"Successfully ingested {len(ingested)} playbooks"
+
+
 @tool
 async def list_playbooks() -> list[str]:
     """
@@ -134,11 +307,49 @@ async def get_stats() -> dict[str, Any]:
     return await playbook_service.get_stats()
 
 
+@tool
+async def get_metrics() -> dict[str, Any]:
+    """
+    Get per-stage latency metrics and counters.
+
+    Stages cover the service (query, ingest), storage (query, tag filter,
+    executor queue wait), search providers (keyword extraction, scoring,
+    sort) and response serialization. Gauges report the executor's queue
+    depth and queries in flight. Metrics are recorded only when the server
+    runs with --metrics or CHUK_PLAYBOOK_METRICS=1.
+
+    Returns:
+        Dictionary with "enabled", per-stage latency summaries ("stages"),
+        "counters" and "gauges"
+    """
+    logger.info("Getting metrics")
+    return METRICS.snapshot()
+
+
+async def prometheus_metrics(_request: Any) -> Any:
+    """Serve the metrics in the Prometheus text format (HTTP mode)."""
+    from starlette.responses import Response
+
+    return Response(METRICS.to_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 # ============================================================================
 # Server Entry Point
 # ============================================================================
 
 
+def shutdown():
+    """Release worker processes, shared memory, query threads and the content file."""
+    for provider in search_providers:
+        # Only some providers (e.g. sharded search) hold resources
+        close = getattr(provider, "close", None)
+        if close is not None:
+            close()
+    executor.close()
+    if content_store is not None:
+        content_store.close()
+
+
 def main():
     """Run the MCP Playbook server."""
     # Check if transport is specified in command line args
@@ -162,16 +373,41 @@ def main():
         logging.getLogger("chuk_mcp_server.core").setLevel(logging.ERROR)
         logging.getLogger("chuk_mcp_server.stdio_transport").setLevel(logging.ERROR)
 
-    # Load default playbooks before starting server
+    # Optionally record per-stage metrics (served at /metrics in HTTP mode)
+    if "--metrics" in sys.argv[1:] or os.environ.get("CHUK_PLAYBOOK_METRICS", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    ):
+        METRICS.enabled = True
+        if transport == "http":
+            get_mcp_server().add_endpoint("/metrics", prometheus_metrics, methods=["GET"])
+
+    atexit.register(shutdown)
+
+    # Load default playbooks before starting server (from a snapshot when
+    # the source files are unchanged since the last start)
     try:
         import asyncio
-        count = asyncio.run(load_default_playbooks(playbook_service))
+        count = asyncio.run(load_playbooks_with_snapshot(playbook_service, default_snapshot_path()))
         if transport == "http":
             logger.warning(f"Successfully loaded {count} playbooks")
     except Exception as e:
         if transport == "http":
             logger.error(f"Error loading playbooks: {e}")
 
+    # Optionally keep storage in sync with the playbook directories
+    if "--watch" in sys.argv[1:] or os.environ.get("CHUK_PLAYBOOK_WATCH", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    ):
+        directories = [location for location in playbook_locations() if location.is_dir()]
+        watcher = PlaybookWatcher(PlaybookLoader(playbook_service), directories, author="Chuk AI")
+        watcher.start()
+        if transport == "http":
+            logger.warning(f"Watching {len(directories)} playbook directories for changes")
+
     run(transport=transport)
 
 
@@ -1,16 +1,64 @@
 """Service layer for playbook operations."""
 
-from typing import Optional
+import itertools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
 
-from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
-from chuk_mcp_playbook.storage.base import PlaybookStorage
+from pydantic import ValidationError
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata, PlaybookSectionMatch
+from chuk_mcp_playbook.services.query_cache import QueryCache
+from chuk_mcp_playbook.storage.base import PlaybookStorage, tag_match_kwargs
 
 
 class PlaybookService:
-    """Service for managing playbook operations."""
+    """
+    Service for managing playbook operations.
+
+    Query results are cached (LRU with TTL). Every write made through the
+    service bumps a generation counter that invalidates all cached results,
+    both before and after the storage write: storages may publish a change
+    before the write call returns. Code that writes to the storage directly
+    must call invalidate_cache().
+    """
 
-    def __init__(self, storage: PlaybookStorage):
+    def __init__(
+        self,
+        storage: PlaybookStorage,
+        cache_size: int = 256,
+        cache_ttl: Optional[float] = 300.0,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            storage: Storage provider holding the playbooks
+            cache_size: Maximum number of cached query results (0 disables caching)
+            cache_ttl: Seconds a cached result stays valid, or None for no expiry
+        """
         self.storage = storage
+        self._cache: QueryCache[list] = QueryCache(maxsize=cache_size, ttl=cache_ttl)
+        self._generations = itertools.count(1)
+        self._generation = 0
+
+    def invalidate_cache(self) -> None:
+        """Invalidate all cached query results (call after any storage write)."""
+        # next() on itertools.count is atomic, so writers in other threads
+        # (e.g. the directory watcher) never lose a bump
+        self._generation = next(self._generations)
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Invalidate cached results around a storage write."""
+        # Before: readers may already see the change while the write runs
+        # (e.g. versioned storage); after: drop results cached mid-write
+        self.invalidate_cache()
+        try:
+            yield
+        finally:
+            self.invalidate_cache()
 
     async def create_playbook(
         self,
@@ -28,9 +76,64 @@ class PlaybookService:
             author=author,
         )
         playbook = Playbook(metadata=metadata, content=content)
-        await self.storage.add_playbook(playbook)
+        with self._writing(), METRICS.timer("service.ingest"):
+            await self.storage.add_playbook(playbook)
+        METRICS.increment("ingested_playbooks")
         return playbook
 
+    async def add_playbooks(self, playbooks: list[Playbook]) -> int:
+        """Store many playbooks in one batch. Returns the number stored."""
+        with self._writing(), METRICS.timer("service.ingest"):
+            await self.storage.bulk_add(playbooks)
+        METRICS.increment("ingested_playbooks", len(playbooks))
+        return len(playbooks)
+
+    async def ingest_playbooks(
+        self,
+        entries: list[dict[str, Any]],
+        author: Optional[str] = None,
+    ) -> list[Playbook]:
+        """
+        Validate raw playbook entries in one pass, then store them as one batch.
+
+        Each entry has title, content and description, and optionally tags
+        and author (defaulting to the author argument).
+
+        Raises:
+            ValueError: Listing every invalid or duplicate entry; nothing is
+                stored in that case
+        """
+        playbooks: list[Playbook] = []
+        errors: list[str] = []
+        seen: set[str] = set()
+        for position, entry in enumerate(entries):
+            try:
+                metadata = PlaybookMetadata(
+                    title=entry.get("title"),
+                    description=entry.get("description"),
+                    tags=entry.get("tags") or [],
+                    author=entry.get("author", author),
+                )
+                playbook = Playbook(metadata=metadata, content=entry.get("content"))
+            except ValidationError as e:
+                fields = ", ".join(str(error["loc"][0]) for error in e.errors() if error["loc"])
+                errors.append(f"entry {position}: invalid {fields}")
+                continue
+            if not metadata.title.strip():
+                errors.append(f"entry {position}: empty title")
+                continue
+            if metadata.title in seen:
+                errors.append(f"entry {position}: duplicate title {metadata.title!r}")
+                continue
+            seen.add(metadata.title)
+            playbooks.append(playbook)
+
+        if errors:
+            raise ValueError("Invalid playbooks: " + "; ".join(errors))
+
+        await self.add_playbooks(playbooks)
+        return playbooks
+
     async def get_playbook(self, title: str) -> Optional[Playbook]:
         """Retrieve a playbook by title."""
         return await self.storage.get_playbook(title)
@@ -40,9 +143,108 @@ class PlaybookService:
         question: str,
         top_k: int = 3,
         tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
     ) -> list[Playbook]:
-        """Query playbooks with a natural language question."""
-        return await self.storage.query(question, top_k=top_k, tags=tags)
+        """Query playbooks with a natural language question (cached)."""
+        METRICS.increment("queries")
+        key = self._query_key("playbooks", question, top_k, tags, match_all_tags)
+
+        # Read the generation before querying: a write that lands mid-query
+        # bumps it, so the result is never served from cache afterwards
+        generation = self._generation
+        cached = self._cache.get(key, generation)
+        if cached is not None:
+            return list(cached)
+
+        with METRICS.timer("storage.query"):
+            results = await self.storage.query(
+                question, top_k=top_k, tags=tags, **tag_match_kwargs(match_all_tags)
+            )
+        self._cache.put(key, generation, results)
+        return list(results)
+
+    async def query_playbooks_batch(
+        self,
+        questions: list[str],
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[list[Playbook]]:
+        """
+        Answer several questions at once, one result list per question.
+
+        Cached answers are served directly; the remaining distinct questions
+        go to the storage in a single query_batch() call.
+        """
+        METRICS.increment("queries", len(questions))
+        keys = [
+            self._query_key("playbooks", question, top_k, tags, match_all_tags)
+            for question in questions
+        ]
+
+        generation = self._generation
+        found: dict[tuple, list[Playbook]] = {}
+        missing: dict[tuple, str] = {}
+        for key, question in zip(keys, questions):
+            if key in found or key in missing:
+                continue
+            cached = self._cache.get(key, generation)
+            if cached is not None:
+                found[key] = cached
+            else:
+                missing[key] = question
+
+        if missing:
+            with METRICS.timer("storage.query_batch"):
+                batch = await self.storage.query_batch(
+                    list(missing.values()),
+                    top_k=top_k,
+                    tags=tags,
+                    **tag_match_kwargs(match_all_tags),
+                )
+            for key, results in zip(missing, batch):
+                self._cache.put(key, generation, results)
+                found[key] = results
+
+        return [list(found[key]) for key in keys]
+
+    async def query_sections(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[PlaybookSectionMatch]:
+        """Return the best-matching playbook sections (cached)."""
+        METRICS.increment("section_queries")
+        key = self._query_key("sections", question, top_k, tags, match_all_tags)
+
+        generation = self._generation
+        cached = self._cache.get(key, generation)
+        if cached is not None:
+            return list(cached)
+
+        with METRICS.timer("storage.query_sections"):
+            results = await self.storage.query_sections(
+                question, top_k=top_k, tags=tags, **tag_match_kwargs(match_all_tags)
+            )
+        self._cache.put(key, generation, results)
+        return list(results)
+
+    @staticmethod
+    def _query_key(
+        kind: str, question: str, top_k: int, tags: Optional[list[str]], match_all_tags: bool
+    ) -> tuple:
+        """Cache key for a query."""
+        # Lowercased words are what every search provider matches on
+        tag_key = tuple(sorted(set(tags or ())))
+        return (
+            kind,
+            tuple(question.lower().split()),
+            top_k,
+            tag_key,
+            match_all_tags and bool(tag_key),
+        )
 
     async def list_playbooks(self) -> list[str]:
         """List all playbook titles."""
@@ -50,9 +252,33 @@ class PlaybookService:
 
     async def delete_playbook(self, title: str) -> bool:
         """Delete a playbook."""
-        return await self.storage.delete_playbook(title)
+        with self._writing():
+            return await self.storage.delete_playbook(title)
 
-    async def get_stats(self) -> dict[str, int]:
-        """Get storage statistics."""
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get storage, query cache and (when metrics are enabled) throughput statistics.
+        """
         count = await self.storage.count()
-        return {"total_playbooks": count}
+        stats: dict[str, Any] = {
+            "total_playbooks": count,
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses,
+            "cache_entries": len(self._cache),
+        }
+        if METRICS.enabled:
+            storage_query = METRICS.histogram("storage.query").summary()
+            ingest = METRICS.histogram("service.ingest")
+            ingested = METRICS.counter("ingested_playbooks")
+            stats.update(
+                {
+                    "queries": int(METRICS.counter("queries")),
+                    "storage_query_p50_ms": storage_query["p50_ms"],
+                    "storage_query_p99_ms": storage_query["p99_ms"],
+                    "ingested_playbooks": int(ingested),
+                    "ingest_playbooks_per_s": round(ingested / ingest.total, 1)
+                    if ingest.total
+                    else 0.0,
+                }
+            )
+        return stats
@@ -0,0 +1,205 @@
+"""Binary startup snapshots of loaded playbooks and their search index."""
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import sys
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+from chuk_mcp_playbook import __version__
+from chuk_mcp_playbook.loader import load_default_playbooks, playbook_source_files
+from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+from chuk_mcp_playbook.storage.providers.versioned import VersionedMemoryStorage
+
+SNAPSHOT_MAGIC = b"CHUKPBS1"
+SNAPSHOT_VERSION = 3
+
+# Environment variable overriding the snapshot path (empty string disables snapshots)
+SNAPSHOT_ENV_VAR = "CHUK_PLAYBOOK_SNAPSHOT"
+
+logger = logging.getLogger(__name__)
+
+
+def default_snapshot_path() -> Optional[Path]:
+    """Return the configured snapshot path, or None if snapshots are disabled."""
+    configured = os.environ.get(SNAPSHOT_ENV_VAR)
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    return Path.home() / ".cache" / "chuk-mcp-playbook" / "snapshot.bin"
+
+
+def _config_key(value: Any) -> Any:
+    """Comparable form of a configuration value."""
+    if isinstance(value, SearchProvider):
+        # Public attributes hold a provider's settings; its index is private
+        cls = type(value)
+        settings = {
+            name: _config_key(item)
+            for name, item in vars(value).items()
+            if not name.startswith("_")
+        }
+        return (f"{cls.__module__}.{cls.__qualname__}", tuple(sorted(settings.items())))
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _config_key(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_config_key(item) for item in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_config_key(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return repr(value)
+
+
+def snapshot_key(storage: InMemoryStorage | VersionedMemoryStorage) -> tuple:
+    """
+    Identify the code and configuration a snapshot was written with.
+
+    Snapshots are only restored under the same package version and search
+    provider type and settings.
+    """
+    return (__version__, _config_key(storage.search_provider))
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def fingerprint_sources(files: list[Path]) -> dict[str, tuple[int, int, str]]:
+    """Map each source file to (mtime_ns, size, sha256)."""
+    fingerprints = {}
+    for path in files:
+        stat = path.stat()
+        fingerprints[str(path)] = (stat.st_mtime_ns, stat.st_size, _file_hash(path))
+    return fingerprints
+
+
+def sources_unchanged(recorded: dict[str, tuple[int, int, str]], files: list[Path]) -> bool:
+    """
+    Check recorded fingerprints against the current source files.
+
+    Files whose mtime and size match are trusted without reading them; the
+    content hash is only computed when the stat information differs.
+    """
+    if set(recorded) != {str(path) for path in files}:
+        return False
+
+    for path in files:
+        mtime_ns, size, digest = recorded[str(path)]
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            continue
+        if stat.st_size != size or _file_hash(path) != digest:
+            return False
+
+    return True
+
+
+def write_snapshot(
+    path: Path, storage: InMemoryStorage | VersionedMemoryStorage, files: list[Path]
+) -> None:
+    """
+    Write storage contents, search index and source fingerprints to path.
+
+    The file is written to a temporary name and renamed into place so a
+    crash never leaves a truncated snapshot behind.
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "key": snapshot_key(storage),
+        "sources": fingerprint_sources(files),
+        "state": storage.export_state(),
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_snapshot(path: Path) -> Optional[dict[str, Any]]:
+    """
+    Memory-map and decode a snapshot.
+
+    Returns None if the file is missing, foreign, corrupt or from another
+    snapshot version. Snapshots are pickles: only load files this server wrote.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                return None
+            # Unpickle straight from the mapping, without copying the file
+            payload = pickle.load(data)
+    except Exception:
+        # A missing or unreadable snapshot is just a cache miss
+        return None
+
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    return payload
+
+
+async def load_playbooks_with_snapshot(
+    service: PlaybookService,
+    snapshot_path: Optional[Path],
+    playbooks_dir: Optional[Path] = None,
+) -> int:
+    """
+    Load default playbooks, reusing a snapshot when the sources are unchanged.
+
+    Falls back to load_default_playbooks() when there is no usable snapshot
+    (or the storage is not in-memory), then writes a fresh snapshot. A
+    snapshot that cannot be written is logged and skipped.
+
+    Args:
+        service: PlaybookService instance
+        snapshot_path: Snapshot file path, or None to disable snapshots
+        playbooks_dir: Optional custom playbooks directory path (overrides index.md)
+
+    Returns:
+        Number of playbooks loaded
+    """
+    storage = service.storage
+    if snapshot_path is None or not isinstance(storage, (InMemoryStorage, VersionedMemoryStorage)):
+        return await load_default_playbooks(service, playbooks_dir)
+
+    files = playbook_source_files(playbooks_dir)
+
+    payload = read_snapshot(snapshot_path)
+    if (
+        payload is not None
+        # Snapshots from other code or search settings are not reused
+        and payload.get("key") == snapshot_key(storage)
+        and sources_unchanged(payload["sources"], files)
+    ):
+        # Same provider settings: the saved search index is loaded, not rebuilt
+        storage.restore_state(payload["state"], reuse_index=True)
+        service.invalidate_cache()
+        count = await storage.count()
+        print(f"Restored {count} playbooks from snapshot {snapshot_path}", file=sys.stderr)
+        return count
+
+    count = await load_default_playbooks(service, playbooks_dir)
+    try:
+        write_snapshot(snapshot_path, storage, files)
+    except Exception as e:
+        # The playbooks are loaded; the next start simply parses them again
+        logger.warning("Could not write snapshot %s: %s", snapshot_path, e)
+    return count
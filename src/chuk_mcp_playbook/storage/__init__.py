@@ -1,6 +1,7 @@
 """Storage layer for playbooks."""
 
 from chuk_mcp_playbook.storage.base import PlaybookStorage
+from chuk_mcp_playbook.storage.content import ContentStore
 from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
 
-__all__ = ["PlaybookStorage", "StorageFactory", "StorageType"]
+__all__ = ["ContentStore", "PlaybookStorage", "StorageFactory", "StorageType"]
@@ -1,9 +1,21 @@
 """Abstract base class for playbook storage providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from chuk_mcp_playbook.models.playbook import Playbook
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookSectionMatch
+from chuk_mcp_playbook.search.sections import SectionIndex
+
+
+def tag_match_kwargs(match_all_tags: bool) -> dict[str, bool]:
+    """
+    Keyword arguments selecting all-tags matching for query().
+
+    match_all_tags is only passed when set, so providers whose query()
+    predates it (question, top_k, tags) keep working for any-tag queries.
+    """
+    return {"match_all_tags": True} if match_all_tags else {}
 
 
 class PlaybookStorage(ABC):
@@ -14,19 +26,82 @@ class PlaybookStorage(ABC):
         """Add or update a playbook in storage."""
         pass
 
+    async def bulk_add(self, playbooks: list[Playbook]) -> None:
+        """
+        Add or update many playbooks.
+
+        The default adds them one at a time; providers override this with a
+        batched implementation that applies the whole batch atomically.
+        """
+        for playbook in playbooks:
+            await self.add_playbook(playbook)
+
     @abstractmethod
     async def get_playbook(self, title: str) -> Optional[Playbook]:
         """Get a playbook by exact title."""
         pass
 
     @abstractmethod
-    async def query(self, question: str, top_k: int = 3, tags: Optional[list[str]] = None) -> list[Playbook]:
+    async def query(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[Playbook]:
         """
         Query playbooks using the provider's search mechanism.
         Returns top_k most relevant playbooks sorted by relevance.
+
+        When tags are given, only playbooks with any of them (or all of
+        them, if match_all_tags is set) are considered. Callers pass
+        match_all_tags only when it is set (see tag_match_kwargs()).
         """
         pass
 
+    async def query_batch(
+        self,
+        questions: list[str],
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[list[Playbook]]:
+        """
+        Run several queries with the same filters, one result list per question.
+
+        The default runs query() for every question concurrently; providers
+        can override this to share work across the batch.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.query(question, top_k=top_k, tags=tags, **tag_match_kwargs(match_all_tags))
+                    for question in questions
+                )
+            )
+        )
+
+    async def query_sections(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[PlaybookSectionMatch]:
+        """
+        Return the best-matching `##` sections with their parent titles.
+
+        The default splits the top_k playbooks from query() into sections
+        and ranks those; providers with a section index can override this.
+        """
+        playbooks = await self.query(
+            question, top_k=top_k, tags=tags, **tag_match_kwargs(match_all_tags)
+        )
+        sections = SectionIndex()
+        for playbook in playbooks:
+            sections.add(playbook)
+        return sections.query(question, top_k=top_k)
+
     @abstractmethod
     async def list_all(self) -> list[str]:
         """List all playbook titles."""
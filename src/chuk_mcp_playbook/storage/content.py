@@ -0,0 +1,215 @@
+"""Disk-backed store for playbook bodies, read through a memory map."""
+
+import mmap
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from chuk_mcp_playbook.metrics import METRICS
+
+# A reference packs a body's file generation, byte offset and length into one integer
+_LENGTH_BITS = 32
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+_GENERATION_SHIFT = 2 * _LENGTH_BITS
+
+
+class _Segment:
+    """One generation's file and its memory map (callers hold the store's lock)."""
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.size = 0
+        self.map: Optional[mmap.mmap] = None
+
+    def append(self, data: bytes) -> int:
+        offset = self.size
+        # Unbuffered writes go straight to the page cache the map reads from
+        self.file.seek(offset)
+        self.file.write(data)
+        self.size += len(data)
+        return offset
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self.map is None or offset + length > len(self.map):
+            # The file grew since it was mapped
+            self.unmap()
+            self.map = mmap.mmap(self.file.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self.map[offset : offset + length]
+
+    def unmap(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def truncate(self) -> None:
+        self.unmap()
+        self.file.truncate(0)
+        self.size = 0
+
+    def close(self) -> None:
+        self.unmap()
+        self.file.close()
+
+
+class ContentStore:
+    """
+    Append-only file of playbook bodies with a bounded LRU of hot bodies.
+
+    put() appends a UTF-8 encoded body and returns an integer reference
+    (offset and length); get() decodes it from a memory map of the file.
+    Storage keeps only the references resident, so memory scales with the
+    number of playbooks rather than the size of their content.
+
+    Features:
+    - Memory-mapped reads (the OS page cache holds hot pages, not the heap)
+    - Bounded LRU of decoded bodies for repeatedly returned playbooks
+    - "content.cache_hits" / "content.cache_misses" counters
+    - Thread-safe; references stay valid until clear() or close()
+    - compact() copies live bodies into a new file generation; references
+      into the old file stay valid until release()
+
+    Replaced and deleted bodies are only reclaimed by clear() or compact().
+    By default the file is an anonymous temporary file, removed on close;
+    compacted generations are anonymous files in the same directory.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, cache_size: int = 256):
+        """
+        Initialize the store.
+
+        Args:
+            path: File to keep bodies in (truncated). Defaults to a temporary file.
+            cache_size: Number of decoded bodies kept in the LRU (0 disables it)
+        """
+        self._directory = Path(path).parent if path is not None else None
+        if path is None:
+            file = self._temporary_file()
+        else:
+            file = open(path, "w+b", buffering=0)
+        self.cache_size = cache_size
+        self._generation = 0
+        self._segments = {0: _Segment(file)}
+        self._cache: OrderedDict[int, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Bytes held in the store's files."""
+        return sum(segment.size for segment in self._segments.values())
+
+    @staticmethod
+    def length(ref: int) -> int:
+        """Size in bytes of the body a reference points to."""
+        return ref & _LENGTH_MASK
+
+    def _temporary_file(self) -> BinaryIO:
+        return tempfile.TemporaryFile(prefix="playbook-content-", dir=self._directory, buffering=0)
+
+    def put(self, content: str) -> int:
+        """
+        Append a body to the file.
+
+        Args:
+            content: Markdown body
+
+        Returns:
+            Reference to pass to get()
+        """
+        data = content.encode("utf-8")
+        if len(data) > _LENGTH_MASK:
+            raise ValueError("content too large for the content store")
+        with self._lock:
+            offset = self._segments[self._generation].append(data)
+            return self._generation << _GENERATION_SHIFT | offset << _LENGTH_BITS | len(data)
+
+    def get(self, ref: int) -> str:
+        """
+        Return the body for a reference from put().
+
+        Raises:
+            ValueError: If the reference points past the end of its file or
+                into a released generation
+        """
+        with self._lock:
+            content = self._cache.get(ref)
+            if content is not None:
+                self._cache.move_to_end(ref)
+                METRICS.increment("content.cache_hits")
+                return content
+
+            segment = self._segments.get(ref >> _GENERATION_SHIFT)
+            offset, length = ref >> _LENGTH_BITS & _LENGTH_MASK, ref & _LENGTH_MASK
+            if segment is None or offset + length > segment.size:
+                raise ValueError(f"invalid content reference: {ref}")
+            if not length:
+                return ""
+            content = segment.read(offset, length).decode("utf-8")
+            METRICS.increment("content.cache_misses")
+
+            if self.cache_size > 0:
+                self._cache[ref] = content
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return content
+
+    def compact(self, refs: Iterable[int]) -> dict[int, int]:
+        """
+        Copy the given bodies into a new file generation.
+
+        New bodies go to the new file. The old file stays readable (so a
+        reader may resolve either reference) until release().
+
+        Args:
+            refs: References of the bodies still in use
+
+        Returns:
+            The new reference for each given reference
+        """
+        with self._lock:
+            old = self._segments[self._generation]
+            new = _Segment(self._temporary_file())
+            generation = self._generation + 1
+            mapping = {}
+            for ref in refs:
+                if ref in mapping:
+                    continue
+                offset, length = ref >> _LENGTH_BITS & _LENGTH_MASK, ref & _LENGTH_MASK
+                if ref >> _GENERATION_SHIFT != self._generation or offset + length > old.size:
+                    raise ValueError(f"invalid content reference: {ref}")
+                data = old.read(offset, length) if length else b""
+                mapping[ref] = (
+                    generation << _GENERATION_SHIFT | new.append(data) << _LENGTH_BITS | length
+                )
+            self._segments[generation] = new
+            self._generation = generation
+            return mapping
+
+    def release(self) -> None:
+        """Free the files of previous generations (invalidates references into them)."""
+        with self._lock:
+            for generation in [g for g in self._segments if g != self._generation]:
+                segment = self._segments.pop(generation)
+                # A file the caller named is emptied rather than left stale
+                segment.truncate()
+                segment.close()
+            self._cache = OrderedDict(
+                (ref, content)
+                for ref, content in self._cache.items()
+                if ref >> _GENERATION_SHIFT == self._generation
+            )
+
+    def clear(self) -> None:
+        """Drop every body (invalidates all references)."""
+        self.release()
+        with self._lock:
+            self._segments[self._generation].truncate()
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the files (temporary files are deleted)."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._cache.clear()
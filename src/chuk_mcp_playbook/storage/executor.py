@@ -0,0 +1,127 @@
+"""Executor strategies for running storage queries off the event loop."""
+
+import asyncio
+import functools
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Optional, TypeVar
+
+from chuk_mcp_playbook.metrics import METRICS
+
+T = TypeVar("T")
+
+
+class ExecutorMode(str, Enum):
+    """Where storage queries run."""
+
+    AUTO = "auto"  # Inline for small corpora, thread pool above inline_threshold (default)
+    INLINE = "inline"  # On the event loop (no hand-off cost; blocks other requests while scoring)
+    THREAD = "thread"  # In a thread pool (the event loop keeps serving other requests)
+
+
+class QueryExecutor:
+    """
+    Runs blocking query work according to an ExecutorMode.
+
+    Features:
+    - Inline execution for corpora too small to be worth a thread hand-off
+    - Thread pool execution so a slow query never stalls the event loop
+    - Concurrency limiter: at most max_concurrent queries run at once, the
+      rest wait their turn on the event loop instead of piling up threads
+    - Queue depth and in-flight gauges ("storage.queue_depth",
+      "storage.queries_in_flight") and a "storage.queue_wait" histogram
+
+    Scoring itself runs on other cores with a process-backed search
+    provider (SearchType.SHARDED); the thread pool keeps the event loop
+    free while its workers score.
+    """
+
+    def __init__(
+        self,
+        mode: ExecutorMode = ExecutorMode.AUTO,
+        inline_threshold: int = 1000,
+        max_concurrent: Optional[int] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            mode: Execution strategy
+            inline_threshold: Corpus size from which AUTO uses the thread pool
+            max_concurrent: Queries allowed to run at once (default: CPU count + 4, at most 32)
+        """
+        self.mode = ExecutorMode(mode)
+        self.inline_threshold = inline_threshold
+        self.max_concurrent = max_concurrent or min(32, (os.cpu_count() or 1) + 4)
+        self.waiting = 0
+        self.running = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._limiter: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    def strategy(self, size: int) -> ExecutorMode:
+        """Mode used for a query over a corpus of the given size."""
+        if self.mode != ExecutorMode.AUTO:
+            return self.mode
+        return ExecutorMode.THREAD if size >= self.inline_threshold else ExecutorMode.INLINE
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Limiter of the running event loop (one per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter[0] is not loop:
+            self._limiter = (loop, asyncio.Semaphore(self.max_concurrent))
+        return self._limiter[1]
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrent, thread_name_prefix="playbook-query"
+            )
+        return self._pool
+
+    def _update_gauges(self) -> None:
+        METRICS.set_gauge("storage.queue_depth", self.waiting)
+        METRICS.set_gauge("storage.queries_in_flight", self.running)
+
+    async def run(self, fn: Callable[..., T], *args: Any, size: int = 0) -> T:
+        """
+        Run fn(*args) with the strategy for a corpus of the given size.
+
+        Args:
+            fn: Blocking callable (must be thread-safe for THREAD mode)
+            *args: Arguments for fn
+            size: Number of stored playbooks the call searches
+
+        Returns:
+            The result of fn
+        """
+        if self.strategy(size) == ExecutorMode.INLINE:
+            return fn(*args)
+
+        semaphore = self._semaphore()
+        start = time.perf_counter()
+        self.waiting += 1
+        self._update_gauges()
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        METRICS.observe("storage.queue_wait", time.perf_counter() - start)
+
+        self.running += 1
+        self._update_gauges()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor(), functools.partial(fn, *args))
+        finally:
+            self.running -= 1
+            semaphore.release()
+            self._update_gauges()
+
+    def close(self) -> None:
+        """Stop the thread pool (it is recreated on the next offloaded query)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -5,14 +5,17 @@ from enum import Enum
 from chuk_mcp_playbook.search.base import SearchProvider
 from chuk_mcp_playbook.storage.base import PlaybookStorage
 from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+from chuk_mcp_playbook.storage.providers.sqlite import SQLiteStorage
+from chuk_mcp_playbook.storage.providers.versioned import VersionedMemoryStorage
 
 
 class StorageType(str, Enum):
     """Supported storage provider types."""
 
     MEMORY = "memory"
+    SQLITE = "sqlite"
+    VERSIONED = "versioned"  # In-memory, copy-on-write: reads never wait for writes
     # Future providers can be added here:
-    # SQLITE = "sqlite"
     # POSTGRES = "postgres"
     # CHROMA = "chroma"
 
@@ -24,7 +27,7 @@ class StorageFactory:
     def create(
         storage_type: StorageType = StorageType.MEMORY,
         search_provider: SearchProvider | None = None,
-        **kwargs
+        **kwargs,
     ) -> PlaybookStorage:
         """
         Create a storage provider instance.
@@ -48,12 +51,26 @@ class StorageFactory:
             >>> from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
             >>> search = SearchFactory.create(SearchType.SIMPLE)
             >>> storage = StorageFactory.create(search_provider=search)
+            >>>
+            >>> # Persistent SQLite storage with FTS5 ranking
+            >>> storage = StorageFactory.create(StorageType.SQLITE, path="playbooks.db")
+            >>>
+            >>> # In-memory storage with lock-free reads during ingestion
+            >>> storage = StorageFactory.create(StorageType.VERSIONED, search_provider=search)
+            >>>
+            >>> # Content on disk, read through a memory map (index-backed search)
+            >>> from chuk_mcp_playbook.storage.content import ContentStore
+            >>> storage = StorageFactory.create(
+            ...     search_provider=SearchFactory.create(SearchType.INDEXED), content_store=ContentStore()
+            ... )
         """
         if storage_type == StorageType.MEMORY:
             return InMemoryStorage(search_provider=search_provider, **kwargs)
+        elif storage_type == StorageType.SQLITE:
+            return SQLiteStorage(search_provider=search_provider, **kwargs)
+        elif storage_type == StorageType.VERSIONED:
+            return VersionedMemoryStorage(search_provider=search_provider, **kwargs)
         # Future providers:
-        # elif storage_type == StorageType.SQLITE:
-        #     return SQLiteStorage(search_provider=search_provider, **kwargs)
         # elif storage_type == StorageType.CHROMA:
         #     return ChromaStorage(**kwargs)  # Would use built-in vector search
         else:
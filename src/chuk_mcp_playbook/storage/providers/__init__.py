@@ -1,5 +1,7 @@
 """Storage provider implementations."""
 
 from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+from chuk_mcp_playbook.storage.providers.sqlite import SQLiteStorage
+from chuk_mcp_playbook.storage.providers.versioned import VersionedMemoryStorage
 
-__all__ = ["InMemoryStorage"]
+__all__ = ["InMemoryStorage", "SQLiteStorage", "VersionedMemoryStorage"]
@@ -1,69 +1,418 @@
 """In-memory storage provider with pluggable search."""
 
-from typing import Optional
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import Any, Optional, TypeVar
 
-from chuk_mcp_playbook.models.playbook import Playbook
-from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookSectionMatch
+from chuk_mcp_playbook.search.base import IndexedSearchProvider, SearchProvider
 from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.search.sections import SectionIndex
 from chuk_mcp_playbook.storage.base import PlaybookStorage
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.executor import ExecutorMode, QueryExecutor
+from chuk_mcp_playbook.storage.records import PlaybookRecord
+from chuk_mcp_playbook.storage.tag_index import TagIndex
+
+T = TypeVar("T")
 
 
 class InMemoryStorage(PlaybookStorage):
     """
     In-memory storage provider using dictionaries for fast lookups.
 
-    Supports pluggable search strategies via SearchProvider.
+    Supports pluggable search strategies via SearchProvider. Index-backed
+    providers (IndexedSearchProvider) are kept in sync on every write and
+    queried directly instead of scanning all playbooks. A TagIndex turns
+    tag filters into set operations whose result is handed straight to the
+    search provider. With index_sections enabled, each playbook's `##`
+    sections are indexed separately for section-level queries.
+
+    With an index-backed provider, playbooks are kept as compact
+    PlaybookRecords (slots, interned tags and authors, integer timestamps)
+    and only converted to Playbook models when returned. Scan providers
+    score every stored playbook on each query, so they keep Playbook
+    models with their cached search views instead.
+
+    A lock guards the dictionaries and index so that writers in other
+    threads (e.g. the directory watcher) never tear a concurrent read.
+    Queries hold it while they score, so the event loop never takes it:
+    get_playbook(), list_all() and count() read the dictionary without it
+    (single dictionary operations are atomic), queries run through a
+    QueryExecutor (inline for small corpora, in a thread pool for large
+    ones) and writes run in a thread whenever queries do. A long query
+    then never stalls the event loop.
+
+    With a ContentStore, compact records keep only a reference to their
+    markdown body, which is read back from the store's memory-mapped file
+    when a playbook is returned. Only metadata and the indexes stay
+    resident (the section index then keeps section counts, not bodies).
     """
 
-    def __init__(self, search_provider: SearchProvider | None = None):
+    def __init__(
+        self,
+        search_provider: SearchProvider | None = None,
+        index_sections: bool = False,
+        compact: Optional[bool] = None,
+        executor: Optional[QueryExecutor] = None,
+        content_store: Optional[ContentStore] = None,
+    ):
         """
         Initialize storage.
 
         Args:
             search_provider: Optional search provider. Defaults to KeywordSearch.
+            index_sections: Maintain a section index for query_sections()
+            compact: Store compact records instead of Playbook models.
+                Defaults to True for index-backed providers.
+            executor: Where queries run. Defaults to QueryExecutor() (inline
+                below 1000 playbooks, thread pool above).
+            content_store: Keep playbook content on disk in this store
+                instead of in memory (requires compact storage)
+
+        Raises:
+            ValueError: If compact storage or a content store is requested
+                for a scan provider
         """
-        self._playbooks: dict[str, Playbook] = {}
-        self._search = search_provider or SearchFactory.create(SearchType.KEYWORD)
+        # Explicit None check: providers that define __len__ are falsy while empty
+        if search_provider is None:
+            search_provider = SearchFactory.create(SearchType.KEYWORD)
+        self._search = search_provider
+        self._index = self._search if isinstance(self._search, IndexedSearchProvider) else None
+        if compact is None:
+            compact = self._index is not None
+        elif compact and self._index is None:
+            raise ValueError("compact storage needs an index-backed search provider")
+        if content_store is not None and not compact:
+            raise ValueError(
+                "a content store needs compact storage with an index-backed search provider"
+            )
+        self._compact = compact
+        self._content = content_store
+        self._playbooks: dict[str, Playbook | PlaybookRecord] = {}
+        self._tag_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._tags = TagIndex()
+        self._sections = (
+            SectionIndex(keep_content=content_store is None) if index_sections else None
+        )
+        self._lock = threading.RLock()
+        self._executor = executor if executor is not None else QueryExecutor()
+
+    @property
+    def search_provider(self) -> SearchProvider:
+        """The search provider used for queries."""
+        return self._search
+
+    @property
+    def executor(self) -> QueryExecutor:
+        """The executor queries run on."""
+        return self._executor
+
+    def _store(self, playbook: Playbook) -> Playbook | PlaybookRecord:
+        """Representation kept in the dictionary for a playbook."""
+        if self._compact:
+            return PlaybookRecord.from_playbook(playbook, self._tag_tuples, self._content)
+        # Normalize searchable fields once so queries never re-lowercase them
+        playbook.build_search_view()
+        return playbook
+
+    def _load(self, stored: Playbook | PlaybookRecord) -> Playbook:
+        """Playbook model for a stored value."""
+        return stored.to_playbook(self._content) if isinstance(stored, PlaybookRecord) else stored
+
+    async def _write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a write in a thread when queries run there (they may hold the lock)."""
+        if self._executor.strategy(len(self._playbooks)) == ExecutorMode.INLINE:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
 
     async def add_playbook(self, playbook: Playbook) -> None:
         """Add or update a playbook in storage."""
-        self._playbooks[playbook.metadata.title] = playbook
+        stored = self._store(playbook)
+        await self._write(self._add, playbook, stored)
+
+    def _add(self, playbook: Playbook, stored: Playbook | PlaybookRecord) -> None:
+        with self._lock:
+            self._playbooks[playbook.metadata.title] = stored
+            self._tags.add(playbook.metadata.title, playbook.metadata.tags)
+            if self._sections is not None:
+                self._sections.add(playbook)
+            if self._index is not None:
+                self._index.add(playbook)
+
+    async def bulk_add(self, playbooks: list[Playbook]) -> None:
+        """
+        Add or update many playbooks atomically.
+
+        Stored representations are built before the lock is taken, the index is
+        updated once for the whole batch and readers never observe a
+        partially applied batch. If indexing fails, every change made by
+        the batch is rolled back.
+        """
+        # Later duplicates win, as with repeated add_playbook() calls
+        batch = list({playbook.metadata.title: playbook for playbook in playbooks}.values())
+        stored = [self._store(playbook) for playbook in batch]
+        await self._write(self._bulk_add, batch, stored)
+
+    def _bulk_add(self, batch: list[Playbook], stored: list[Playbook | PlaybookRecord]) -> None:
+        with self._lock:
+            previous = {p.metadata.title: self._playbooks.get(p.metadata.title) for p in batch}
+            try:
+                for playbook, value in zip(batch, stored):
+                    self._playbooks[playbook.metadata.title] = value
+                    self._tags.add(playbook.metadata.title, playbook.metadata.tags)
+                    if self._sections is not None:
+                        self._sections.add(playbook)
+                if self._index is not None:
+                    self._index.add_many(batch)
+            except BaseException:
+                self._rollback(previous)
+                raise
+
+    def _rollback(self, previous: dict[str, Optional[Playbook | PlaybookRecord]]) -> None:
+        """Restore the given titles to their previous stored values (None: absent)."""
+        for title, stored in previous.items():
+            if stored is None:
+                self._playbooks.pop(title, None)
+                self._tags.remove(title)
+                if self._sections is not None:
+                    self._sections.remove(title)
+                if self._index is not None:
+                    self._index.remove(title)
+            else:
+                self._playbooks[title] = stored
+                playbook = self._load(stored)
+                self._tags.add(title, playbook.metadata.tags)
+                if self._sections is not None:
+                    self._sections.add(playbook)
+                if self._index is not None:
+                    self._index.add(playbook)
 
     async def get_playbook(self, title: str) -> Optional[Playbook]:
         """Get a playbook by exact title."""
-        return self._playbooks.get(title)
+        stored = self._playbooks.get(title)
+        return self._load(stored) if stored is not None else None
 
-    async def query(self, question: str, top_k: int = 3, tags: Optional[list[str]] = None) -> list[Playbook]:
+    async def query(self, question: str, top_k: int = 3, tags: Optional[list[str]] = None, match_all_tags: bool = False) -> list[Playbook]:
         """
         Query playbooks using the configured search provider.
         Returns top_k most relevant playbooks sorted by relevance.
         """
-        # Filter by tags if provided
-        playbooks = list(self._playbooks.values())
-        if tags:
-            playbooks = [
-                p for p in playbooks
-                if any(tag in p.metadata.tags for tag in tags)
-            ]
+        return await self._executor.run(
+            self._query, question, top_k, tags, match_all_tags, size=len(self._playbooks)
+        )
+
+    def _query(
+        self, question: str, top_k: int, tags: Optional[list[str]], match_all_tags: bool
+    ) -> list[Playbook]:
+        with self._lock:
+            with METRICS.timer("storage.tag_filter"):
+                titles = self._tags.match(tags, match_all=match_all_tags) if tags else None
+
+            if self._index is not None:
+                candidates = set(titles) if titles is not None else None
+                results = self._index.query_index(question, top_k=top_k, candidates=candidates)
+                stored = [self._playbooks[title] for title, _ in results]
+                return [self._load(value) for value in stored]
+
+            playbooks = self._scan_playbooks(titles)
 
         # Use search provider to find and rank results
         return self._search.search(playbooks, question, top_k=top_k)
 
+    async def query_batch(
+        self,
+        questions: list[str],
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[list[Playbook]]:
+        """
+        Run several queries under one lock acquisition.
+        The tag filter is resolved once and index-backed providers share
+        keyword lookups across the questions.
+        """
+        return await self._executor.run(
+            self._query_batch, questions, top_k, tags, match_all_tags, size=len(self._playbooks)
+        )
+
+    def _query_batch(
+        self, questions: list[str], top_k: int, tags: Optional[list[str]], match_all_tags: bool
+    ) -> list[list[Playbook]]:
+        with self._lock:
+            with METRICS.timer("storage.tag_filter"):
+                titles = self._tags.match(tags, match_all=match_all_tags) if tags else None
+
+            if self._index is not None:
+                candidates = set(titles) if titles is not None else None
+                batch = self._index.query_index_batch(questions, top_k=top_k, candidates=candidates)
+                return [
+                    [self._load(self._playbooks[title]) for title, _ in results]
+                    for results in batch
+                ]
+
+            playbooks = self._scan_playbooks(titles)
+
+        return [self._search.search(playbooks, question, top_k=top_k) for question in questions]
+
+    def _scan_playbooks(self, titles: Optional[list[str]]) -> list[Playbook]:
+        """Playbooks a scan provider searches (all, or the given titles)."""
+        values = (
+            self._playbooks.values()
+            if titles is None
+            else [self._playbooks[title] for title in titles]
+        )
+        return list(values)
+
+    async def query_sections(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[PlaybookSectionMatch]:
+        """
+        Return the best-matching `##` sections with their parent titles.
+        Uses the section index when enabled.
+        """
+        if self._sections is None:
+            return await super().query_sections(
+                question, top_k=top_k, tags=tags, match_all_tags=match_all_tags
+            )
+
+        return await self._executor.run(
+            self._query_sections, question, top_k, tags, match_all_tags, size=len(self._playbooks)
+        )
+
+    def _query_sections(
+        self, question: str, top_k: int, tags: Optional[list[str]], match_all_tags: bool
+    ) -> list[PlaybookSectionMatch]:
+        with self._lock:
+            with METRICS.timer("storage.tag_filter"):
+                candidates = set(self._tags.match(tags, match_all=match_all_tags)) if tags else None
+            return self._sections.query(
+                question,
+                top_k=top_k,
+                candidates=candidates,
+                load=lambda title: self._load(self._playbooks[title]),
+            )
+
     async def list_all(self) -> list[str]:
         """List all playbook titles sorted alphabetically."""
-        return sorted(self._playbooks.keys())
+        # dict.copy() is atomic, so concurrent writers cannot tear it
+        return sorted(self._playbooks.copy())
 
     async def delete_playbook(self, title: str) -> bool:
         """Delete a playbook by title. Returns True if deleted, False if not found."""
-        if title in self._playbooks:
-            del self._playbooks[title]
-            return True
-        return False
+        return await self._write(self._delete, title)
+
+    def _delete(self, title: str) -> bool:
+        with self._lock:
+            if title in self._playbooks:
+                del self._playbooks[title]
+                self._tags.remove(title)
+                if self._sections is not None:
+                    self._sections.remove(title)
+                if self._index is not None:
+                    self._index.remove(title)
+                return True
+            return False
 
     async def clear(self) -> None:
-        """Clear all playbooks."""
-        self._playbooks.clear()
+        """Clear all playbooks (and the content store's file)."""
+        await self._write(self._clear_all)
+
+    def _clear_all(self) -> None:
+        with self._lock:
+            self._clear()
+            if self._content is not None:
+                self._content.clear()
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._playbooks.clear()
+            self._tag_tuples.clear()
+            self._tags.clear()
+            if self._sections is not None:
+                self._sections.clear()
+            if self._index is not None:
+                self._index.clear()
 
     async def count(self) -> int:
         """Return number of playbooks in storage."""
         return len(self._playbooks)
+
+    def export_state(self) -> dict[str, Any]:
+        """
+        Return the storage contents, section index and search index for snapshotting.
+
+        Stored values are exported as they are (compact records, or
+        Playbooks with their cached search views), so a restored storage
+        needs no parsing. Content kept in a content store is exported inline.
+        """
+        with self._lock:
+            playbooks = list(self._playbooks.values())
+            if self._content is not None:
+                # References only point into this process's store
+                playbooks = [
+                    PlaybookRecord.from_playbook(self._load(stored)) for stored in playbooks
+                ]
+            return {
+                "playbooks": playbooks,
+                "sections": self._sections,
+                "search": self._index.export_index() if self._index is not None else None,
+            }
+
+    def restore_state(self, state: dict[str, Any], reuse_index: bool = False) -> None:
+        """
+        Replace the storage contents with state from export_state().
+
+        The configured search provider is kept. It is re-indexed unless
+        reuse_index is set, so its settings always win over those of the
+        storage that was exported.
+
+        Args:
+            state: State returned by export_state()
+            reuse_index: Load the exported search index instead of re-indexing.
+                Only valid when the exporting provider had the same type and
+                settings (see snapshot_key()).
+        """
+        tag_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+        playbooks: dict[str, Playbook | PlaybookRecord] = {}
+        tag_index = TagIndex()
+        for stored in state["playbooks"]:
+            # Convert values from a snapshot taken in the other mode
+            if self._compact and isinstance(stored, Playbook):
+                stored = PlaybookRecord.from_playbook(stored, tag_tuples, self._content)
+            elif not self._compact and isinstance(stored, PlaybookRecord):
+                stored = stored.to_playbook()
+                stored.build_search_view()
+            elif isinstance(stored, PlaybookRecord):
+                stored.tags = tag_tuples.setdefault(stored.tags, stored.tags)
+                if self._content is not None and isinstance(stored.content, str):
+                    stored.content = self._content.put(stored.content)
+            title = stored.title if isinstance(stored, PlaybookRecord) else stored.metadata.title
+            tags = stored.tags if isinstance(stored, PlaybookRecord) else stored.metadata.tags
+            playbooks[title] = stored
+            tag_index.add(title, tags)
+        sections = state.get("sections")
+        if self._sections is not None and (
+            sections is None or sections.keep_content != self._sections.keep_content
+        ):
+            sections = SectionIndex(keep_content=self._content is None)
+            for stored in playbooks.values():
+                sections.add(self._load(stored))
+        with self._lock:
+            self._playbooks = playbooks
+            self._tag_tuples = tag_tuples
+            self._tags = tag_index
+            if self._sections is not None:
+                self._sections = sections
+            if self._index is not None:
+                if reuse_index and state.get("search") is not None:
+                    self._index.restore_index(state["search"])
+                else:
+                    self._index.clear()
+                    self._index.add_many([self._load(stored) for stored in playbooks.values()])
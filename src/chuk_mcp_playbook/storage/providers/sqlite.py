@@ -0,0 +1,337 @@
+"""SQLite storage provider with FTS5 full-text search."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TypeVar
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.search.index import FIELD_WEIGHTS
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.storage.base import PlaybookStorage
+from chuk_mcp_playbook.text import tokenize
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_FIELDS = ("title", "description", "tags", "author", "created_at", "updated_at", "content")
+_COLUMNS = ", ".join(_FIELDS)
+_JOINED_COLUMNS = ", ".join(f"p.{field}" for field in _FIELDS)
+
+_UPSERT = f"""
+INSERT INTO playbooks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(title) DO UPDATE SET
+    description = excluded.description,
+    tags = excluded.tags,
+    author = excluded.author,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    content = excluded.content
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS playbooks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    author TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS playbooks_fts USING fts5(
+    title, tags, description, content,
+    content='playbooks', content_rowid='id', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS playbooks_ai AFTER INSERT ON playbooks BEGIN
+    INSERT INTO playbooks_fts(rowid, title, tags, description, content)
+    VALUES (new.id, new.title, new.tags, new.description, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS playbooks_ad AFTER DELETE ON playbooks BEGIN
+    INSERT INTO playbooks_fts(playbooks_fts, rowid, title, tags, description, content)
+    VALUES ('delete', old.id, old.title, old.tags, old.description, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS playbooks_au AFTER UPDATE ON playbooks BEGIN
+    INSERT INTO playbooks_fts(playbooks_fts, rowid, title, tags, description, content)
+    VALUES ('delete', old.id, old.title, old.tags, old.description, old.content);
+    INSERT INTO playbooks_fts(rowid, title, tags, description, content)
+    VALUES (new.id, new.title, new.tags, new.description, new.content);
+END;
+"""
+
+
+class SQLiteStorage(PlaybookStorage):
+    """
+    Persistent storage provider backed by SQLite.
+
+    Playbooks live in a regular table mirrored into an FTS5 index whose bm25()
+    column weights follow the keyword weights (title > tags > description >
+    content). Blocking sqlite calls run in worker threads so the event loop
+    stays responsive. File databases use WAL mode and one connection per
+    reader thread, so queries run concurrently with a single writer.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        search_provider: SearchProvider | None = None,
+        wal: bool = True,
+        candidate_limit: int = 100,
+    ):
+        """
+        Initialize storage.
+
+        Args:
+            path: Database file path, or ":memory:" for a private in-memory database
+            search_provider: Optional provider used to re-rank the FTS5 candidates.
+                Defaults to ranking with FTS5 bm25() alone.
+            wal: Enable write-ahead logging for concurrent readers (file databases only)
+            candidate_limit: Number of FTS5 candidates handed to search_provider
+        """
+        self._path = str(path)
+        self._in_memory = self._path == ":memory:"
+        self._wal = wal and not self._in_memory
+        self._search = search_provider
+        self._candidate_limit = candidate_limit
+        self._rank_weights = ", ".join(str(weight * 10) for weight in FIELD_WEIGHTS.values())
+
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections_lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._writer = self._connect()
+        with self._write_lock:
+            self._writer.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for this database."""
+        conn = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        if self._wal:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return this thread's read connection."""
+        if self._in_memory:
+            # An in-memory database is private to its connection
+            return self._writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    async def _read(
+        self,
+        fn: Callable[[sqlite3.Connection], T],
+        finish: Callable[[T], U] | None = None,
+    ) -> T | U:
+        """
+        Run a read in a worker thread.
+
+        Args:
+            fn: Read executed against a connection
+            finish: Optional post-processing run in the same worker thread
+                once the connection has been released
+
+        Returns:
+            The result of fn, or of finish applied to it
+        """
+
+        def run() -> T | U:
+            if self._in_memory:
+                with self._write_lock:
+                    result = fn(self._writer)
+            else:
+                result = fn(self._reader())
+            return finish(result) if finish is not None else result
+
+        return await asyncio.to_thread(run)
+
+    async def _write(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a write transaction in a worker thread."""
+
+        def run() -> T:
+            with self._write_lock:
+                self._writer.execute("BEGIN IMMEDIATE")
+                try:
+                    result = fn(self._writer)
+                except BaseException:
+                    self._writer.execute("ROLLBACK")
+                    raise
+                self._writer.execute("COMMIT")
+                return result
+
+        return await asyncio.to_thread(run)
+
+    def close(self) -> None:
+        """Close all database connections."""
+        with self._connections_lock:
+            connections = self._connections[:]
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Row conversion
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_row(playbook: Playbook) -> tuple:
+        metadata = playbook.metadata
+        return (
+            metadata.title,
+            metadata.description,
+            json.dumps(metadata.tags),
+            metadata.author,
+            metadata.created_at.isoformat(),
+            metadata.updated_at.isoformat(),
+            playbook.content,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Playbook:
+        title, description, tags, author, created_at, updated_at, content = row
+        metadata = PlaybookMetadata(
+            title=title,
+            description=description,
+            tags=json.loads(tags),
+            author=author,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+        return Playbook(metadata=metadata, content=content)
+
+    @staticmethod
+    def _match_expression(question: str) -> str:
+        """Build an FTS5 OR-query from the question's keywords."""
+        tokens = tokenize(question)
+        keywords = [
+            token for token in tokens if token not in KeywordSearch.STOP_WORDS and len(token) > 2
+        ] or tokens
+        # Quote every keyword so FTS5 never parses it as an operator
+        return " OR ".join(f'"{keyword}"' for keyword in dict.fromkeys(keywords))
+
+    # ------------------------------------------------------------------
+    # PlaybookStorage
+    # ------------------------------------------------------------------
+
+    async def add_playbook(self, playbook: Playbook) -> None:
+        """Add or update a playbook in storage."""
+        row = self._to_row(playbook)
+
+        def insert(conn: sqlite3.Connection) -> None:
+            conn.execute(_UPSERT, row)
+
+        await self._write(insert)
+
+    async def bulk_add(self, playbooks: list[Playbook]) -> None:
+        """Add or update many playbooks in a single transaction."""
+        rows = [self._to_row(playbook) for playbook in playbooks]
+
+        def insert(conn: sqlite3.Connection) -> None:
+            conn.executemany(_UPSERT, rows)
+
+        await self._write(insert)
+
+    async def get_playbook(self, title: str) -> Optional[Playbook]:
+        """Get a playbook by exact title."""
+        row = await self._read(
+            lambda conn: conn.execute(
+                f"SELECT {_COLUMNS} FROM playbooks WHERE title = ?", (title,)
+            ).fetchone()
+        )
+        return self._from_row(row) if row else None
+
+    async def query(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[Playbook]:
+        """
+        Query playbooks with FTS5.
+        Returns top_k most relevant playbooks sorted by relevance.
+        """
+        expression = self._match_expression(question)
+        if not expression:
+            return []
+
+        limit = self._candidate_limit if self._search is not None else top_k
+        sql = f"""
+            SELECT {_JOINED_COLUMNS}
+            FROM playbooks_fts
+            JOIN playbooks p ON p.id = playbooks_fts.rowid
+            WHERE playbooks_fts MATCH ?
+        """
+        params: list = [expression]
+        if tags:
+            unique_tags = sorted(set(tags))
+            placeholders = ", ".join("?" for _ in unique_tags)
+            if match_all_tags:
+                sql += (
+                    " AND (SELECT COUNT(DISTINCT value) FROM json_each(p.tags)"
+                    f" WHERE value IN ({placeholders})) = ?"
+                )
+                params.extend([*unique_tags, len(unique_tags)])
+            else:
+                sql += (
+                    f" AND EXISTS (SELECT 1 FROM json_each(p.tags) WHERE value IN ({placeholders}))"
+                )
+                params.extend(unique_tags)
+        sql += f" ORDER BY bm25(playbooks_fts, {self._rank_weights}) LIMIT ?"
+        params.append(limit)
+
+        search = self._search
+
+        def rank(rows: list[tuple]) -> list[Playbook]:
+            playbooks = [self._from_row(row) for row in rows]
+            if search is not None:
+                # Re-rank in the worker thread, off the event loop
+                return search.search(playbooks, question, top_k=top_k)
+            return playbooks
+
+        return await self._read(lambda conn: conn.execute(sql, params).fetchall(), rank)
+
+    async def list_all(self) -> list[str]:
+        """List all playbook titles sorted alphabetically."""
+        rows = await self._read(
+            lambda conn: conn.execute("SELECT title FROM playbooks ORDER BY title").fetchall()
+        )
+        return [title for (title,) in rows]
+
+    async def delete_playbook(self, title: str) -> bool:
+        """Delete a playbook by title. Returns True if deleted, False if not found."""
+        return await self._write(
+            lambda conn: (
+                conn.execute("DELETE FROM playbooks WHERE title = ?", (title,)).rowcount > 0
+            )
+        )
+
+    async def clear(self) -> None:
+        """Clear all playbooks."""
+        await self._write(lambda conn: conn.execute("DELETE FROM playbooks"))
+
+    async def count(self) -> int:
+        """Return number of playbooks in storage."""
+        (count,) = await self._read(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM playbooks").fetchone()
+        )
+        return count
@@ -0,0 +1,325 @@
+"""Copy-on-write in-memory storage with lock-free versioned reads."""
+
+import asyncio
+import contextlib
+import copy
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional, TypeVar
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookSectionMatch
+from chuk_mcp_playbook.search.base import SearchProvider
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.storage.base import PlaybookStorage
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.executor import ExecutorMode, QueryExecutor
+from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Content store size below which replaced bodies are never compacted away
+_COMPACT_MIN_BYTES = 1 << 20
+
+
+class VersionedMemoryStorage(PlaybookStorage):
+    """
+    In-memory storage whose readers never wait for writers.
+
+    Two InMemoryStorage replicas hold the same data. Readers use the
+    published replica, which no writer touches while they read. A writer
+    applies its change to the standby replica, publishes it atomically
+    (bumping the version), waits for readers still on the previous version
+    to finish and then replays the change on that replica.
+
+    Features:
+    - Every read sees one immutable version for its whole duration
+    - Writes (including bulk ingestion) run in a thread while queries
+      keep being served from the published version
+    - Failed writes are never published
+    - Stored playbooks and records are shared between the replicas; the
+      tag, section and search indexes exist once per replica
+    - Replicas are read without locks: writers are serialized and never
+      touch a replica while readers are pinned to it
+
+    The search provider is copied for the second replica; pass
+    search_factory for providers that cannot be deep-copied (e.g. sharded
+    search, which owns worker processes).
+
+    A content store is shared by both replicas. After a write, once no
+    reader is pinned to the previous version, the store is compacted if
+    most of its bytes belong to replaced, deleted or cleared playbooks.
+    """
+
+    def __init__(
+        self,
+        search_provider: SearchProvider | None = None,
+        index_sections: bool = False,
+        compact: Optional[bool] = None,
+        executor: Optional[QueryExecutor] = None,
+        search_factory: Optional[Callable[[], SearchProvider]] = None,
+        content_store: Optional[ContentStore] = None,
+    ):
+        """
+        Initialize storage.
+
+        Args:
+            search_provider: Optional search provider. Defaults to KeywordSearch.
+            index_sections: Maintain a section index for query_sections()
+            compact: Store compact records instead of Playbook models.
+                Defaults to True for index-backed providers.
+            executor: Where queries run. Defaults to QueryExecutor().
+            search_factory: Creates the second replica's search provider
+                (default: a deep copy of search_provider)
+            content_store: Keep playbook content on disk in this store
+                instead of in memory (requires compact storage)
+
+        Raises:
+            ValueError: If compact storage or a content store is requested
+                for a scan provider
+        """
+        if search_provider is None:
+            search_provider = SearchFactory.create(SearchType.KEYWORD)
+        standby = search_factory() if search_factory is not None else copy.deepcopy(search_provider)
+
+        # Replicas are only read through this class, which picks the executor
+        self._replicas = tuple(
+            InMemoryStorage(
+                search_provider=provider,
+                index_sections=index_sections,
+                compact=compact,
+                executor=QueryExecutor(ExecutorMode.INLINE),
+                content_store=content_store,
+            )
+            for provider in (search_provider, standby)
+        )
+        for replica in self._replicas:
+            # Writers are serialized by _write_lock and wait for a replica's readers;
+            # readers only need providers that never modify the index on query
+            replica._lock = contextlib.nullcontext()
+        self._content = content_store
+        self._content_checked = 0
+        self._executor = executor if executor is not None else QueryExecutor()
+        self._active = 0
+        self._version = 0
+        self._readers = [0, 0]
+        self._readers_changed = threading.Condition()
+        self._write_lock = threading.RLock()
+
+    @property
+    def version(self) -> int:
+        """Number of writes published so far."""
+        return self._version
+
+    @property
+    def search_provider(self) -> SearchProvider:
+        """The search provider of the published version."""
+        return self._replicas[self._active].search_provider
+
+    @property
+    def executor(self) -> QueryExecutor:
+        """The executor queries run on."""
+        return self._executor
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[InMemoryStorage]:
+        """Pin the published replica for the duration of a read."""
+        with self._readers_changed:
+            index = self._active
+            self._readers[index] += 1
+        try:
+            yield self._replicas[index]
+        finally:
+            with self._readers_changed:
+                self._readers[index] -= 1
+                if not self._readers[index]:
+                    self._readers_changed.notify_all()
+
+    def _read(self, fn: Callable[[InMemoryStorage], T]) -> T:
+        with self._snapshot() as replica:
+            return fn(replica)
+
+    def _write(self, apply: Callable[[InMemoryStorage], T]) -> T:
+        """Apply a change to the standby replica, publish it, then replay it."""
+        with self._write_lock:
+            standby = 1 - self._active
+            # Raises before publishing if the change fails (replicas roll back)
+            result = apply(self._replicas[standby])
+
+            previous = self._flip(publish=True)
+            try:
+                apply(self._replicas[previous])
+            except Exception:
+                logger.exception("Replaying a published write failed; rebuilding the replica")
+                self._resync(previous)
+            self._reclaim_content()
+            return result
+
+    def _write_playbooks(
+        self,
+        playbooks: list[Playbook],
+        apply: Callable[[InMemoryStorage, list[tuple[Playbook, Any]]], T],
+    ) -> T:
+        """Build stored values and write them (apply gets (playbook, stored) pairs)."""
+        # Under the write lock, so compaction never releases a body they reference
+        with self._write_lock:
+            stored = [(playbook, self._replicas[0]._store(playbook)) for playbook in playbooks]
+            return self._write(lambda replica: apply(replica, stored))
+
+    def _flip(self, publish: bool = False) -> int:
+        """Switch readers to the standby replica and wait for those on the previous one."""
+        with self._readers_changed:
+            previous = self._active
+            self._active = 1 - previous
+            if publish:
+                self._version += 1
+            while self._readers[previous]:
+                self._readers_changed.wait()
+        return previous
+
+    def _reclaim_content(self) -> None:
+        """Compact the content store once most of its bytes are garbage."""
+        store = self._content
+        empty = not self._replicas[self._active]._playbooks
+        if store is None or not len(store):
+            return
+        if not empty and len(store) < max(_COMPACT_MIN_BYTES, 2 * self._content_checked):
+            return
+
+        # Records are shared by the replicas unless a snapshot was restored into each
+        records = {
+            id(record): record
+            for replica in self._replicas
+            for record in replica._playbooks.values()
+        }.values()
+        live = sum(ContentStore.length(record.content) for record in records)
+        if 2 * live > len(store):
+            self._content_checked = len(store)
+            return
+
+        mapping = store.compact(record.content for record in records)
+        for record in records:
+            record.content = mapping[record.content]
+        # Readers that took an old reference before the swap are on the active replica
+        self._flip()
+        store.release()
+        self._content_checked = len(store)
+
+    def _resync(self, index: int) -> None:
+        """Rebuild a replica from the published one."""
+        source = self._replicas[self._active]
+        with source._lock:
+            stored = list(source._playbooks.values())
+        target = self._replicas[index]
+        target._clear()
+        target._bulk_add([source._load(value) for value in stored], stored)
+
+    async def add_playbook(self, playbook: Playbook) -> None:
+        """Add or update a playbook and publish a new version."""
+        await asyncio.to_thread(
+            self._write_playbooks, [playbook], lambda replica, stored: replica._add(*stored[0])
+        )
+
+    async def bulk_add(self, playbooks: list[Playbook]) -> None:
+        """
+        Add or update many playbooks as one new version.
+
+        Queries keep being answered from the previous version while the
+        batch is indexed, and never observe a partially applied batch.
+        """
+        # Later duplicates win, as with repeated add_playbook() calls
+        batch = list({playbook.metadata.title: playbook for playbook in playbooks}.values())
+        await asyncio.to_thread(
+            self._write_playbooks,
+            batch,
+            lambda replica, stored: replica._bulk_add(batch, [value for _, value in stored]),
+        )
+
+    async def get_playbook(self, title: str) -> Optional[Playbook]:
+        """Get a playbook by exact title."""
+        with self._snapshot() as replica:
+            return await replica.get_playbook(title)
+
+    async def query(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[Playbook]:
+        """Query the published version using the configured search provider."""
+        return await self._executor.run(
+            self._read,
+            lambda replica: replica._query(question, top_k, tags, match_all_tags),
+            size=await self.count(),
+        )
+
+    async def query_batch(
+        self,
+        questions: list[str],
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[list[Playbook]]:
+        """Run several queries against the same version."""
+        return await self._executor.run(
+            self._read,
+            lambda replica: replica._query_batch(questions, top_k, tags, match_all_tags),
+            size=await self.count(),
+        )
+
+    async def query_sections(
+        self,
+        question: str,
+        top_k: int = 3,
+        tags: Optional[list[str]] = None,
+        match_all_tags: bool = False,
+    ) -> list[PlaybookSectionMatch]:
+        """
+        Return the best-matching `##` sections with their parent titles.
+        Uses the section index when enabled.
+        """
+        if self._replicas[0]._sections is None:
+            return await super().query_sections(
+                question, top_k=top_k, tags=tags, match_all_tags=match_all_tags
+            )
+
+        return await self._executor.run(
+            self._read,
+            lambda replica: replica._query_sections(question, top_k, tags, match_all_tags),
+            size=await self.count(),
+        )
+
+    async def list_all(self) -> list[str]:
+        """List all playbook titles sorted alphabetically."""
+        with self._snapshot() as replica:
+            return await replica.list_all()
+
+    async def delete_playbook(self, title: str) -> bool:
+        """Delete a playbook by title. Returns True if deleted, False if not found."""
+        return await asyncio.to_thread(self._write, lambda replica: replica._delete(title))
+
+    async def clear(self) -> None:
+        """Clear all playbooks."""
+        await asyncio.to_thread(self._write, lambda replica: replica._clear())
+
+    async def count(self) -> int:
+        """Return number of playbooks in the published version."""
+        with self._snapshot() as replica:
+            return await replica.count()
+
+    def export_state(self) -> dict[str, Any]:
+        """Return the published version's contents for snapshotting."""
+        with self._snapshot() as replica:
+            return replica.export_state()
+
+    def restore_state(self, state: dict[str, Any], reuse_index: bool = False) -> None:
+        """Replace the storage contents with state from export_state()."""
+        # The second replica needs its own section index; search indexes are
+        # decoded separately by each replica
+        standby_state = {**state, "sections": copy.deepcopy(state.get("sections"))}
+        states = iter([state, standby_state])
+        self._write(lambda replica: replica.restore_state(next(states), reuse_index))
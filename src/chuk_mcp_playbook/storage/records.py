@@ -0,0 +1,126 @@
+"""Compact in-memory representation of stored playbooks."""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+
+if TYPE_CHECKING:
+    from chuk_mcp_playbook.storage.content import ContentStore
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Microseconds since the Unix epoch (naive datetimes are taken as UTC)."""
+    return (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND
+
+
+def _from_micros(micros: int, aware: bool) -> datetime:
+    return (_EPOCH_UTC if aware else _EPOCH) + timedelta(microseconds=micros)
+
+
+class PlaybookRecord:
+    """
+    Slots-based record of a stored playbook.
+
+    Compared to a Playbook model (two Pydantic objects, their attribute
+    dicts, two datetimes and a tag list), a record keeps the fields in
+    slots, tags as a shared tuple of interned strings, the author interned
+    and timestamps as integer microseconds. Records are converted back to
+    Playbook models only when they leave the storage.
+
+    With a ContentStore, the content slot holds the store's integer
+    reference instead of the markdown body.
+    """
+
+    __slots__ = (
+        "title",
+        "description",
+        "tags",
+        "author",
+        "created_at",
+        "updated_at",
+        "aware",
+        "content",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        description: str,
+        tags: tuple[str, ...],
+        author: Optional[str],
+        created_at: int,
+        updated_at: int,
+        aware: int,
+        content: str | int,
+    ):
+        self.title = title
+        self.description = description
+        self.tags = tags
+        self.author = author
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.aware = aware
+        self.content = content
+
+    @classmethod
+    def from_playbook(
+        cls,
+        playbook: Playbook,
+        tag_sets: Optional[dict[tuple[str, ...], tuple[str, ...]]] = None,
+        content_store: Optional["ContentStore"] = None,
+    ) -> "PlaybookRecord":
+        """
+        Build a record from a playbook.
+
+        Args:
+            playbook: Playbook to store
+            tag_sets: Optional table of tag tuples already in use, so that
+                playbooks with the same tags share one tuple
+            content_store: Optional store to keep the content in
+        """
+        metadata = playbook.metadata
+        tags = tuple(sys.intern(tag) for tag in metadata.tags)
+        if tag_sets is not None:
+            tags = tag_sets.setdefault(tags, tags)
+        return cls(
+            title=metadata.title,
+            description=metadata.description,
+            tags=tags,
+            author=sys.intern(metadata.author) if metadata.author is not None else None,
+            created_at=_to_micros(metadata.created_at),
+            updated_at=_to_micros(metadata.updated_at),
+            # Timestamps are stored in UTC; bit flags remember which were aware
+            aware=(metadata.created_at.tzinfo is not None)
+            | ((metadata.updated_at.tzinfo is not None) << 1),
+            content=content_store.put(playbook.content)
+            if content_store is not None
+            else playbook.content,
+        )
+
+    def to_playbook(self, content_store: Optional["ContentStore"] = None) -> Playbook:
+        """
+        Rebuild the Playbook model (fields were validated when stored).
+
+        Args:
+            content_store: Store the content reference points into, if any
+        """
+        metadata = PlaybookMetadata.model_construct(
+            title=self.title,
+            description=self.description,
+            tags=list(self.tags),
+            author=self.author,
+            created_at=_from_micros(self.created_at, bool(self.aware & 1)),
+            updated_at=_from_micros(self.updated_at, bool(self.aware & 2)),
+        )
+        content = self.content
+        if isinstance(content, int):
+            if content_store is None:
+                raise ValueError(f"content of {self.title!r} lives in a content store")
+            content = content_store.get(content)
+        return Playbook.model_construct(metadata=metadata, content=content)
@@ -0,0 +1,98 @@
+"""Tag index for fast tag-filtered queries."""
+
+from collections.abc import Iterable
+
+
+class TagIndex:
+    """
+    Maps each tag to the set of internal document ids carrying it.
+
+    Features:
+    - Updated incrementally on add/remove (no corpus scans)
+    - OR (any tag) and AND (all tags) matching via set union/intersection
+    - Matches are returned in insertion order, the same order as a scan
+
+    Document ids are assigned on first add and kept while the title exists,
+    so they follow the insertion order of the storage's dictionary.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, set[int]] = {}
+        self._doc_tags: dict[str, frozenset[str]] = {}
+        # One shared frozenset per distinct tag combination
+        self._tag_sets: dict[frozenset[str], frozenset[str]] = {}
+        self._ids: dict[str, int] = {}
+        self._titles: dict[int, str] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, title: str, tags: Iterable[str]) -> None:
+        """Index (or re-index) a document's tags."""
+        doc_id = self._ids.get(title)
+        if doc_id is None:
+            doc_id = self._next_id
+            self._next_id += 1
+            self._ids[title] = doc_id
+            self._titles[doc_id] = title
+        else:
+            self._unlink(doc_id, self._doc_tags[title])
+
+        tag_set = frozenset(tags)
+        tag_set = self._tag_sets.setdefault(tag_set, tag_set)
+        self._doc_tags[title] = tag_set
+        for tag in tag_set:
+            self._postings.setdefault(tag, set()).add(doc_id)
+
+    def remove(self, title: str) -> None:
+        """Remove a document from the index (no-op if absent)."""
+        doc_id = self._ids.pop(title, None)
+        if doc_id is None:
+            return
+        del self._titles[doc_id]
+        self._unlink(doc_id, self._doc_tags.pop(title))
+
+    def clear(self) -> None:
+        """Remove every document."""
+        self._postings.clear()
+        self._doc_tags.clear()
+        self._tag_sets.clear()
+        self._ids.clear()
+        self._titles.clear()
+
+    def _unlink(self, doc_id: int, tags: frozenset[str]) -> None:
+        for tag in tags:
+            postings = self._postings[tag]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[tag]
+
+    def match(self, tags: Iterable[str], match_all: bool = False) -> list[str]:
+        """
+        Return the titles carrying any (or all) of the given tags.
+
+        Args:
+            tags: Tags to match
+            match_all: Require every tag (AND) instead of any tag (OR)
+
+        Returns:
+            Matching titles in insertion order
+        """
+        postings = [self._postings.get(tag, set()) for tag in set(tags)]
+        if not postings:
+            return []
+
+        if match_all:
+            # Intersect smallest first so the working set only shrinks
+            postings.sort(key=len)
+            doc_ids = set(postings[0])
+            for other in postings[1:]:
+                if not doc_ids:
+                    break
+                doc_ids &= other
+        else:
+            doc_ids = set().union(*postings)
+
+        titles = self._titles
+        return [titles[doc_id] for doc_id in sorted(doc_ids)]
@@ -0,0 +1,16 @@
+"""Text normalization helpers shared by the search and indexing layers."""
+
+import re
+
+# Runs of letters/digits (unicode aware, underscores split words)
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Punctuation, whitespace and underscores act as separators, so
+    "Get_Sunset times?" becomes ["get", "sunset", "times"].
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
@@ -0,0 +1,243 @@
+"""Filesystem watcher that keeps storage in sync with playbook directories."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+from chuk_mcp_playbook.loader import PlaybookLoader, SyncResult
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding to Linux inotify, watching whole directory trees."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+
+    def watch_tree(self, root: Path) -> None:
+        """
+        Watch root and every subdirectory (re-adding a watch is a no-op).
+
+        Raises:
+            OSError: If a directory cannot be watched (e.g. ENOSPC once
+                fs.inotify.max_user_watches is exhausted)
+        """
+        for directory in [root, *(p for p in root.glob("**/*") if p.is_dir())]:
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code == errno.ENOENT and directory != root and not directory.is_dir():
+                    # Removed since the scan; its parent's watch reports that
+                    continue
+                raise OSError(code, os.strerror(code), str(directory))
+
+    def drain(self) -> bool:
+        """Read all pending events. Returns True if any event was read."""
+        seen = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return seen
+            if not data:
+                return seen
+            # Events only signal "something changed"; sync works out what
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size + name_len
+                seen = True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PlaybookWatcher:
+    """
+    Watches playbook directories and applies changes to storage.
+
+    Uses inotify on Linux and falls back to polling elsewhere (or when
+    inotify is unavailable). Bursts of events are debounced into a single
+    PlaybookLoader.sync_directory() pass per directory, which only re-reads
+    files whose mtime/size changed and updates storage incrementally.
+
+    The watcher runs in its own thread and event loop (start()), so it never
+    blocks the server's loop; storage operations are short and thread-safe.
+    """
+
+    def __init__(
+        self,
+        loader: PlaybookLoader,
+        directories: list[Path],
+        author: Optional[str] = None,
+        debounce: float = 0.5,
+        poll_interval: float = 2.0,
+        use_inotify: Optional[bool] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            loader: Loader whose manifest tracks the directories
+            directories: Directories to watch (recursively)
+            author: Author recorded for new or changed playbooks
+            debounce: Seconds without events before a sync runs
+            poll_interval: Seconds between syncs when polling
+            use_inotify: Force inotify on/off. Defaults to inotify on Linux.
+        """
+        self.loader = loader
+        self.directories = directories
+        self.author = author
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    async def sync(self) -> list[SyncResult]:
+        """Sync every watched directory once."""
+        results = []
+        for directory in self.directories:
+            try:
+                results.append(await self.loader.sync_directory(directory, author=self.author))
+            except Exception as e:
+                print(f"Error syncing {directory}: {e}", file=sys.stderr)
+        return results
+
+    async def _wait_for_quiet(self) -> None:
+        """Wait until no change has been signalled for the debounce period."""
+        while True:
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.debounce)
+            except asyncio.TimeoutError:
+                return
+
+    async def run(self) -> None:
+        """Watch until stop() is called."""
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._stopped = asyncio.Event()
+
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                print(f"inotify unavailable, polling instead: {e}", file=sys.stderr)
+            else:
+                try:
+                    for directory in self.directories:
+                        inotify.watch_tree(directory)
+                except OSError as e:
+                    # A partial watch would miss changes; poll everything instead
+                    print(f"inotify watch failed, polling instead: {e}", file=sys.stderr)
+                    inotify.close()
+                    inotify = None
+
+        if inotify is not None:
+
+            def on_readable() -> None:
+                if inotify.drain():
+                    self._changed.set()
+
+            self._loop.add_reader(inotify.fd, on_readable)
+
+        self._ready.set()
+        try:
+            # Pick up anything that changed before the watch started
+            await self.sync()
+
+            while not self._stopped.is_set():
+                if inotify is None:
+                    try:
+                        await asyncio.wait_for(self._stopped.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        await self.sync()
+                    continue
+
+                waiters = [
+                    asyncio.ensure_future(self._changed.wait()),
+                    asyncio.ensure_future(self._stopped.wait()),
+                ]
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in waiters:
+                    waiter.cancel()
+                if self._stopped.is_set():
+                    break
+
+                await self._wait_for_quiet()
+                try:
+                    for directory in self.directories:
+                        # New subdirectories need their own watches
+                        inotify.watch_tree(directory)
+                except OSError as e:
+                    print(f"inotify watch failed, polling instead: {e}", file=sys.stderr)
+                    self._loop.remove_reader(inotify.fd)
+                    inotify.close()
+                    inotify = None
+                await self.sync()
+        finally:
+            if inotify is not None:
+                self._loop.remove_reader(inotify.fd)
+                inotify.close()
+
+    def start(self) -> threading.Thread:
+        """Run the watcher in a daemon thread with its own event loop."""
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self.run()),
+            name="playbook-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the watcher and wait for its thread to exit."""
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None:
+            self._thread.join(timeout)
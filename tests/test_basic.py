@@ -1,10 +1,14 @@
 """Basic tests for playbook server."""
 
+from datetime import datetime, timezone
+
 import pytest
 
 from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
 from chuk_mcp_playbook.services.playbook_service import PlaybookService
 from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.storage.records import PlaybookRecord
 
 
 @pytest.mark.asyncio
@@ -58,9 +62,12 @@ async def test_playbook_matching():
 
 
 @pytest.mark.asyncio
-async def test_storage_operations():
-    """Test basic storage operations."""
-    storage = StorageFactory.create(StorageType.MEMORY)
+@pytest.mark.parametrize("search_type", [SearchType.KEYWORD, SearchType.INDEXED])
+async def test_storage_operations(search_type):
+    """Test basic storage operations (Playbook models and compact records)."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type)
+    )
 
     metadata = PlaybookMetadata(
         title="Test",
@@ -79,7 +86,8 @@ async def test_storage_operations():
     # Get by title
     retrieved = await storage.get_playbook("Test")
     assert retrieved is not None
-    assert retrieved.metadata.title == "Test"
+    assert retrieved == playbook
+    assert [p.metadata.title for p in await storage.query("test", tags=["test"])] == ["Test"]
 
     # List all
     titles = await storage.list_all()
@@ -90,3 +98,100 @@ async def test_storage_operations():
     assert deleted
     count = await storage.count()
     assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_compact_records_round_trip():
+    """Compact records rebuild equal playbooks and share interned tags across storage modes."""
+    aware = Playbook(
+        metadata=PlaybookMetadata(
+            title="Aware",
+            description="d",
+            tags=["weather", "time"],
+            author="Chuk AI",
+            created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 5, 2, 8, 0),
+        ),
+        content="Body",
+    )
+    record = PlaybookRecord.from_playbook(aware)
+    assert record.to_playbook() == aware
+    assert record.to_playbook().metadata.created_at.tzinfo is not None
+    assert record.to_playbook().metadata.updated_at.tzinfo is None
+
+    compact = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.INDEXED)
+    )
+    playbooks = [
+        Playbook(
+            metadata=PlaybookMetadata(title=f"P{i}", description="d", tags=["weather", "time"]),
+            content="c",
+        )
+        for i in range(3)
+    ]
+    await compact.bulk_add(playbooks + [aware])
+    records = compact.export_state()["playbooks"]
+    assert all(isinstance(record, PlaybookRecord) for record in records)
+    assert records[0].tags is records[1].tags
+
+    # Snapshots restore into storage of either mode
+    models = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.INDEXED), compact=False
+    )
+    models.restore_state(compact.export_state())
+    assert await models.get_playbook("Aware") == aware
+    compact.restore_state(models.export_state())
+    assert await compact.get_playbook("Aware") == aware
+
+    with pytest.raises(ValueError):
+        StorageFactory.create(StorageType.MEMORY, compact=True)
+
+
+def test_playbook_sections():
+    """Content is split at ## headings, ignoring deeper and fenced headings."""
+    content = (
+        "# Playbook: Get Sunset Times\n\nIntro text.\n\n"
+        "## Description\nFind sunset times.\n\n"
+        "## Steps\n1. Geocode\n### Details\n```\n## not a heading\n```\n2. Fetch\n"
+    )
+    metadata = PlaybookMetadata(title="Get Sunset Times", description="Sunset times")
+    sections = Playbook(metadata=metadata, content=content).sections()
+
+    assert [s.heading for s in sections] == ["Overview", "Description", "Steps"]
+    assert sections[0].content == "Intro text."
+    assert "### Details" in sections[2].content
+    assert "## not a heading" in sections[2].content
+    assert [s.position for s in sections] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index_sections", [True, False])
+async def test_query_sections(index_sections):
+    """Section queries return the best sections with their parent titles."""
+    storage = StorageFactory.create(StorageType.MEMORY, index_sections=index_sections)
+    service = PlaybookService(storage)
+    await service.create_playbook(
+        title="Get Sunset Times",
+        content="# Get Sunset Times\n\n## Prerequisites\nA location\n\n## Steps\n1. Geocode the location\n2. Call the sun tool",
+        description="Sunset and sunrise times",
+        tags=["weather"],
+    )
+    await service.create_playbook(
+        title="Convert Time Zones",
+        content="# Convert Time Zones\n\n## Steps\n1. Call the time server",
+        description="Convert times",
+        tags=["time"],
+    )
+
+    matches = await service.query_sections("How do I geocode for sunset times?", top_k=1)
+    assert len(matches) == 1
+    assert matches[0].title == "Get Sunset Times"
+    assert matches[0].section.heading == "Steps"
+    assert matches[0].to_markdown().startswith("# Get Sunset Times\n\n## Steps\n1. Geocode")
+
+    matches = await service.query_sections("call the server steps", top_k=3, tags=["time"])
+    assert {m.title for m in matches} == {"Convert Time Zones"}
+
+    # Sections follow writes
+    await service.delete_playbook("Get Sunset Times")
+    assert await service.query_sections("geocode") == []
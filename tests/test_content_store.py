@@ -0,0 +1,108 @@
+"""Tests for disk-backed playbook content."""
+
+import pickle
+
+import pytest
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.storage.records import PlaybookRecord
+from tests.test_search import SAMPLE_PLAYBOOKS
+
+
+def test_content_store_reads_back_bodies_through_a_bounded_cache(tmp_path):
+    """Bodies written after the file was mapped are readable; the LRU stays bounded."""
+    METRICS.reset()
+    METRICS.enabled = True
+    store = ContentStore(tmp_path / "content.bin", cache_size=2)
+    try:
+        first = store.put("# Sunset ☀\n\nCall the API.")
+        assert store.get(first) == "# Sunset ☀\n\nCall the API."
+
+        refs = [store.put(f"body {i}") for i in range(3)]
+        assert [store.get(ref) for ref in refs] == ["body 0", "body 1", "body 2"]
+        assert list(store._cache) == refs[1:]
+        assert store.get(refs[2]) == "body 2"
+        assert (METRICS.counter("content.cache_hits"), METRICS.counter("content.cache_misses")) == (
+            1,
+            4,
+        )
+        assert store.get(store.put("")) == ""
+
+        store.clear()
+        assert len(store) == 0
+        with pytest.raises(ValueError):
+            store.get(first)
+    finally:
+        store.close()
+        METRICS.enabled = False
+        METRICS.reset()
+
+
+def test_content_store_compaction_keeps_old_references_until_release(tmp_path):
+    """Compacted bodies move to a new file; the old one stays readable until release()."""
+    store = ContentStore(tmp_path / "content.bin")
+    try:
+        refs = [store.put(f"body {i}") for i in range(4)]
+        mapping = store.compact(refs[::2])
+        assert [store.get(mapping[ref]) for ref in refs[::2]] == ["body 0", "body 2"]
+        assert store.get(refs[1]) == "body 1"
+
+        store.release()
+        assert len(store) == len("body 0body 2")
+        assert (tmp_path / "content.bin").stat().st_size == 0
+        with pytest.raises(ValueError):
+            store.get(refs[1])
+        assert store.get(store.put("body 4")) == "body 4"
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("storage_type", [StorageType.MEMORY, StorageType.VERSIONED])
+@pytest.mark.asyncio
+async def test_lazy_storage_matches_resident_storage(storage_type):
+    """Only content references stay resident; results match in-memory content."""
+    store = ContentStore()
+    lazy = StorageFactory.create(
+        storage_type,
+        search_provider=SearchFactory.create(SearchType.INDEXED),
+        index_sections=True,
+        content_store=store,
+    )
+    resident = StorageFactory.create(
+        storage_type, search_provider=SearchFactory.create(SearchType.INDEXED), index_sections=True
+    )
+    for storage in (lazy, resident):
+        await storage.bulk_add(SAMPLE_PLAYBOOKS)
+
+    replica = lazy._replicas[0] if storage_type == StorageType.VERSIONED else lazy
+    assert all(isinstance(stored.content, int) for stored in replica._playbooks.values())
+    assert all(isinstance(sections, int) for sections in replica._sections._sections.values())
+
+    for question in ["How do I get sunset times?", "time zones", "weather forecast"]:
+        assert await lazy.query(question) == await resident.query(question)
+        assert await lazy.query_sections(question) == await resident.query_sections(question)
+    assert await lazy.get_playbook("Get Sunset Times") == SAMPLE_PLAYBOOKS[0]
+
+    # Snapshots carry the content inline and restore it into the store
+    state = pickle.loads(pickle.dumps(lazy.export_state()))
+    assert all(isinstance(stored.content, str) for stored in state["playbooks"])
+    lazy.restore_state(state)
+    assert await lazy.query("time zones") == await resident.query("time zones")
+
+    await lazy.clear()
+    assert await lazy.count() == 0
+    store.close()
+
+
+def test_content_store_needs_compact_records():
+    """Scan providers keep Playbook models, so they cannot use a content store."""
+    with pytest.raises(ValueError):
+        StorageFactory.create(search_provider=KeywordSearch(), content_store=ContentStore())
+    with pytest.raises(ValueError):
+        PlaybookRecord.from_playbook(
+            SAMPLE_PLAYBOOKS[0], content_store=ContentStore()
+        ).to_playbook()
@@ -0,0 +1,136 @@
+"""Tests for storage query executors."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from chuk_mcp_playbook.metrics import METRICS
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.storage.executor import ExecutorMode, QueryExecutor
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from tests.test_search import SAMPLE_PLAYBOOKS, make_playbook
+
+
+class BlockingSearch(KeywordSearch):
+    """Keyword search whose scoring blocks until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def score(self, playbook, query):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return super().score(playbook, query)
+
+
+async def wait_for(event: threading.Event) -> None:
+    for _ in range(500):
+        if event.is_set():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("event not set")
+
+
+def test_auto_mode_offloads_above_threshold():
+    """AUTO runs small corpora inline and large ones in the thread pool."""
+    executor = QueryExecutor(inline_threshold=100)
+    assert executor.strategy(99) == ExecutorMode.INLINE
+    assert executor.strategy(100) == ExecutorMode.THREAD
+    assert QueryExecutor(mode="inline").strategy(10**6) == ExecutorMode.INLINE
+    assert QueryExecutor(mode=ExecutorMode.THREAD).strategy(0) == ExecutorMode.THREAD
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_keeps_event_loop_responsive_and_limits_concurrency():
+    """A blocked query leaves the loop serving requests; extra queries queue."""
+    METRICS.reset()
+    METRICS.enabled = True
+    search = BlockingSearch()
+    executor = QueryExecutor(mode=ExecutorMode.THREAD, max_concurrent=1)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=search, executor=executor)
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    try:
+        first = asyncio.create_task(storage.query("sunset times", top_k=1))
+        await wait_for(search.entered)
+
+        # The limiter holds the second query back on the event loop
+        second = asyncio.create_task(storage.query("weather forecast", top_k=1))
+        await asyncio.sleep(0.05)
+        assert (executor.running, executor.waiting) == (1, 1)
+        assert METRICS.gauge("storage.queue_depth") == 1
+        assert METRICS.gauge("storage.queries_in_flight") == 1
+
+        # Other requests are still served while scoring is blocked
+        assert await storage.count() == len(SAMPLE_PLAYBOOKS)
+
+        search.release.set()
+        results = await asyncio.gather(first, second)
+        assert [[p.metadata.title for p in found] for found in results] == [
+            ["Get Sunset Times"],
+            ["Get Weather Forecast"],
+        ]
+        assert (executor.running, executor.waiting) == (0, 0)
+        assert METRICS.gauge("storage.queue_depth") == 0
+        assert METRICS.histogram("storage.queue_wait").count == 2
+    finally:
+        search.release.set()
+        executor.close()
+        METRICS.enabled = False
+        METRICS.reset()
+
+
+class BlockingIndex(IndexedSearch):
+    """Index whose queries block (holding the storage lock) until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def query_index(self, query, top_k=3, candidates=None):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return super().query_index(query, top_k=top_k, candidates=candidates)
+
+
+@pytest.mark.asyncio
+async def test_index_query_holding_the_lock_never_blocks_the_event_loop():
+    """Reads and a queued write leave the loop running while a query holds the lock."""
+    index = BlockingIndex()
+    executor = QueryExecutor(mode=ExecutorMode.THREAD)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=index, executor=executor)
+    await storage.bulk_add(SAMPLE_PLAYBOOKS)
+
+    try:
+        query = asyncio.create_task(storage.query("sunset times", top_k=1))
+        await wait_for(index.entered)
+
+        # The write waits for the lock in a thread, not on the loop
+        write = asyncio.create_task(
+            storage.add_playbook(make_playbook("Extra", "Extra playbook", ["extra"], "Filler"))
+        )
+        start = time.perf_counter()
+        ticks = 0
+        while time.perf_counter() - start < 0.2:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert ticks >= 5
+        assert await storage.count() == len(SAMPLE_PLAYBOOKS)
+        assert len(await storage.list_all()) == len(SAMPLE_PLAYBOOKS)
+        assert await storage.get_playbook("Get Sunset Times") == SAMPLE_PLAYBOOKS[0]
+        assert not query.done() and not write.done()
+
+        index.release.set()
+        assert [p.metadata.title for p in await query] == ["Get Sunset Times"]
+        await write
+        assert await storage.count() == len(SAMPLE_PLAYBOOKS) + 1
+    finally:
+        index.release.set()
+        executor.close()
@@ -1,9 +1,13 @@
 """Test playbook loader functionality."""
 
-import pytest
+import io
+import tarfile
+import zipfile
 from pathlib import Path
 
-from chuk_mcp_playbook.loader import PlaybookLoader, load_default_playbooks
+import pytest
+
+from chuk_mcp_playbook.loader import PlaybookLoader, load_default_playbooks, parse_playbook_archive
 from chuk_mcp_playbook.services.playbook_service import PlaybookService
 from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
 
@@ -55,7 +59,9 @@ async def test_query_sunset_playbook():
     assert len(results) == 1
 
     playbook = results[0]
-    assert "sunset" in playbook.metadata.title.lower() or "sunrise" in playbook.metadata.title.lower()
+    assert (
+        "sunset" in playbook.metadata.title.lower() or "sunrise" in playbook.metadata.title.lower()
+    )
     assert "## Steps" in playbook.content
     assert "## MCP Tools Required" in playbook.content
 
@@ -78,3 +84,134 @@ async def test_query_weather_forecast():
     playbook = results[0]
     assert "forecast" in playbook.metadata.title.lower()
     assert "chuk-mcp-open-meteo" in playbook.content
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_processes", [False, True])
+async def test_concurrent_directory_load(tmp_path, capsys, use_processes):
+    """Concurrent ingestion loads every valid file and reports bad ones."""
+    for i in range(20):
+        (tmp_path / f"get_item_{i}.md").write_text(
+            f"# Playbook: Get Item {i}\n\n## Description\nFetch item {i}\n", encoding="utf-8"
+        )
+    (tmp_path / "broken.md").write_bytes(b"\xff\xfe not utf-8 \xff")
+
+    storage = StorageFactory.create(StorageType.MEMORY)
+    service = PlaybookService(storage)
+    loader = PlaybookLoader(service)
+
+    count = await loader.load_from_directory(tmp_path, workers=4, use_processes=use_processes)
+    assert count == 20
+    assert len(await service.list_playbooks()) == 20
+
+    playbook = await service.get_playbook("Get Item 7")
+    assert playbook.metadata.description == "Fetch item 7"
+    assert playbook.metadata.tags == ["get", "item"]
+
+    assert "Error loading broken.md" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_sync_directory_applies_incremental_changes(tmp_path):
+    """Sync re-parses only changed files and removes deleted ones."""
+
+    def write(name: str, title: str, description: str) -> Path:
+        path = tmp_path / name
+        path.write_text(f"# Playbook: {title}\n\n## Description\n{description}\n", encoding="utf-8")
+        return path
+
+    write("get_tides.md", "Get Tides", "Tide tables")
+    sunset = write("get_sunset.md", "Get Sunset", "Sunset times")
+    storage = StorageFactory.create(StorageType.MEMORY)
+    service = PlaybookService(storage)
+    loader = PlaybookLoader(service)
+
+    result = await loader.sync_directory(tmp_path)
+    assert sorted(result.added) == ["Get Sunset", "Get Tides"]
+
+    # Nothing changed on disk
+    result = await loader.sync_directory(tmp_path)
+    assert result.unchanged == 2
+    assert not (result.added or result.updated or result.removed)
+
+    # Modify one file (renaming its playbook), add one, delete one
+    write("get_sunset.md", "Get Sunrise", "Sunrise times and a much longer description")
+    write("get_uv.md", "Get UV Index", "UV levels")
+    (tmp_path / "get_tides.md").unlink()
+
+    result = await loader.sync_directory(tmp_path)
+    assert result.updated == ["Get Sunrise"]
+    assert result.added == ["Get UV Index"]
+    assert sorted(result.removed) == ["Get Sunset", "Get Tides"]
+    assert await service.list_playbooks() == ["Get Sunrise", "Get UV Index"]
+    assert loader.manifest[str(sunset)].title == "Get Sunrise"
+
+
+@pytest.mark.asyncio
+async def test_sync_retries_files_whose_write_failed(tmp_path):
+    """A failed storage write leaves the file untracked, so the next sync retries it."""
+    (tmp_path / "get_tides.md").write_text("# Playbook: Get Tides\n", encoding="utf-8")
+    service = PlaybookService(StorageFactory.create(StorageType.MEMORY))
+    loader = PlaybookLoader(service)
+
+    add_playbooks = service.add_playbooks
+
+    async def fail(playbooks):
+        raise RuntimeError("storage unavailable")
+
+    service.add_playbooks = fail
+    with pytest.raises(RuntimeError):
+        await loader.sync_directory(tmp_path)
+    assert loader.manifest == {}
+
+    service.add_playbooks = add_playbooks
+    result = await loader.sync_directory(tmp_path)
+    assert result.added == ["Get Tides"]
+    assert await service.list_playbooks() == ["Get Tides"]
+
+
+@pytest.mark.asyncio
+async def test_sync_after_full_load_is_noop(tmp_path):
+    """A directory loaded with load_from_directory is already tracked."""
+    (tmp_path / "get_tides.md").write_text("# Playbook: Get Tides\n", encoding="utf-8")
+    service = PlaybookService(StorageFactory.create(StorageType.MEMORY))
+    loader = PlaybookLoader(service)
+
+    assert await loader.load_from_directory(tmp_path) == 1
+    result = await loader.sync_directory(tmp_path)
+    assert result.unchanged == 1
+    assert not (result.added or result.updated or result.removed)
+
+
+@pytest.mark.parametrize("fmt", ["zip", "tar.gz"])
+def test_parse_playbook_archive(tmp_path, fmt):
+    """Markdown members of zip and tar archives are parsed like loose files."""
+    files = {
+        "weather/get_sunset_times.md": "# Playbook: Get Sunset Times\n\n## Description\nSunset times\n",
+        "notes.txt": "not a playbook",
+    }
+    buffer = io.BytesIO()
+    if fmt == "zip":
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for name, text in files.items():
+                archive.writestr(name, text)
+    else:
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for name, text in files.items():
+                data = text.encode()
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+    entries = parse_playbook_archive(buffer.getvalue())
+    assert entries == [
+        {
+            "title": "Get Sunset Times",
+            "description": "Sunset times",
+            "tags": ["get", "sunset", "times"],
+            "content": files["weather/get_sunset_times.md"],
+        }
+    ]
+
+    with pytest.raises(ValueError):
+        parse_playbook_archive(b"plain bytes")
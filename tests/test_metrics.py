@@ -0,0 +1,79 @@
+"""Tests for per-stage metrics."""
+
+import pytest
+
+from chuk_mcp_playbook.metrics import METRICS, Histogram, Metrics
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+
+
+@pytest.fixture
+def metrics():
+    """Enable the shared registry for one test."""
+    METRICS.reset()
+    METRICS.enabled = True
+    yield METRICS
+    METRICS.enabled = False
+    METRICS.reset()
+
+
+def test_histogram_percentiles_and_prometheus_export():
+    """Percentiles land in the right bucket and the export is cumulative."""
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(0.001)
+    for _ in range(10):
+        histogram.observe(0.1)
+    assert 0.0005 < histogram.percentile(50) <= 0.0011
+    assert 0.05 < histogram.percentile(99) <= 0.14
+    assert histogram.summary()["count"] == 100
+
+    registry = Metrics(enabled=True)
+    registry.observe("search.score", 0.001)
+    registry.increment("queries", 2)
+    text = registry.to_prometheus()
+    assert 'chuk_playbook_stage_seconds_bucket{stage="search.score",le="+Inf"} 1' in text
+    assert 'chuk_playbook_stage_seconds_count{stage="search.score"} 1' in text
+    assert "chuk_playbook_queries_total 2" in text
+
+    registry.set_gauge("storage.queue_depth", 3)
+    assert "chuk_playbook_storage_queue_depth 3" in registry.to_prometheus()
+
+    disabled = Metrics()
+    with disabled.timer("search.score"):
+        pass
+    disabled.increment("queries")
+    disabled.set_gauge("storage.queue_depth", 3)
+    assert disabled.snapshot() == {"enabled": False, "stages": {}, "counters": {}, "gauges": {}}
+
+
+@pytest.mark.asyncio
+async def test_query_stages_are_recorded(metrics):
+    """A query records service, storage and search stages; stats report throughput."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.INDEXED)
+    )
+    service = PlaybookService(storage)
+    await service.create_playbook("Get Sunset Times", "Sunset steps", "Sunset times", ["weather"])
+    await service.query_playbooks("sunset times", tags=["weather"])
+    await service.query_playbooks("sunset times", tags=["weather"])
+
+    snapshot = metrics.snapshot()
+    for stage in (
+        "service.ingest",
+        "storage.query",
+        "storage.tag_filter",
+        "search.keywords",
+        "search.score",
+        "search.sort",
+    ):
+        assert snapshot["stages"][stage]["count"] >= 1, stage
+    # The second query is served from the cache
+    assert snapshot["stages"]["storage.query"]["count"] == 1
+    assert snapshot["counters"] == {"ingested_playbooks": 1, "queries": 2}
+
+    stats = await service.get_stats()
+    assert stats["queries"] == 2
+    assert stats["ingested_playbooks"] == 1
+    assert stats["ingest_playbooks_per_s"] > 0
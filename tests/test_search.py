@@ -0,0 +1,345 @@
+"""Tests for search providers."""
+
+import pytest
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+
+
+def make_playbook(title: str, description: str, tags: list[str], content: str) -> Playbook:
+    """Build a playbook for search tests."""
+    metadata = PlaybookMetadata(title=title, description=description, tags=tags)
+    return Playbook(metadata=metadata, content=content)
+
+
+SAMPLE_PLAYBOOKS = [
+    make_playbook(
+        "Get Sunset Times",
+        "Retrieve sunset and sunrise times for a location",
+        ["weather", "sunset"],
+        "# Get Sunset Times\n\n## Steps\n1. Geocode the location\n2. Fetch the forecast",
+    ),
+    make_playbook(
+        "Get Weather Forecast",
+        "Retrieve a multi-day weather forecast",
+        ["weather", "forecast"],
+        "# Get Weather Forecast\n\n## Steps\n1. Call the forecast tool",
+    ),
+    make_playbook(
+        "Convert Time Zones",
+        "Convert a timestamp between time zones",
+        ["time", "timezone"],
+        "# Convert Time Zones\n\nUse the time server.",
+    ),
+]
+
+
+@pytest.mark.asyncio
+async def test_indexed_search_matches_keyword_weights():
+    """Indexed search ranks with the same field weights as keyword search."""
+    search = SearchFactory.create(SearchType.INDEXED)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=search)
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    results = search.query_index("How do I get sunset times?", top_k=3)
+    assert results[0][0] == "Get Sunset Times"
+
+    # "sunset" hits every field; "times" hits title, description and content
+    # -> (0.5 + 0.3 + 0.2 + 0.1 + 0.5 + 0.2 + 0.1) / 2
+    assert results[0][1] == pytest.approx(0.95)
+
+    # Index-backed scores agree with the per-playbook scorer
+    matches, score = search.score(SAMPLE_PLAYBOOKS[0], "How do I get sunset times?")
+    assert matches
+    assert score == pytest.approx(results[0][1])
+
+
+@pytest.mark.asyncio
+async def test_indexed_search_tracks_storage_writes():
+    """The inverted index follows add, replace, delete and clear."""
+    search = SearchFactory.create(SearchType.INDEXED)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=search)
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    results = await storage.query("forecast", top_k=3)
+    assert [p.metadata.title for p in results] == ["Get Weather Forecast", "Get Sunset Times"]
+
+    # Tag filter restricts candidates
+    results = await storage.query("forecast", top_k=3, tags=["sunset"])
+    assert [p.metadata.title for p in results] == ["Get Sunset Times"]
+
+    # Replacing a playbook drops its old postings
+    await storage.add_playbook(
+        make_playbook("Get Weather Forecast", "Hourly outlook", ["weather"], "Nothing here")
+    )
+    assert await storage.query("multi-day", top_k=3) == []
+    results = await storage.query("outlook", top_k=3)
+    assert [p.metadata.title for p in results] == ["Get Weather Forecast"]
+
+    await storage.delete_playbook("Get Sunset Times")
+    results = await storage.query("sunset", top_k=3)
+    assert results == []
+
+    await storage.clear()
+    assert await storage.query("time zones", top_k=3) == []
+
+
+@pytest.mark.asyncio
+async def test_bm25_prefers_focused_playbooks_and_tracks_stats():
+    """BM25 ranks short focused matches above long diluted ones."""
+    search = SearchFactory.create(SearchType.BM25)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=search)
+
+    focused = make_playbook("Tide Tables", "Check tide tables", ["tide"], "Tide tide tide.")
+    diluted = make_playbook(
+        "Coastal Trip",
+        "Plan a coastal trip",
+        ["travel"],
+        "Pack bags. " * 50 + "Check the tide.",
+    )
+    await storage.add_playbook(diluted)
+    await storage.add_playbook(focused)
+
+    results = search.query_index("tide", top_k=2)
+    assert [title for title, _ in results] == ["Tide Tables", "Coastal Trip"]
+    assert all(0.0 < score < 1.0 for _, score in results)
+
+    # Single-document scoring uses the same statistics
+    matches, score = search.score(focused, "tide")
+    assert matches
+    assert score == pytest.approx(results[0][1])
+
+    # Statistics follow deletions
+    await storage.delete_playbook("Tide Tables")
+    assert [p.metadata.title for p in await storage.query("tide")] == ["Coastal Trip"]
+    assert search._index.document_frequency("tide") == 1
+
+
+@pytest.mark.asyncio
+async def test_search_view_built_at_ingest():
+    """Storage precomputes the normalized search view once per playbook."""
+    storage = StorageFactory.create(StorageType.MEMORY)
+    playbook = make_playbook("Get UV Index", "Check UV Levels", ["Weather"], "Use the UV tool")
+    await storage.add_playbook(playbook)
+
+    view = playbook.search_view
+    assert view.title == "get uv index"
+    assert view.tags == ("weather",)
+    # Scan providers never tokenize; tokens are built on first use
+    assert "content_tokens" not in view.__dict__
+    assert "levels" in view.description_tokens
+    assert playbook.search_view is view
+
+    # The view is immutable
+    with pytest.raises(Exception):
+        view.title = "changed"
+
+    results = await storage.query("uv weather")
+    assert results == [playbook]
+
+
+def test_search_with_scores_heap_top_k():
+    """Bounded top-k returns sorted (playbook, score) pairs with stable ties."""
+    search = SearchFactory.create(SearchType.KEYWORD)
+    playbooks = [
+        make_playbook(f"Forecast {i}", "Weather outlook", ["weather"], "Forecast body")
+        for i in range(5)
+    ] + SAMPLE_PLAYBOOKS
+
+    results = search.search_with_scores(playbooks, "forecast", top_k=3)
+    assert [p.metadata.title for p, _ in results] == [
+        "Get Weather Forecast",
+        "Forecast 0",
+        "Forecast 1",
+    ]
+    assert [score for _, score in results] == pytest.approx([1.0, 0.6, 0.6])
+
+    assert search.search(playbooks, "forecast", top_k=3) == [p for p, _ in results]
+    assert search.search_with_scores(playbooks, "forecast", top_k=0) == []
+
+
+def test_max_score_bound_skips_scoring():
+    """Playbooks whose upper bound cannot beat the top_k are never scored."""
+
+    class CountingSearch(type(SearchFactory.create(SearchType.KEYWORD))):
+        scored = 0
+
+        def score(self, playbook, query):
+            CountingSearch.scored += 1
+            return super().score(playbook, query)
+
+    search = CountingSearch()
+    strong = make_playbook("Tide Report", "Tide times", ["tide"], "tide")
+    weak = [make_playbook(f"Other {i}", "Unrelated", ["misc"], "tide") for i in range(20)]
+
+    results = search.search_with_scores([strong] + weak, "tide", top_k=1)
+    assert results[0][0] is strong
+    assert CountingSearch.scored == 1
+
+    # Actual scores never exceed the bound
+    for playbook in weak:
+        assert search.score(playbook, "tide")[1] <= search.max_score(playbook, "tide")
+
+
+def test_search_view_does_not_affect_equality():
+    """Building the cached view leaves playbook equality unchanged."""
+    playbook = make_playbook("Get UV Index", "Check UV", ["weather"], "Use the UV tool")
+    copy = playbook.model_copy(deep=True)
+    playbook.build_search_view()
+    assert playbook == copy
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search_type", [SearchType.KEYWORD, SearchType.INDEXED])
+async def test_tag_index_any_and_all(search_type):
+    """Tag filters use OR by default, AND on request, and track writes."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type)
+    )
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    def titles(results):
+        return [p.metadata.title for p in results]
+
+    results = await storage.query("retrieve forecast", top_k=5, tags=["sunset", "forecast"])
+    assert set(titles(results)) == {"Get Sunset Times", "Get Weather Forecast"}
+
+    results = await storage.query(
+        "retrieve forecast", top_k=5, tags=["weather", "forecast"], match_all_tags=True
+    )
+    assert titles(results) == ["Get Weather Forecast"]
+
+    assert await storage.query("retrieve", tags=["weather", "time"], match_all_tags=True) == []
+    assert await storage.query("retrieve", tags=["missing"]) == []
+
+    # Re-tagging and deleting update the index
+    await storage.add_playbook(
+        make_playbook("Get Weather Forecast", "Retrieve a forecast", ["marine"], "Tides")
+    )
+    assert await storage.query("retrieve", tags=["forecast"]) == []
+    assert titles(await storage.query("retrieve", tags=["marine"])) == ["Get Weather Forecast"]
+
+    await storage.delete_playbook("Get Sunset Times")
+    assert await storage.query("retrieve", tags=["weather"]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fusion", ["rrf", "weighted"])
+async def test_hybrid_search_fuses_indexed_providers(fusion):
+    """Hybrid search forwards writes and fuses bounded sub-rankings."""
+    import pickle
+
+    from chuk_mcp_playbook.search.providers import BM25Search, HybridSearch, IndexedSearch
+
+    search = SearchFactory.create(
+        SearchType.HYBRID,
+        providers=[IndexedSearch(), BM25Search()],
+        fusion=fusion,
+        candidate_limit=2,
+    )
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=search)
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    results = search.query_index("How do I get sunset times?", top_k=3)
+    assert results[0][0] == "Get Sunset Times"
+    assert all(0.0 < score <= 1.0 for _, score in results)
+    if fusion == "rrf":
+        # Ranked first by both providers
+        assert results[0][1] == pytest.approx(1.0)
+
+    # Scanning without the shared index gives the same top result
+    scanned = HybridSearch(providers=[IndexedSearch(), BM25Search()], fusion=fusion)
+    assert scanned.search(SAMPLE_PLAYBOOKS, "How do I get sunset times?", top_k=1) == [
+        SAMPLE_PLAYBOOKS[0]
+    ]
+
+    await storage.delete_playbook("Get Sunset Times")
+    assert "Get Sunset Times" not in [title for title, _ in search.query_index("sunset", top_k=3)]
+
+    # Worker threads are not part of the pickled state
+    restored = pickle.loads(pickle.dumps(search))
+    assert restored.query_index("forecast", top_k=1) == search.query_index("forecast", top_k=1)
+
+    with pytest.raises(ValueError):
+        HybridSearch(providers=[IndexedSearch(), SearchFactory.create(SearchType.KEYWORD)])
+
+
+def test_hybrid_search_close_releases_threads_and_sub_providers():
+    """close() shuts the worker pool down and closes sub-providers that have close()."""
+    from chuk_mcp_playbook.search.providers import BM25Search, HybridSearch, IndexedSearch
+
+    class ClosableIndex(IndexedSearch):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    closable = ClosableIndex()
+    search = HybridSearch(providers=[closable, BM25Search()])
+    search.add_many(SAMPLE_PLAYBOOKS)
+    assert search.query_index("sunset", top_k=1)[0][0] == "Get Sunset Times"
+    workers = set(search._executor._threads)
+    assert workers
+
+    search.close()
+    assert closable.closed
+    assert not any(worker.is_alive() for worker in workers)
+
+
+def test_trigram_index_and_bounded_edit_distance():
+    """Candidate terms come from trigram overlap and are verified by edit distance."""
+    from chuk_mcp_playbook.search.ngram import TrigramIndex, bounded_edit_distance
+
+    assert bounded_edit_distance("sunest", "sunset", 1) == 1  # transposition
+    assert bounded_edit_distance("sunset", "sunsets", 1) == 1
+    assert bounded_edit_distance("sunset", "subset", 0) is None
+    assert bounded_edit_distance("forecast", "fourcast", 2) == 2
+    assert bounded_edit_distance("weather", "whether", 1) is None
+
+    index = TrigramIndex()
+    for term in ["sunset", "sunrise", "subset", "weather", "forecast"]:
+        index.add(term)
+    assert index.similar("sunest", 1) == [("sunset", 1)]
+    assert index.similar("sunsets", 2) == [("sunset", 1), ("subset", 2)]
+
+    index.remove("sunset")
+    assert "sunset" not in index
+    assert index.similar("sunest", 1) == []
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_search_tolerates_typos():
+    """Typos find playbooks through the vocabulary; exact matches score higher."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.FUZZY)
+    )
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+    search = storage.search_provider
+
+    assert (
+        await StorageFactory.create(
+            StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.INDEXED)
+        ).query("sunest times")
+        == []
+    )
+
+    results = search.query_index("sunest tmes", top_k=3)
+    assert results[0][0] == "Get Sunset Times"
+    exact = search.query_index("sunset times", top_k=1)[0]
+    assert exact[0] == "Get Sunset Times"
+    assert results[0][1] < exact[1]
+
+    # Scanning agrees with the index
+    matches, score = search.score(SAMPLE_PLAYBOOKS[0], "sunest tmes")
+    assert matches
+    assert score == pytest.approx(results[0][1])
+
+    # Terms only used by a deleted playbook leave the vocabulary
+    await storage.delete_playbook("Convert Time Zones")
+    assert search.query_index("timezoens", top_k=3) == []
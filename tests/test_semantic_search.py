@@ -0,0 +1,131 @@
+"""Tests for the offline semantic search provider."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType  # noqa: E402
+from chuk_mcp_playbook.search.providers import semantic as semantic_module  # noqa: E402
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType  # noqa: E402
+from tests.test_search import SAMPLE_PLAYBOOKS, make_playbook  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_matches_without_shared_keywords():
+    """Inflected and compound words find playbooks the keyword index misses."""
+    semantic = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.SEMANTIC)
+    )
+    indexed = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.INDEXED)
+    )
+    for playbook in SAMPLE_PLAYBOOKS:
+        await semantic.add_playbook(playbook)
+        await indexed.add_playbook(playbook)
+
+    assert await indexed.query("timezones conversion") == []
+    results = await semantic.query("timezones conversion")
+    assert results[0].metadata.title == "Convert Time Zones"
+
+    results = await semantic.query("sunsets at dusk")
+    assert results[0].metadata.title == "Get Sunset Times"
+
+    # Nothing similar, nothing returned
+    assert await semantic.query("xyzzy") == []
+
+    # Tag candidates restrict the matrix rows that are scored
+    results = await semantic.query("How do I get sunset times?", tags=["time"])
+    assert [p.metadata.title for p in results] == ["Convert Time Zones"]
+
+    provider = semantic.search_provider
+    matches, score = provider.score(SAMPLE_PLAYBOOKS[0], "How do I get sunset times?")
+    assert matches
+    assert score == pytest.approx(
+        provider.query_index("How do I get sunset times?", top_k=1)[0][1], abs=1e-5
+    )
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_incremental_updates_and_projection():
+    """Rows are replaced, removed and re-projected as the corpus changes."""
+    provider = SearchFactory.create(SearchType.SEMANTIC, dimensions=2)
+    storage = StorageFactory.create(StorageType.MEMORY, search_provider=provider)
+    for playbook in SAMPLE_PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    results = provider.query_index("timezones conversion", top_k=1)
+    assert results[0][0] == "Convert Time Zones"
+    assert provider._matrix.shape[1] == 2
+
+    # Replacing a playbook overwrites its row in place
+    await storage.add_playbook(
+        make_playbook("Convert Time Zones", "Check tide tables", ["marine"], "Tides")
+    )
+    assert len(provider) == 3
+    assert provider.query_index("tide tables", top_k=1)[0][0] == "Convert Time Zones"
+
+    # Removing the first row moves the last row into its slot
+    await storage.delete_playbook("Get Sunset Times")
+    assert len(provider) == 2
+    assert provider.query_index("tide tables", top_k=1)[0][0] == "Convert Time Zones"
+
+    # Growing past the refit threshold refits the projection at write time
+    for i in range(4):
+        await storage.add_playbook(
+            make_playbook(f"Extra {i}", f"Extra playbook {i}", ["extra"], "Filler")
+        )
+    assert provider._fitted_count == 4
+    provider.query_index("extra", top_k=1)
+    assert provider._fitted_count == 4
+
+    await storage.clear()
+    assert provider.query_index("tide tables") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search_type", [SearchType.SEMANTIC, SearchType.HYBRID])
+async def test_query_index_batch_matches_single_queries(search_type):
+    """One matrix product over the batch ranks exactly like separate queries."""
+    provider = SearchFactory.create(search_type)
+    for playbook in SAMPLE_PLAYBOOKS:
+        provider.add(playbook)
+
+    questions = ["sunsets at dusk", "xyzzy", "timezones conversion", "weather forecast"]
+    batch = provider.query_index_batch(questions, top_k=2)
+    for question, results in zip(questions, batch):
+        single = provider.query_index(question, top_k=2)
+        assert [title for title, _ in results] == [title for title, _ in single]
+        assert [score for _, score in results] == pytest.approx(
+            [score for _, score in single], abs=1e-5
+        )
+
+
+def test_sparse_postings_survive_replacements_and_rebuilds(monkeypatch):
+    """Hashed-space postings stay consistent through updates, removals and rebuilds."""
+    monkeypatch.setattr(semantic_module, "_MIN_TAIL_ENTRIES", 2048)
+    provider = SearchFactory.create(SearchType.SEMANTIC)
+    words = "sunset tide forecast timezone lunar harbour compass".split()
+
+    def playbook(i: int, version: int):
+        body = " ".join(f"{words[(i + j) % len(words)]}{j % 9}" for j in range(40 + version))
+        return make_playbook(f"Playbook {i}", f"{words[i % len(words)]} guide", ["ops"], body)
+
+    for version in range(4):
+        provider.add_many([playbook(i, version) for i in range(40)])
+    for i in range(0, 40, 3):
+        provider.remove(f"Playbook {i}")
+    provider.add(playbook(1, 4))
+    # Sorted postings were rebuilt; the latest writes sit in the tail
+    assert len(provider._posting_values) and provider._tail_size
+
+    current = {f"Playbook {i}": playbook(i, 3) for i in range(40) if i % 3}
+    current["Playbook 1"] = playbook(1, 4)
+    for query in ["sunset guide", "harbour4 compass2", "lunar tide"]:
+        results = provider.query_index(query, top_k=5)
+        assert results
+        for title, score in results:
+            assert score == pytest.approx(provider.score(current[title], query)[1], abs=1e-5)
+
+    for title in current:
+        provider.remove(title)
+    assert not provider._tail_size and provider.query_index("sunset guide") == []
@@ -0,0 +1,208 @@
+"""Tests for the playbook service layer."""
+
+import asyncio
+
+import pytest
+
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.storage.providers.memory import InMemoryStorage
+
+
+async def make_service(**kwargs) -> PlaybookService:
+    """Service with two weather playbooks."""
+    service = PlaybookService(StorageFactory.create(StorageType.MEMORY), **kwargs)
+    await service.create_playbook("Get Sunset Times", "Sunset steps", "Sunset times", ["weather"])
+    await service.create_playbook("Get Forecast", "Forecast steps", "Daily forecast", ["weather"])
+    return service
+
+
+@pytest.mark.asyncio
+async def test_query_cache_hits_and_invalidation():
+    """Repeated queries hit the cache until a write bumps the generation."""
+    service = await make_service()
+
+    first = await service.query_playbooks("How do I get sunset times?")
+    # Case and spacing differences share one cache entry
+    second = await service.query_playbooks("how do i  get SUNSET times?")
+    assert first == second
+
+    stats = await service.get_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
+
+    # Different top_k or tags are separate entries
+    await service.query_playbooks("How do I get sunset times?", top_k=1)
+    await service.query_playbooks("How do I get sunset times?", tags=["weather"])
+    assert (await service.get_stats())["cache_misses"] == 3
+
+    # Writes invalidate cached results
+    await service.create_playbook("Sunset Photography", "Golden hour", "Sunset photos", ["photo"])
+    results = await service.query_playbooks("sunset", top_k=3)
+    assert "Sunset Photography" in [p.metadata.title for p in results]
+
+    await service.delete_playbook("Sunset Photography")
+    results = await service.query_playbooks("sunset", top_k=3)
+    assert "Sunset Photography" not in [p.metadata.title for p in results]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_ttl_and_disable():
+    """Expired entries and a zero-size cache always go to storage."""
+    service = await make_service(cache_ttl=0)
+    await service.query_playbooks("forecast")
+    await service.query_playbooks("forecast")
+    assert (await service.get_stats())["cache_hits"] == 0
+
+    service = await make_service(cache_size=0)
+    await service.query_playbooks("forecast")
+    await service.query_playbooks("forecast")
+    stats = await service.get_stats()
+    assert stats["cache_hits"] == 0
+    assert stats["cache_entries"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "search_type", [SearchType.KEYWORD, SearchType.INDEXED, SearchType.BM25, SearchType.FUZZY]
+)
+async def test_query_playbooks_batch_matches_single_queries(search_type):
+    """Batch results equal per-question queries; duplicates and cached answers are reused."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type)
+    )
+    service = PlaybookService(storage)
+    await service.create_playbook("Get Sunset Times", "Sunset steps", "Sunset times", ["weather"])
+    await service.create_playbook("Get Forecast", "Forecast steps", "Daily forecast", ["weather"])
+    await service.create_playbook("Sunset Photography", "Golden hour", "Sunset photos", ["photo"])
+
+    questions = ["sunset times", "daily forecast", "golden hour photos", "SUNSET times", "zzz"]
+    expected = [await storage.query(question, top_k=2, tags=["weather"]) for question in questions]
+
+    await service.query_playbooks("daily forecast", top_k=2, tags=["weather"])
+    batch = await service.query_playbooks_batch(questions, top_k=2, tags=["weather"])
+    assert batch == expected
+
+    stats = await service.get_stats()
+    # One cached answer; the duplicate question shares the first one's result
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search_type", [SearchType.KEYWORD, SearchType.INDEXED, SearchType.FUZZY])
+async def test_ingest_playbooks_is_all_or_nothing(search_type):
+    """A batch is validated up front and rolled back if indexing fails."""
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type)
+    )
+    service = PlaybookService(storage)
+    await service.create_playbook("Get Forecast", "Forecast steps", "Daily forecast", ["weather"])
+
+    entries = [
+        {
+            "title": "Get Sunset Times",
+            "content": "Sunset steps",
+            "description": "Sunset times",
+            "tags": ["weather"],
+        },
+        {"title": "Get Forecast", "content": "Hourly steps", "description": "Hourly forecast"},
+    ]
+    with pytest.raises(ValueError, match="entry 1: invalid description.*entry 2: duplicate"):
+        await service.ingest_playbooks(
+            [entries[0], {"title": "No Description", "content": "x"}, entries[0]]
+        )
+    assert await service.list_playbooks() == ["Get Forecast"]
+
+    ingested = await service.ingest_playbooks(entries, author="CI")
+    assert [p.metadata.author for p in ingested] == ["CI", "CI"]
+    assert await service.list_playbooks() == ["Get Forecast", "Get Sunset Times"]
+    assert [
+        p.metadata.title for p in await service.query_playbooks("hourly", tags=["weather"])
+    ] == []
+    assert [p.metadata.title for p in await service.query_playbooks("hourly")] == ["Get Forecast"]
+
+    # A failure while indexing restores the previous playbooks
+    if search_type != SearchType.KEYWORD:
+
+        def fail(playbooks):
+            raise RuntimeError("index unavailable")
+
+        storage.search_provider.add_many = fail
+        with pytest.raises(RuntimeError):
+            await service.ingest_playbooks(
+                [
+                    {
+                        "title": "Get Forecast",
+                        "content": "Weekly steps",
+                        "description": "Weekly forecast",
+                    },
+                    {
+                        "title": "Get Moon Phase",
+                        "content": "Moon steps",
+                        "description": "Moon phase",
+                    },
+                ]
+            )
+        assert await service.list_playbooks() == ["Get Forecast", "Get Sunset Times"]
+        assert (await service.get_playbook("Get Forecast")).content == "Hourly steps"
+        assert [p.metadata.title for p in await service.query_playbooks("moon")] == []
+        assert [p.metadata.title for p in await service.query_playbooks("hourly")] == [
+            "Get Forecast"
+        ]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_never_serves_results_older_than_published_writes():
+    """A write visible to readers before it returns already misses the cache."""
+    service = await make_service()
+    storage = service.storage
+    published = asyncio.Event()
+    finish = asyncio.Event()
+    add_playbook = storage.add_playbook
+
+    async def add_then_wait(playbook):
+        # Like versioned storage: publish, then wait before returning
+        await add_playbook(playbook)
+        published.set()
+        await finish.wait()
+
+    storage.add_playbook = add_then_wait
+    assert [p.metadata.title for p in await service.query_playbooks("photography")] == []
+
+    write = asyncio.create_task(
+        service.create_playbook("Sunset Photography", "Golden hour", "Sunset photos", ["photo"])
+    )
+    await published.wait()
+    assert await service.get_playbook("Sunset Photography") is not None
+    results = await service.query_playbooks("photography")
+    assert [p.metadata.title for p in results] == ["Sunset Photography"]
+
+    finish.set()
+    await write
+    results = await service.query_playbooks("photography")
+    assert [p.metadata.title for p in results] == ["Sunset Photography"]
+
+
+class LegacyQueryStorage(InMemoryStorage):
+    """Storage whose query() predates match_all_tags."""
+
+    async def query(self, question, top_k=3, tags=None):
+        return await super().query(question, top_k=top_k, tags=tags)
+
+
+@pytest.mark.asyncio
+async def test_storage_without_match_all_tags_keeps_working():
+    """Any-tag queries never pass match_all_tags to the storage."""
+    storage = LegacyQueryStorage()
+    service = PlaybookService(storage)
+    await service.create_playbook("Get Forecast", "Forecast steps", "Daily forecast", ["weather"])
+
+    results = await service.query_playbooks("forecast", tags=["weather"])
+    assert [p.metadata.title for p in results] == ["Get Forecast"]
+    assert len(await service.query_playbooks_batch(["forecast", "daily"])) == 2
+
+    # Sections fall back to query() when storage has no section index
+    sections = await service.query_sections("forecast")
+    assert [match.title for match in sections] == ["Get Forecast"]
@@ -0,0 +1,178 @@
+"""Tests for startup snapshots."""
+
+import os
+
+import pytest
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.snapshot import load_playbooks_with_snapshot, read_snapshot, snapshot_key
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+
+PLAYBOOK = """# Playbook: {title}
+
+## Description
+{description}
+
+## Steps
+1. Do the thing
+"""
+
+
+def make_service() -> PlaybookService:
+    """Service over indexed in-memory storage."""
+    search = SearchFactory.create(SearchType.INDEXED)
+    return PlaybookService(StorageFactory.create(StorageType.MEMORY, search_provider=search))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restores_and_detects_changes(tmp_path):
+    """A valid snapshot is restored; edited sources trigger a rebuild."""
+    playbooks_dir = tmp_path / "playbooks"
+    playbooks_dir.mkdir()
+    sunset = playbooks_dir / "get_sunset_times.md"
+    sunset.write_text(PLAYBOOK.format(title="Get Sunset Times", description="Sunset times"))
+    (playbooks_dir / "get_tides.md").write_text(
+        PLAYBOOK.format(title="Get Tides", description="Tides")
+    )
+    snapshot_path = tmp_path / "cache" / "snapshot.bin"
+
+    # Cold start writes the snapshot
+    assert await load_playbooks_with_snapshot(make_service(), snapshot_path, playbooks_dir) == 2
+    assert read_snapshot(snapshot_path) is not None
+
+    # Warm start restores playbooks and the search index without parsing
+    service = make_service()
+    assert await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir) == 2
+    results = await service.query_playbooks("sunset")
+    assert [p.metadata.title for p in results] == ["Get Sunset Times"]
+
+    # Touching a file without changing it keeps the snapshot valid
+    stat = sunset.stat()
+    os.utime(sunset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    service = make_service()
+    await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir)
+    assert await service.get_playbook("Get Sunset Times") is not None
+
+    # Editing a file invalidates it
+    sunset.write_text(PLAYBOOK.format(title="Get Sunrise Times", description="Sunrise times"))
+    service = make_service()
+    await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir)
+    assert await service.list_playbooks() == ["Get Sunrise Times", "Get Tides"]
+
+
+@pytest.mark.asyncio
+async def test_corrupt_snapshot_is_rebuilt(tmp_path):
+    """An unreadable snapshot falls back to loading from source."""
+    playbooks_dir = tmp_path / "playbooks"
+    playbooks_dir.mkdir()
+    (playbooks_dir / "get_tides.md").write_text(
+        PLAYBOOK.format(title="Get Tides", description="Tides")
+    )
+    snapshot_path = tmp_path / "snapshot.bin"
+    snapshot_path.write_bytes(b"not a snapshot")
+
+    service = make_service()
+    assert await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir) == 1
+    assert read_snapshot(snapshot_path) is not None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_ignored_for_other_search_provider(tmp_path):
+    """Switching search providers rebuilds instead of restoring the old index."""
+    playbooks_dir = tmp_path / "playbooks"
+    playbooks_dir.mkdir()
+    (playbooks_dir / "get_tides.md").write_text(
+        PLAYBOOK.format(title="Get Tides", description="Tides")
+    )
+    snapshot_path = tmp_path / "snapshot.bin"
+
+    await load_playbooks_with_snapshot(make_service(), snapshot_path, playbooks_dir)
+
+    storage = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(SearchType.BM25)
+    )
+    await load_playbooks_with_snapshot(PlaybookService(storage), snapshot_path, playbooks_dir)
+    assert type(storage.search_provider).__name__ == "BM25Search"
+    assert [p.metadata.title for p in await storage.query("tides")] == ["Get Tides"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_keeps_live_provider_and_survives_write_errors(tmp_path, monkeypatch):
+    """Restores load into the configured provider; snapshot errors are not fatal."""
+    playbooks_dir = tmp_path / "playbooks"
+    playbooks_dir.mkdir()
+    (playbooks_dir / "get_tides.md").write_text(
+        PLAYBOOK.format(title="Get Tides", description="Tides")
+    )
+    snapshot_path = tmp_path / "snapshot.bin"
+    await load_playbooks_with_snapshot(make_service(), snapshot_path, playbooks_dir)
+
+    # Same settings: restored into (not replaced by) the live provider
+    service = make_service()
+    search = service.storage.search_provider
+    await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir)
+    assert service.storage.search_provider is search
+    assert [p.metadata.title for p in await service.query_playbooks("tides")] == ["Get Tides"]
+
+    # Other settings or another package version: the snapshot is rebuilt
+    custom = IndexedSearch(stop_words={"get"})
+    assert snapshot_key(StorageFactory.create(search_provider=custom)) != snapshot_key(
+        service.storage
+    )
+    monkeypatch.setattr("chuk_mcp_playbook.snapshot.__version__", "0.0.0-other")
+    assert read_snapshot(snapshot_path)["key"] != snapshot_key(service.storage)
+
+    # A snapshot that cannot be pickled is skipped; the playbooks still load
+    def fail(*args, **kwargs):
+        raise TypeError("cannot pickle '_thread.lock' object")
+
+    monkeypatch.setattr("chuk_mcp_playbook.snapshot.pickle.dump", fail)
+    service = make_service()
+    assert await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir) == 1
+    assert await service.list_playbooks() == ["Get Tides"]
+    assert not snapshot_path.with_name("snapshot.bin.tmp").exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_type", [StorageType.MEMORY, StorageType.VERSIONED])
+async def test_snapshot_restores_search_index_without_reindexing(
+    tmp_path, monkeypatch, storage_type
+):
+    """A matching snapshot loads the saved index; every replica gets its own copy."""
+    playbooks_dir = tmp_path / "playbooks"
+    playbooks_dir.mkdir()
+    for title in ("Get Sunset Times", "Get Tides"):
+        (playbooks_dir / f"{title.lower().replace(' ', '_')}.md").write_text(
+            PLAYBOOK.format(title=title, description=title)
+        )
+    snapshot_path = tmp_path / "snapshot.bin"
+
+    def make_storage_service() -> PlaybookService:
+        search = SearchFactory.create(SearchType.INDEXED)
+        return PlaybookService(StorageFactory.create(storage_type, search_provider=search))
+
+    await load_playbooks_with_snapshot(make_storage_service(), snapshot_path, playbooks_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the search index was rebuilt")
+
+    service = make_storage_service()
+    with monkeypatch.context() as patch:
+        patch.setattr(IndexedSearch, "add", fail)
+        patch.setattr(IndexedSearch, "add_many", fail)
+        assert await load_playbooks_with_snapshot(service, snapshot_path, playbooks_dir) == 2
+    results = await service.query_playbooks("sunset")
+    assert [p.metadata.title for p in results] == ["Get Sunset Times"]
+
+    # Writes update the restored index (and, when versioned, both replicas)
+    metadata = PlaybookMetadata(title="Get Moon Phase", description="Moon phase")
+    await service.storage.add_playbook(Playbook(metadata=metadata, content="Moon."))
+    await service.storage.delete_playbook("Get Tides")
+    for _ in range(2):
+        assert [p.metadata.title for p in await service.storage.query("moon")] == ["Get Moon Phase"]
+        assert await service.storage.query("tides") == []
+        # Publish the other replica and check it too
+        await service.storage.add_playbook(Playbook(metadata=metadata, content="Moon."))
@@ -0,0 +1,138 @@
+"""Tests for the SQLite storage provider."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from chuk_mcp_playbook.models.playbook import Playbook, PlaybookMetadata
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+
+
+def make_playbook(title: str, description: str, tags: list[str], content: str) -> Playbook:
+    """Build a playbook for storage tests."""
+    metadata = PlaybookMetadata(title=title, description=description, tags=tags, author="Tester")
+    return Playbook(metadata=metadata, content=content)
+
+
+PLAYBOOKS = [
+    make_playbook(
+        "Get Sunset Times", "Sunset and sunrise times", ["weather", "sunset"], "Use the sun tool."
+    ),
+    make_playbook("Get Weather Forecast", "Daily forecast", ["weather"], "Mentions sunset once."),
+    make_playbook("Convert Time Zones", "Convert between zones", ["time"], "Use the time server."),
+]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_operations(tmp_path):
+    """CRUD, ranking and tag filters work against a file database."""
+    storage = StorageFactory.create(StorageType.SQLITE, path=tmp_path / "playbooks.db")
+    for playbook in PLAYBOOKS:
+        await storage.add_playbook(playbook)
+
+    assert await storage.count() == 3
+    assert await storage.list_all() == sorted(p.metadata.title for p in PLAYBOOKS)
+
+    retrieved = await storage.get_playbook("Get Sunset Times")
+    assert retrieved == PLAYBOOKS[0]
+
+    # Title/tag hits outrank a content-only hit
+    results = await storage.query("How do I get sunset times?", top_k=3)
+    assert [p.metadata.title for p in results][:2] == ["Get Sunset Times", "Get Weather Forecast"]
+
+    results = await storage.query("sunset", tags=["time"])
+    assert results == []
+
+    results = await storage.query(
+        "sunset", top_k=3, tags=["weather", "sunset"], match_all_tags=True
+    )
+    assert [p.metadata.title for p in results] == ["Get Sunset Times"]
+
+    # Upsert replaces the indexed text
+    await storage.add_playbook(
+        make_playbook("Convert Time Zones", "Now about tides", ["marine"], "Tides.")
+    )
+    assert await storage.count() == 3
+    assert [p.metadata.title for p in await storage.query("tides")] == ["Convert Time Zones"]
+
+    assert await storage.delete_playbook("Convert Time Zones")
+    assert not await storage.delete_playbook("Convert Time Zones")
+    assert await storage.query("tides") == []
+
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_persists_across_instances(tmp_path):
+    """A reopened database serves the same playbooks without re-ingesting."""
+    path = tmp_path / "playbooks.db"
+    storage = StorageFactory.create(StorageType.SQLITE, path=path)
+    for playbook in PLAYBOOKS:
+        await storage.add_playbook(playbook)
+    storage.close()
+
+    reopened = StorageFactory.create(
+        StorageType.SQLITE,
+        path=path,
+        search_provider=SearchFactory.create(SearchType.KEYWORD),
+    )
+    assert await reopened.count() == 3
+    results = await reopened.query("forecast", top_k=1)
+    assert [p.metadata.title for p in results] == ["Get Weather Forecast"]
+
+    await reopened.clear()
+    assert await reopened.count() == 0
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bulk_add(tmp_path):
+    """bulk_add upserts the whole batch in one transaction."""
+    storage = StorageFactory.create(StorageType.SQLITE, path=tmp_path / "playbooks.db")
+    await storage.bulk_add(PLAYBOOKS)
+    await storage.bulk_add(
+        [make_playbook("Convert Time Zones", "Zones", ["time"], "Updated content.")]
+    )
+
+    assert await storage.count() == 3
+    assert (await storage.get_playbook("Convert Time Zones")).content == "Updated content."
+    results = await storage.query("updated content")
+    assert [p.metadata.title for p in results] == ["Convert Time Zones"]
+    storage.close()
+
+
+class ThreadRecordingSearch(KeywordSearch):
+    """Keyword search that records the threads it re-ranks on."""
+
+    def __init__(self):
+        super().__init__()
+        self.threads: set[int] = set()
+
+    def search(self, playbooks, query, top_k=3):
+        self.threads.add(threading.get_ident())
+        return super().search(playbooks, query, top_k=top_k)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_rerank_runs_off_the_event_loop(tmp_path):
+    """Re-ranking runs in the reader thread and close() reaches every connection."""
+    search = ThreadRecordingSearch()
+    storage = StorageFactory.create(
+        StorageType.SQLITE, path=tmp_path / "playbooks.db", search_provider=search
+    )
+    await storage.bulk_add(PLAYBOOKS)
+
+    results = await asyncio.gather(*(storage.query("sunset", top_k=1) for _ in range(8)))
+    assert all([p.metadata.title for p in result] == ["Get Sunset Times"] for result in results)
+    assert search.threads and threading.get_ident() not in search.threads
+
+    connections = list(storage._connections)
+    assert len(connections) > 1
+    storage.close()
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,161 @@
+"""Tests for the vectorized keyword search provider."""
+
+import pickle
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType  # noqa: E402
+from chuk_mcp_playbook.search.providers import sharded  # noqa: E402
+from chuk_mcp_playbook.search.providers.keyword import KeywordSearch  # noqa: E402
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType  # noqa: E402
+from tests.test_search import make_playbook  # noqa: E402
+
+WORDS = [
+    "Sunset",
+    "sunrise",
+    "time-zone",
+    "times:",
+    "forecast",
+    "weather",
+    "tide",
+    "Get",
+    "the",
+    "geo/code",
+    "a",
+]
+TAGS = ["weather", "time zone", "marine", "Sun"]
+QUERIES = [
+    "How do I get sunset times?",
+    "sun",
+    "time zone",
+    "zone-less tides",
+    "weather weather forecast",
+    "the a",
+    "code: geo",
+    "nothing matches here",
+    "",
+]
+
+
+def make_corpus(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [
+        make_playbook(
+            f"{' '.join(rng.sample(WORDS, 2))} {i}",
+            " ".join(rng.choices(WORDS, k=4)),
+            rng.sample(TAGS, rng.randint(0, 2)),
+            " ".join(rng.choices(WORDS, k=8)),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "search_type,options",
+    [(SearchType.VECTORIZED, {}), (SearchType.SHARDED, {"workers": 3})],
+)
+@pytest.mark.parametrize("merge_threshold", [0, 15, 10_000])
+@pytest.mark.asyncio
+async def test_vectorized_search_reproduces_keyword_search(search_type, options, merge_threshold):
+    """Scores and order equal a KeywordSearch storage scan, merged or buffered."""
+    provider = SearchFactory.create(
+        search_type, merge_threshold=merge_threshold, merge_ratio=0.0, **options
+    )
+    vectorized = StorageFactory.create(StorageType.MEMORY, search_provider=provider)
+    scan = StorageFactory.create(StorageType.MEMORY, search_provider=KeywordSearch())
+    keyword = KeywordSearch()
+
+    playbooks = make_corpus(200, seed=1)
+    for playbook in playbooks:
+        await vectorized.add_playbook(playbook)
+        await scan.add_playbook(playbook)
+    provider.query_index("warm up")
+
+    # Replacements keep their rank position, removals and re-adds move to the end
+    for playbook in make_corpus(20, seed=2)[::2]:
+        await vectorized.add_playbook(playbook)
+        await scan.add_playbook(playbook)
+    for playbook in playbooks[5:40:3]:
+        await vectorized.delete_playbook(playbook.metadata.title)
+        await scan.delete_playbook(playbook.metadata.title)
+    await vectorized.add_playbook(playbooks[5])
+    await scan.add_playbook(playbooks[5])
+
+    # Scan order of the storage (insertion order, replacements in place)
+    stored = list(scan._playbooks.values())
+    for query in QUERIES:
+        for top_k in (1, 5, 500):
+            expected = [
+                (p.metadata.title, s)
+                for p, s in keyword.search_with_scores(stored, query, top_k=top_k)
+            ]
+            assert provider.query_index(query, top_k=top_k) == expected
+
+        # Tag candidates restrict the scored columns
+        results = await vectorized.query(query, top_k=5, tags=["marine"])
+        expected = await scan.query(query, top_k=5, tags=["marine"])
+        assert [p.metadata.title for p in results] == [p.metadata.title for p in expected]
+
+    batch = provider.query_index_batch(QUERIES, top_k=5)
+    assert batch == [provider.query_index(query, top_k=5) for query in QUERIES]
+
+    await vectorized.clear()
+    assert len(provider) == 0
+    assert provider.query_index("sunset") == []
+
+    if search_type == SearchType.SHARDED:
+        provider.close()
+
+
+def test_sharded_search_pickles_after_merge():
+    """A pickled copy publishes its own segments and returns the same results."""
+    provider = SearchFactory.create(SearchType.SHARDED, workers=2, merge_threshold=0)
+    playbooks = make_corpus(50, seed=3)
+    provider.add_many(playbooks)
+    provider.remove(playbooks[0].metadata.title)
+    expected = provider.query_index_batch(QUERIES, top_k=5)
+
+    copy = pickle.loads(pickle.dumps(provider))
+    try:
+        assert copy.query_index_batch(QUERIES, top_k=5) == expected
+        names = {segment.name for segment in provider._resources.segments if segment}
+        assert names and names.isdisjoint(
+            segment.name for segment in copy._resources.segments if segment
+        )
+    finally:
+        copy.close()
+        provider.close()
+    assert provider not in sharded._OPEN
+
+
+def test_sharded_search_starts_one_pool_for_concurrent_first_queries(monkeypatch):
+    """Readers racing on the first query share a single worker pool."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    pools = []
+
+    class CountingPool(sharded.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(sharded, "ProcessPoolExecutor", CountingPool)
+    provider = SearchFactory.create(SearchType.SHARDED, workers=2, merge_threshold=0)
+    provider.add_many(make_corpus(50, seed=5))
+    barrier = threading.Barrier(8, timeout=5)
+
+    def first_query(query):
+        barrier.wait()
+        return provider.query_index(query, top_k=5)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            results = list(threads.map(first_query, [QUERIES[0]] * 8))
+        assert all(result == results[0] for result in results)
+        assert len(pools) == 1
+    finally:
+        provider.close()
@@ -0,0 +1,246 @@
+"""Tests for copy-on-write versioned storage."""
+
+import asyncio
+import threading
+
+import pytest
+
+from chuk_mcp_playbook.search.factory import SearchFactory, SearchType
+from chuk_mcp_playbook.search.providers.indexed import IndexedSearch
+from chuk_mcp_playbook.storage.content import ContentStore
+from chuk_mcp_playbook.storage.executor import ExecutorMode, QueryExecutor
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.storage.providers import versioned
+from tests.test_search import SAMPLE_PLAYBOOKS, make_playbook
+
+
+class BlockingIndex(IndexedSearch):
+    """Indexed search whose batch indexing blocks until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def add_many(self, playbooks):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        super().add_many(playbooks)
+
+
+def titles(playbooks):
+    return [p.metadata.title for p in playbooks]
+
+
+@pytest.mark.parametrize("search_type", [SearchType.KEYWORD, SearchType.INDEXED])
+@pytest.mark.asyncio
+async def test_versioned_storage_matches_memory_storage(search_type):
+    """Every write publishes a version with the same results as InMemoryStorage."""
+    versioned = StorageFactory.create(
+        StorageType.VERSIONED,
+        search_provider=SearchFactory.create(search_type),
+        index_sections=True,
+    )
+    memory = StorageFactory.create(
+        StorageType.MEMORY, search_provider=SearchFactory.create(search_type), index_sections=True
+    )
+
+    for storage in (versioned, memory):
+        await storage.add_playbook(SAMPLE_PLAYBOOKS[0])
+        await storage.bulk_add(SAMPLE_PLAYBOOKS[1:])
+        await storage.delete_playbook("Get Weather Forecast")
+    assert versioned.version == 3
+
+    for question in ["How do I get sunset times?", "time zones", "weather forecast"]:
+        assert titles(await versioned.query(question)) == titles(await memory.query(question))
+        assert await versioned.query_sections(question) == await memory.query_sections(question)
+    assert await versioned.list_all() == await memory.list_all()
+    assert (await versioned.get_playbook("Get Sunset Times")).metadata.title == "Get Sunset Times"
+    assert not await versioned.delete_playbook("Get Weather Forecast")
+
+    # Both replicas hold the same data after every write
+    for replica in versioned._replicas:
+        assert await replica.list_all() == ["Convert Time Zones", "Get Sunset Times"]
+
+    await versioned.clear()
+    assert await versioned.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_readers_keep_their_version_while_a_write_publishes():
+    """A pinned reader keeps its version; new readers see the published one."""
+    storage = StorageFactory.create(
+        StorageType.VERSIONED, search_provider=SearchFactory.create(SearchType.INDEXED)
+    )
+    await storage.bulk_add(SAMPLE_PLAYBOOKS)
+
+    with storage._snapshot() as pinned:
+        delete = asyncio.create_task(storage.delete_playbook("Get Sunset Times"))
+        while storage.version < 2:
+            await asyncio.sleep(0.01)
+
+        # The write is published, but waits for the pinned reader to replay
+        assert not delete.done()
+        assert await pinned.get_playbook("Get Sunset Times") is not None
+        assert await storage.get_playbook("Get Sunset Times") is None
+
+    assert await delete
+    for replica in storage._replicas:
+        assert await replica.get_playbook("Get Sunset Times") is None
+
+
+@pytest.mark.asyncio
+async def test_queries_are_served_during_bulk_ingestion():
+    """Queries answer from the previous version while a batch is indexed."""
+    # The first write goes to the standby replica, built by search_factory
+    storage = StorageFactory.create(
+        StorageType.VERSIONED, search_provider=IndexedSearch(), search_factory=BlockingIndex
+    )
+    active, standby = storage._replicas
+    ingest = asyncio.create_task(storage.bulk_add(SAMPLE_PLAYBOOKS))
+    while not standby.search_provider.entered.is_set():
+        await asyncio.sleep(0.01)
+
+    # Indexing is blocked on the standby replica; reads do not wait for it
+    assert await storage.query("sunset") == []
+    assert await storage.count() == 0
+
+    standby.search_provider.release.set()
+    await ingest
+    assert titles(await storage.query("sunset", top_k=1)) == ["Get Sunset Times"]
+
+    # A failing write is rolled back on the standby replica and never published
+    def fail(playbooks):
+        raise RuntimeError("index failure")
+
+    active.search_provider.add_many = fail
+    with pytest.raises(RuntimeError):
+        await storage.bulk_add([make_playbook("Broken", "Bad", [], "content")])
+    assert storage.version == 1
+    assert await storage.get_playbook("Broken") is None
+    assert await active.get_playbook("Broken") is None
+
+
+class BarrierIndex(IndexedSearch):
+    """Indexed search whose queries wait until every party is querying."""
+
+    def __init__(self, barrier: threading.Barrier):
+        super().__init__()
+        self.barrier = barrier
+
+    def query_index(self, query, top_k=3, candidates=None):
+        self.barrier.wait()
+        return super().query_index(query, top_k=top_k, candidates=candidates)
+
+
+@pytest.mark.asyncio
+async def test_readers_of_a_version_run_concurrently():
+    """Queries on the published replica do not serialize on a lock."""
+    barrier = threading.Barrier(2, timeout=5)
+    executor = QueryExecutor(mode=ExecutorMode.THREAD)
+    storage = StorageFactory.create(
+        StorageType.VERSIONED,
+        search_provider=BarrierIndex(barrier),
+        search_factory=lambda: BarrierIndex(barrier),
+        executor=executor,
+    )
+    await storage.bulk_add(SAMPLE_PLAYBOOKS)
+
+    try:
+        results = await asyncio.gather(
+            storage.query("sunset", top_k=1), storage.query("weather forecast", top_k=1)
+        )
+        assert [titles(found) for found in results] == [
+            ["Get Sunset Times"],
+            ["Get Weather Forecast"],
+        ]
+    finally:
+        executor.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("search_type", [SearchType.VECTORIZED, SearchType.SHARDED])
+async def test_concurrent_readers_of_a_buffering_index(search_type, monkeypatch):
+    """Providers that buffer writes merge them at write time, never inside a query."""
+    pytest.importorskip("numpy")
+    from chuk_mcp_playbook.search.providers.vectorized import VectorizedKeywordSearch
+
+    options = {"merge_threshold": 2, "merge_ratio": 0.0}
+    if search_type == SearchType.SHARDED:
+        options["workers"] = 2
+    executor = QueryExecutor(mode=ExecutorMode.THREAD)
+    storage = StorageFactory.create(
+        StorageType.VERSIONED,
+        search_provider=SearchFactory.create(search_type, **options),
+        search_factory=lambda: SearchFactory.create(search_type, **options),
+        executor=executor,
+    )
+    playbooks = [
+        make_playbook(f"Playbook {i}", f"Topic{i % 8} guide", ["bulk"], f"Body {i}")
+        for i in range(300)
+    ]
+    await storage.bulk_add(playbooks)
+
+    def merge_in_query(self):
+        raise AssertionError("a query merged buffered writes")
+
+    monkeypatch.setattr(VectorizedKeywordSearch, "_merge", merge_in_query)
+    try:
+        for _ in range(3):
+            results = await asyncio.gather(
+                *(storage.query(f"topic{i} guide", top_k=5) for i in range(8))
+            )
+            for i, found in enumerate(results):
+                assert titles(found) == [f"Playbook {n}" for n in range(i, 40, 8)]
+    finally:
+        executor.close()
+        for replica in storage._replicas:
+            # Sharded search holds worker processes and shared memory
+            close = getattr(replica.search_provider, "close", None)
+            if close is not None:
+                close()
+
+
+@pytest.mark.asyncio
+async def test_content_store_is_compacted_once_readers_leave_the_old_version(monkeypatch):
+    """Replaced and cleared bodies are reclaimed after their readers are done."""
+    monkeypatch.setattr(versioned, "_COMPACT_MIN_BYTES", 0)
+    store = ContentStore()
+    storage = StorageFactory.create(
+        StorageType.VERSIONED,
+        search_provider=SearchFactory.create(SearchType.INDEXED),
+        content_store=store,
+    )
+
+    def revision(number: int):
+        return [
+            make_playbook(p.metadata.title, p.metadata.description, p.metadata.tags, body)
+            for p, body in zip(
+                SAMPLE_PLAYBOOKS, [f"{p.content}\n\nRevision {number}." for p in SAMPLE_PLAYBOOKS]
+            )
+        ]
+
+    try:
+        await storage.bulk_add(revision(0))
+        live = len(store)
+        with storage._snapshot() as pinned:
+            old = await pinned.get_playbook("Get Sunset Times")
+            write = asyncio.create_task(storage.bulk_add(revision(1)))
+            while storage.version < 2:
+                await asyncio.sleep(0.01)
+            # A reader pinned to the old version still resolves its references
+            assert await pinned.get_playbook("Get Sunset Times") == old
+        await write
+        await storage.bulk_add(revision(2))
+
+        # Two of three revisions were garbage: only the live bodies remain
+        assert len(store) == live
+        assert len(store._segments) == 1
+        for replica in storage._replicas:
+            assert (await replica.get_playbook("Get Sunset Times")).content.endswith("Revision 2.")
+        assert titles(await storage.query("sunset", top_k=1)) == ["Get Sunset Times"]
+
+        await storage.clear()
+        assert len(store) == 0
+    finally:
+        store.close()
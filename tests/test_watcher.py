@@ -0,0 +1,119 @@
+"""Tests for the playbook directory watcher."""
+
+import asyncio
+import ctypes
+import errno
+import sys
+
+import pytest
+
+from chuk_mcp_playbook.loader import PlaybookLoader
+from chuk_mcp_playbook.services.playbook_service import PlaybookService
+from chuk_mcp_playbook.storage.factory import StorageFactory, StorageType
+from chuk_mcp_playbook.watcher import PlaybookWatcher, _Inotify
+
+
+async def wait_for_titles(
+    service: PlaybookService, expected: list[str], timeout: float = 5.0
+) -> list[str]:
+    """Poll storage until it lists the expected titles (or time runs out)."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    titles = await service.list_playbooks()
+    while titles != expected and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.05)
+        titles = await service.list_playbooks()
+    return titles
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "use_inotify",
+    [
+        pytest.param(
+            True, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+        ),
+        False,
+    ],
+)
+async def test_watcher_applies_changes(tmp_path, use_inotify):
+    """Adds, edits and deletes on disk show up in storage without a restart."""
+    (tmp_path / "get_tides.md").write_text("# Playbook: Get Tides\n", encoding="utf-8")
+    service = PlaybookService(StorageFactory.create(StorageType.MEMORY))
+    watcher = PlaybookWatcher(
+        PlaybookLoader(service),
+        [tmp_path],
+        debounce=0.05,
+        poll_interval=0.05,
+        use_inotify=use_inotify,
+    )
+    watcher.start()
+    try:
+        assert await wait_for_titles(service, ["Get Tides"]) == ["Get Tides"]
+
+        subdir = tmp_path / "weather"
+        subdir.mkdir()
+        await asyncio.sleep(0.2)
+        (subdir / "get_sunset.md").write_text("# Playbook: Get Sunset\n", encoding="utf-8")
+        assert await wait_for_titles(service, ["Get Sunset", "Get Tides"]) == [
+            "Get Sunset",
+            "Get Tides",
+        ]
+
+        (tmp_path / "get_tides.md").unlink()
+        assert await wait_for_titles(service, ["Get Sunset"]) == ["Get Sunset"]
+    finally:
+        watcher.stop(timeout=5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+@pytest.mark.parametrize("watches_before_failure", [0, 1])
+async def test_watcher_polls_when_inotify_watches_fail(
+    tmp_path, monkeypatch, capsys, watches_before_failure
+):
+    """A failed inotify_add_watch (e.g. ENOSPC) is reported and the watcher polls instead."""
+    init = _Inotify.__init__
+
+    def init_with_limited_watches(self):
+        init(self)
+        add_watch = self._libc.inotify_add_watch
+        calls = []
+
+        def limited_add_watch(fd, path, mask):
+            calls.append(path)
+            if len(calls) > watches_before_failure:
+                ctypes.set_errno(errno.ENOSPC)
+                return -1
+            return add_watch(fd, path, mask)
+
+        self._libc.inotify_add_watch = limited_add_watch
+
+    monkeypatch.setattr(_Inotify, "__init__", init_with_limited_watches)
+
+    service = PlaybookService(StorageFactory.create(StorageType.MEMORY))
+    watcher = PlaybookWatcher(
+        PlaybookLoader(service),
+        [tmp_path],
+        debounce=0.05,
+        poll_interval=0.05,
+        use_inotify=True,
+    )
+    watcher.start()
+    try:
+        subdir = tmp_path / "weather"
+        subdir.mkdir()
+        await asyncio.sleep(0.2)
+        (subdir / "get_sunset.md").write_text("# Playbook: Get Sunset\n", encoding="utf-8")
+        assert await wait_for_titles(service, ["Get Sunset"]) == ["Get Sunset"]
+
+        (tmp_path / "get_tides.md").write_text("# Playbook: Get Tides\n", encoding="utf-8")
+        assert await wait_for_titles(service, ["Get Sunset", "Get Tides"]) == [
+            "Get Sunset",
+            "Get Tides",
+        ]
+    finally:
+        watcher.stop(timeout=5)
+
+    stderr = capsys.readouterr().err
+    assert "inotify watch failed, polling instead" in stderr
+    assert f"[Errno {errno.ENOSPC}]" in stderr